@@ -2,6 +2,10 @@
 ASGI config for CorteSec project.
 
 It exposes the ASGI callable as a module-level variable named ``application``.
+Under this profile the dashboard and the ingresos list use their async
+views (CORTESEC_VISTAS_ASINCRONAS), e.g.:
+
+    uvicorn CorteSec.asgi:application --workers 4
 
 For more information on this file, see
 https://docs.djangoproject.com/en/5.2/howto/deployment/asgi/
@@ -12,5 +16,7 @@ import os
 from django.core.asgi import get_asgi_application
 
 os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'CorteSec.settings')
+# Perfil ASGI: vistas async para el tablero y el listado de ingresos
+os.environ.setdefault('CORTESEC_VISTAS_ASINCRONAS', '1')
 
 application = get_asgi_application()
@@ -0,0 +1,71 @@
+"""
+Perfiles de caché y sesiones para CorteSec.
+
+Caché, con variables de entorno:
+
+    CORTESEC_CACHE=locmem (por defecto) | redis | memcached | dummy
+    CORTESEC_CACHE_URL         redis://host:6379/0 o host:11211 (memcached)
+    CORTESEC_CACHE_TIMEOUT     segundos por defecto de cada entrada (300)
+
+locmem es por proceso: con varios workers cada uno tiene su propia caché y
+las invalidaciones (tablero, usuario autenticado) solo llegan al proceso que
+hizo la escritura. Para más de un worker, redis o memcached.
+
+Sesiones:
+
+    CORTESEC_SESIONES=cache_db (por defecto) | cookies | db
+
+- cache_db: se leen de la caché y se escriben en caché y base; si la caché
+  se pierde, se recuperan de la base.
+- cookies: firmadas en el navegador, sin consultas ni almacenamiento. El
+  cliente puede leer (no modificar) su contenido y cerrar sesión no las
+  invalida en el servidor.
+"""
+import os
+
+BACKENDS_CACHE = {
+    'locmem': 'django.core.cache.backends.locmem.LocMemCache',
+    'redis': 'django.core.cache.backends.redis.RedisCache',  # requiere redis-py
+    'memcached': 'django.core.cache.backends.memcached.PyMemcacheCache',  # requiere pymemcache
+    'dummy': 'django.core.cache.backends.dummy.DummyCache',
+}
+
+MOTORES_SESION = {
+    'cache_db': 'django.contrib.sessions.backends.cached_db',
+    'cookies': 'django.contrib.sessions.backends.signed_cookies',
+    'db': 'django.contrib.sessions.backends.db',
+}
+
+
+def configurar_caches(env=None):
+    """Diccionario para CACHES según el entorno"""
+    env = os.environ if env is None else env
+    tipo = env.get('CORTESEC_CACHE', 'locmem').lower()
+    if tipo not in BACKENDS_CACHE:
+        raise ValueError(
+            f'CORTESEC_CACHE="{tipo}" no es válido; opciones: {", ".join(BACKENDS_CACHE)}'
+        )
+    default = {
+        'BACKEND': BACKENDS_CACHE[tipo],
+        'TIMEOUT': int(env.get('CORTESEC_CACHE_TIMEOUT') or 300),
+        'KEY_PREFIX': 'cortesec',
+    }
+    if tipo == 'locmem':
+        default['LOCATION'] = 'cortesec'
+        default['OPTIONS'] = {'MAX_ENTRIES': 10000}
+    elif tipo == 'redis':
+        default['LOCATION'] = env.get('CORTESEC_CACHE_URL', 'redis://127.0.0.1:6379/0')
+    elif tipo == 'memcached':
+        default['LOCATION'] = env.get('CORTESEC_CACHE_URL', '127.0.0.1:11211')
+    return {'default': default}
+
+
+def configurar_sesiones(env=None):
+    """SESSION_ENGINE según el entorno"""
+    env = os.environ if env is None else env
+    tipo = env.get('CORTESEC_SESIONES', 'cache_db').lower()
+    if tipo not in MOTORES_SESION:
+        raise ValueError(
+            f'CORTESEC_SESIONES="{tipo}" no es válido; opciones: {", ".join(MOTORES_SESION)}'
+        )
+    return MOTORES_SESION[tipo]
@@ -0,0 +1,103 @@
+"""
+Perfiles de base de datos para CorteSec.
+
+El perfil se elige con variables de entorno:
+
+    CORTESEC_DB_ENGINE=sqlite (por defecto) | postgresql
+
+PostgreSQL (multi-worker, producción):
+    CORTESEC_DB_NAME, CORTESEC_DB_USER, CORTESEC_DB_PASSWORD,
+    CORTESEC_DB_HOST, CORTESEC_DB_PORT
+    CORTESEC_DB_CONN_MAX_AGE   segundos de conexión persistente (60)
+    CORTESEC_DB_POOL=1         pool de psycopg 3 (desactiva CONN_MAX_AGE)
+    CORTESEC_DB_POOL_MIN_SIZE, CORTESEC_DB_POOL_MAX_SIZE
+
+SQLite (instalación de un solo nodo):
+    CORTESEC_DB_NAME           ruta del archivo (BASE_DIR/db.sqlite3)
+    CORTESEC_DB_BUSY_TIMEOUT   segundos de espera por el bloqueo (20)
+    CORTESEC_DB_MMAP_SIZE      bytes de mmap (268435456)
+"""
+import os
+
+
+def _entero(env, nombre, defecto):
+    valor = env.get(nombre)
+    return int(valor) if valor not in (None, '') else defecto
+
+
+def _booleano(env, nombre, defecto=False):
+    valor = env.get(nombre)
+    if valor in (None, ''):
+        return defecto
+    return valor.lower() in ('1', 'true', 'yes', 'si', 'on')
+
+
+def configurar_postgresql(env):
+    usar_pool = _booleano(env, 'CORTESEC_DB_POOL')
+    opciones = {}
+    if usar_pool:
+        opciones['pool'] = {
+            'min_size': _entero(env, 'CORTESEC_DB_POOL_MIN_SIZE', 2),
+            'max_size': _entero(env, 'CORTESEC_DB_POOL_MAX_SIZE', 10),
+            'timeout': _entero(env, 'CORTESEC_DB_POOL_TIMEOUT', 10),
+        }
+
+    return {
+        'ENGINE': 'django.db.backends.postgresql',
+        'NAME': env.get('CORTESEC_DB_NAME', 'cortesec'),
+        'USER': env.get('CORTESEC_DB_USER', 'cortesec'),
+        'PASSWORD': env.get('CORTESEC_DB_PASSWORD', ''),
+        'HOST': env.get('CORTESEC_DB_HOST', 'localhost'),
+        'PORT': env.get('CORTESEC_DB_PORT', '5432'),
+        # Django no permite conexiones persistentes junto con el pool
+        'CONN_MAX_AGE': 0 if usar_pool else _entero(env, 'CORTESEC_DB_CONN_MAX_AGE', 60),
+        'CONN_HEALTH_CHECKS': True,
+        'OPTIONS': opciones,
+    }
+
+
+def configurar_sqlite(env, base_dir):
+    return {
+        'ENGINE': 'django.db.backends.sqlite3',
+        'NAME': env.get('CORTESEC_DB_NAME') or base_dir / 'db.sqlite3',
+        'OPTIONS': {
+            'timeout': _entero(env, 'CORTESEC_DB_BUSY_TIMEOUT', 20),
+            # Toma el bloqueo de escritura al iniciar la transacción y evita
+            # los "database is locked" al promover un bloqueo de lectura
+            'transaction_mode': 'IMMEDIATE',
+        },
+    }
+
+
+def configurar_base_datos(base_dir, env=None):
+    """Diccionario para DATABASES['default'] según el entorno"""
+    env = os.environ if env is None else env
+    motor = env.get('CORTESEC_DB_ENGINE', 'sqlite').lower()
+    if motor in ('postgresql', 'postgres'):
+        return configurar_postgresql(env)
+    return configurar_sqlite(env, base_dir)
+
+
+def pragmas_sqlite(env=None):
+    """PRAGMAs aplicados a cada conexión SQLite nueva"""
+    env = os.environ if env is None else env
+    return {
+        'journal_mode': 'WAL',
+        'synchronous': 'NORMAL',
+        'busy_timeout': _entero(env, 'CORTESEC_DB_BUSY_TIMEOUT', 20) * 1000,
+        'mmap_size': _entero(env, 'CORTESEC_DB_MMAP_SIZE', 256 * 1024 * 1024),
+        'temp_store': 'MEMORY',
+        'foreign_keys': 'ON',
+    }
+
+
+def aplicar_pragmas_sqlite(sender, connection, **kwargs):
+    """Receptor de connection_created (conectado en core.apps)"""
+    if connection.vendor != 'sqlite':
+        return
+    from django.conf import settings
+
+    pragmas = getattr(settings, 'SQLITE_PRAGMAS', None) or {}
+    with connection.cursor() as cursor:
+        for nombre, valor in pragmas.items():
+            cursor.execute(f'PRAGMA {nombre} = {valor}')
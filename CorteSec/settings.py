@@ -10,8 +10,13 @@ For the full list of settings and their values, see
 https://docs.djangoproject.com/en/5.2/ref/settings/
 """
 
+import os
+import sys
 from pathlib import Path
 
+from .cache import configurar_caches, configurar_sesiones
+from .database import configurar_base_datos, pragmas_sqlite
+
 # Build paths inside the project like this: BASE_DIR / 'subdir'.
 BASE_DIR = Path(__file__).resolve().parent.parent
 
@@ -46,7 +51,9 @@ INSTALLED_APPS = [
 ]
 
 MIDDLEWARE = [
+    'core.middleware.MetricasMiddleware',  # primero: mide toda la cadena
     'django.middleware.security.SecurityMiddleware',
+    'core.estaticos.ArchivosEstaticosMiddleware',  # solo con SERVIR_ESTATICOS
     'django.contrib.sessions.middleware.SessionMiddleware',
     'django.middleware.common.CommonMiddleware',
     'django.middleware.csrf.CsrfViewMiddleware',
@@ -59,7 +66,9 @@ ROOT_URLCONF = 'CorteSec.urls'
 
 TEMPLATES = [
     {
-        'BACKEND': 'django.template.backends.django.DjangoTemplates',
+        # DjangoTemplates que mide el render para core.middleware.MetricasMiddleware
+        'BACKEND': 'core.plantillas.PlantillasMedidas',
+        'NAME': 'django',
         'DIRS': [BASE_DIR / 'templates'],
         'APP_DIRS': True,
         'OPTIONS': {
@@ -80,13 +89,25 @@ AUTH_USER_MODEL = 'auths.Auth'
 # Database
 # https://docs.djangoproject.com/en/5.2/ref/settings/#databases
 
+# Perfil por variables de entorno (ver CorteSec/database.py):
+# CORTESEC_DB_ENGINE=postgresql para varios workers, SQLite afinado por defecto
 DATABASES = {
-    'default': {
-        'ENGINE': 'django.db.backends.sqlite3',
-        'NAME': BASE_DIR / 'db.sqlite3',
-    }
+    'default': configurar_base_datos(BASE_DIR),
 }
 
+# Aplicados en cada conexión SQLite nueva (WAL, synchronous=NORMAL, mmap...)
+SQLITE_PRAGMAS = pragmas_sqlite()
+
+
+# Caché y sesiones por variables de entorno (ver CorteSec/cache.py):
+# locmem y sesiones cache_db por defecto; CORTESEC_CACHE=redis con varios workers
+CACHES = configurar_caches()
+SESSION_ENGINE = configurar_sesiones()
+
+# El usuario de la sesión sale de la caché (ver auths/backends.py)
+AUTHENTICATION_BACKENDS = ['auths.backends.ModelBackendEnCache']
+CACHE_USUARIOS_TIMEOUT = int(os.environ.get('CORTESEC_CACHE_USUARIOS_TIMEOUT', 300))
+
 
 # Password validation
 # https://docs.djangoproject.com/en/5.2/ref/settings/#auth-password-validators
@@ -140,13 +161,74 @@ STATIC_ROOT = BASE_DIR / 'staticfiles'
 # https://docs.djangoproject.com/en/5.2/ref/settings/#default-auto-field
 
 DEFAULT_AUTO_FIELD = 'django.db.models.BigAutoField'
+
+
+# Métricas por petición (core.middleware.MetricasMiddleware)
+TESTING = sys.argv[1:2] == ['test']
+
+
+def _env_booleano(nombre, defecto):
+    valor = os.environ.get(nombre, '')
+    return valor.lower() in ('1', 'true', 'yes', 'si', 'on') if valor else defecto
+
+
+# Server-Timing y X-Consultas-SQL en las respuestas (no exponer en producción)
+METRICAS_CABECERAS = _env_booleano('CORTESEC_METRICAS_CABECERAS', DEBUG)
+# Exceder el presupuesto de consultas de una vista lanza excepción en vez de
+# solo registrar una advertencia; activo al correr las pruebas
+METRICAS_ESTRICTO = _env_booleano('CORTESEC_METRICAS_ESTRICTO', TESTING)
+
+# Nombres con hash y variantes .gz/.br al correr collectstatic. Requiere
+# haber corrido collectstatic: {% static %} falla sin el manifest
+ESTATICOS_COMPRIMIDOS = _env_booleano('CORTESEC_ESTATICOS_COMPRIMIDOS', not DEBUG and not TESTING)
+# Servir STATIC_ROOT desde Django (sin nginx delante)
+SERVIR_ESTATICOS = _env_booleano('CORTESEC_SERVIR_ESTATICOS', not DEBUG)
+
+# Tablero y listado de ingresos con consultas en paralelo (vistas async).
+# CorteSec/asgi.py lo activa; bajo WSGI cada vista async corre en su propio
+# event loop y no conviene
+VISTAS_ASINCRONAS = _env_booleano('CORTESEC_VISTAS_ASINCRONAS', False)
+
+# Caché de filas de listados ({% filas_en_cache %}): alias de CACHES y
+# duración en segundos. Las claves incluyen el día, así que más de 24 horas
+# no sirve de nada
+CACHE_FILAS = os.environ.get('CORTESEC_CACHE_FILAS', 'default')
+CACHE_FILAS_TIMEOUT = int(os.environ.get('CORTESEC_CACHE_FILAS_TIMEOUT', 24 * 60 * 60))
+
+STORAGES = {
+    'default': {
+        'BACKEND': 'django.core.files.storage.FileSystemStorage',
+    },
+    'staticfiles': {
+        'BACKEND': (
+            'core.estaticos.ManifestComprimidoStorage' if ESTATICOS_COMPRIMIDOS
+            else 'django.contrib.staticfiles.storage.StaticFilesStorage'
+        ),
+    },
+}
+
+LOGGING = {
+    'version': 1,
+    'disable_existing_loggers': False,
+    'handlers': {
+        'console': {'class': 'logging.StreamHandler'},
+    },
+    'loggers': {
+        'cortesec.metricas': {
+            'handlers': ['console'],
+            'level': os.environ.get('CORTESEC_METRICAS_LOG', 'WARNING' if TESTING else 'INFO'),
+            'propagate': False,
+        },
+    },
+}
+
 JAZZMIN_SETTINGS = {
     "site_title": "Panel de Administración",
     "site_header": "CorteSec",
     "site_brand": "CorteSec",
     "welcome_sign": "Bienvenido A CorteSec",
     "copyright": "CorteSec 2025",
-    "show_ui_builder": True,
+    "show_ui_builder": False,  # el constructor de temas carga su propio CSS/JS en cada página
     "theme": "solar",  # Solo define un theme
     "dark_mode_theme": "superhero",
 }
\ No newline at end of file
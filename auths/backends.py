@@ -0,0 +1,64 @@
+# auths/backends.py
+"""
+Backend de autenticación con el usuario de la sesión en caché.
+
+AuthenticationMiddleware carga el usuario en cada petición (un SELECT sobre
+auths_auth). ModelBackendEnCache lo guarda en la caché por id durante
+CACHE_USUARIOS_TIMEOUT segundos, así que lo comparten todas las sesiones
+del usuario.
+
+Guardar o borrar el usuario, o cambiar sus grupos o permisos, borra la
+entrada (auths.signals). Django compara el hash de la contraseña guardado
+en la sesión con el del usuario cargado, de modo que tras un cambio de
+contraseña las otras sesiones caen apenas se invalida la caché. Los
+QuerySet.update() sobre Auth no disparan señales: solo expiran por tiempo.
+"""
+from django.conf import settings
+from django.contrib.auth.backends import ModelBackend
+from django.core.cache import cache
+from django.db import transaction
+
+# Cachés de permisos que ModelBackend deja en la instancia
+_ATRIBUTOS_TEMPORALES = ('_perm_cache', '_user_perm_cache', '_group_perm_cache')
+
+
+def _cache_key(user_id):
+    return f'auths:usuario:{user_id}'
+
+
+def _para_cache(usuario):
+    for atributo in _ATRIBUTOS_TEMPORALES:
+        usuario.__dict__.pop(atributo, None)
+    return usuario
+
+
+def invalidar_usuarios(user_ids):
+    """Borra de la caché los usuarios, ahora y al confirmar la transacción"""
+    keys = [_cache_key(user_id) for user_id in set(user_ids) if user_id is not None]
+    if keys:
+        cache.delete_many(keys)
+        # Otra petición podría volver a cargar la fila anterior antes del commit
+        transaction.on_commit(lambda: cache.delete_many(keys))
+
+
+class ModelBackendEnCache(ModelBackend):
+
+    def get_user(self, user_id):
+        key = _cache_key(user_id)
+        usuario = cache.get(key)
+        if usuario is None:
+            usuario = super().get_user(user_id)
+            if usuario is None:
+                return None
+            cache.set(key, _para_cache(usuario), settings.CACHE_USUARIOS_TIMEOUT)
+        return usuario if self.user_can_authenticate(usuario) else None
+
+    async def aget_user(self, user_id):
+        key = _cache_key(user_id)
+        usuario = await cache.aget(key)
+        if usuario is None:
+            usuario = await super().aget_user(user_id)
+            if usuario is None:
+                return None
+            await cache.aset(key, _para_cache(usuario), settings.CACHE_USUARIOS_TIMEOUT)
+        return usuario if self.user_can_authenticate(usuario) else None
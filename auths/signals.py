@@ -0,0 +1,25 @@
+# auths/signals.py
+from django.db.models.signals import m2m_changed, post_delete, post_save
+from django.dispatch import receiver
+
+from .backends import invalidar_usuarios
+from .models import Auth
+
+
+@receiver(post_save, sender=Auth)
+@receiver(post_delete, sender=Auth)
+def usuario_modificado(sender, instance, **kwargs):
+    # Incluye el cambio de contraseña y update_last_login al iniciar sesión
+    invalidar_usuarios([instance.pk])
+
+
+@receiver(m2m_changed, sender=Auth.groups.through)
+@receiver(m2m_changed, sender=Auth.user_permissions.through)
+def permisos_modificados(sender, instance, action, reverse, pk_set, **kwargs):
+    if not reverse:
+        if action.startswith('post_'):
+            invalidar_usuarios([instance.pk])
+    elif action in ('post_add', 'post_remove'):
+        invalidar_usuarios(pk_set)
+    elif action == 'pre_clear':
+        invalidar_usuarios(instance.user_set.values_list('pk', flat=True))
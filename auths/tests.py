@@ -1,3 +1,42 @@
+# auths/tests.py
+from django.core.cache import cache
+from django.db import connection
 from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
 
-# Create your tests here.
+from finanzas.tests import asignar, crear_proyecto, crear_usuario
+
+
+class UsuarioEnCacheTests(TestCase):
+
+    def setUp(self):
+        cache.clear()
+        self.usuario = crear_usuario()
+        asignar(self.usuario, crear_proyecto(self.usuario))
+        self.client.force_login(self.usuario)
+        self.url = reverse('core:dashboard')
+        self.assertEqual(self.client.get(self.url).status_code, 200)
+
+    def test_sin_consultas_de_sesion_ni_usuario(self):
+        with CaptureQueriesContext(connection) as consultas:
+            response = self.client.get(self.url)
+        self.assertEqual(response.status_code, 200)
+        sql = ' '.join(consulta['sql'] for consulta in consultas.captured_queries)
+        self.assertNotIn('django_session', sql)
+        self.assertNotIn('auths_auth', sql)
+
+    def test_cambio_de_contrasena_cierra_la_sesion(self):
+        self.usuario.set_password('otra-clave-segura-456')
+        self.usuario.save()
+        self.assertEqual(self.client.get(self.url).status_code, 302)
+
+    def test_usuario_desactivado(self):
+        self.usuario.is_active = False
+        self.usuario.save()
+        self.assertEqual(self.client.get(self.url).status_code, 302)
+
+    def test_cambios_del_usuario_se_ven_en_la_siguiente_peticion(self):
+        self.usuario.nombre = 'Renombrado'
+        self.usuario.save()
+        self.assertEqual(self.client.get(self.url).wsgi_request.user.nombre, 'Renombrado')
@@ -1,3 +1,31 @@
+# core/admin.py
 from django.contrib import admin
+from django.core.exceptions import FieldDoesNotExist
+from django.db import models
 
 # Register your models here.
+
+
+class SelectRelatedAutomaticoMixin:
+    """
+    Para ModelAdmin: hace select_related de toda FK que aparezca en
+    list_display, además de las declaradas en list_select_related.
+    Django solo sigue por su cuenta las FK no nulas, así que columnas como
+    `creado_por` o `aprobado_por` generaban una consulta por fila.
+    """
+
+    def get_list_select_related(self, request):
+        declaradas = super().get_list_select_related(request)
+        if declaradas is True:
+            return True
+        relaciones = list(declaradas or [])
+        for nombre in self.get_list_display(request):
+            if not isinstance(nombre, str):
+                continue
+            try:
+                campo = self.model._meta.get_field(nombre)
+            except FieldDoesNotExist:
+                continue
+            if isinstance(campo, models.ForeignKey) and nombre not in relaciones:
+                relaciones.append(nombre)
+        return relaciones
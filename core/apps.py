@@ -1,6 +1,12 @@
 from django.apps import AppConfig
+from django.db.backends.signals import connection_created
 
 
 class CoreConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'core'
+
+    def ready(self):
+        from CorteSec.database import aplicar_pragmas_sqlite
+
+        connection_created.connect(aplicar_pragmas_sqlite, dispatch_uid='cortesec_pragmas_sqlite')
@@ -0,0 +1,51 @@
+# core/asincrono.py
+"""
+Consultas independientes en paralelo desde vistas asíncronas.
+
+El ORM asíncrono de Django (aget, aaggregate, ...) corre cada consulta con
+sync_to_async(thread_sensitive=True): todas en el mismo hilo, una detrás de
+otra, así que un asyncio.gather sobre ellas no gana nada. en_paralelo corre
+cada función en un hilo del pool (thread_sensitive=False), cada uno con su
+propia conexión a la base.
+
+- Dentro de una transacción (atomic(), pruebas con TestCase) las otras
+  conexiones no verían los datos sin confirmar: las funciones se ejecutan
+  en secuencia en el hilo de la transacción.
+- Las consultas de los hilos del pool cuentan en las métricas de la
+  petición (core.middleware).
+- Cada hilo cierra su conexión si ya venció (CONN_MAX_AGE), como al
+  terminar una petición.
+"""
+import asyncio
+
+from asgiref.sync import sync_to_async
+from django.db import close_old_connections, connection
+
+from .middleware import instrumentar
+
+
+def _en_transaccion():
+    return connection.in_atomic_block
+
+
+def _en_hilo_propio(funcion):
+    def envoltura():
+        close_old_connections()
+        # Conectar antes: la inicialización (pragmas de SQLite) no es de la vista
+        connection.ensure_connection()
+        try:
+            with instrumentar(connection):
+                return funcion()
+        finally:
+            close_old_connections()
+    return envoltura
+
+
+async def en_paralelo(*funciones):
+    """Ejecuta las funciones (sin argumentos) y devuelve sus resultados en orden"""
+    if await sync_to_async(_en_transaccion)():
+        return [await sync_to_async(funcion)() for funcion in funciones]
+    return await asyncio.gather(*(
+        sync_to_async(_en_hilo_propio(funcion), thread_sensitive=False)()
+        for funcion in funciones
+    ))
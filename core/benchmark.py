@@ -0,0 +1,342 @@
+# core/benchmark.py
+"""
+Arnés de benchmark: mide las vistas más usadas y los cálculos financieros
+sobre los datos que haya en la base (normalmente los del comando
+generar_datos_sinteticos) y devuelve un reporte serializable a JSON.
+
+- Las vistas se piden con el cliente de pruebas de Django, con la pila
+  completa de middlewares, como un usuario del equipo de proyecto y como
+  superusuario (admin).
+- Cada escenario se ejecuta una vez en frío y luego `repeticiones` veces;
+  se reportan percentiles y las consultas SQL de la última repetición.
+- Los cálculos que escriben (resúmenes, proyecciones) corren dentro de una
+  transacción que se revierte: el benchmark no modifica los datos.
+
+comparar_servidores mide bajo carga concurrente el tablero y el listado de
+ingresos por la pila WSGI (vistas síncronas, un hilo por petición en
+curso) y por la ASGI (vistas async en un event loop, consultas en paralelo
+con core.asincrono).
+"""
+import asyncio
+import statistics
+import threading
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager, nullcontext
+from datetime import timedelta
+
+from django.db import connection, transaction
+from django.db.models import Count
+from django.test import AsyncClient, Client
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from django.utils import timezone
+
+from auths.models import Auth
+from finanzas import tablero
+from finanzas.models import Egreso, Ingreso, Presupuesto, ProyeccionFlujoCaja
+from finanzas.presupuestos import verificar_presupuestos
+from finanzas.proyecciones import agregar_flujos, generar_proyecciones
+from finanzas.resumen import recalcular_resumenes, verificar_resumenes
+from finanzas.tablero import calcular_tablero
+from proyectos.acceso import proyectos_accesibles
+from proyectos.models import Project, ProjectTeam
+
+
+def _ms(segundos):
+    return round(segundos * 1000, 2)
+
+
+def _percentil(valores, p):
+    ordenados = sorted(valores)
+    return ordenados[min(len(ordenados) - 1, int(len(ordenados) * p))]
+
+
+def medir(funcion, repeticiones=10):
+    """
+    Ejecuta `funcion` una vez en frío y `repeticiones` veces más.
+    `funcion` puede devolver un dict con datos extra para el reporte.
+    """
+    inicio = time.perf_counter()
+    funcion()
+    frio = time.perf_counter() - inicio
+
+    tiempos = []
+    extra = {}
+    for _ in range(repeticiones):
+        with CaptureQueriesContext(connection) as consultas:
+            inicio = time.perf_counter()
+            extra = funcion() or {}
+            tiempos.append(time.perf_counter() - inicio)
+
+    return {
+        'frio_ms': _ms(frio),
+        'p50_ms': _ms(_percentil(tiempos, 0.50)),
+        'p95_ms': _ms(_percentil(tiempos, 0.95)),
+        'media_ms': _ms(statistics.fmean(tiempos)),
+        'min_ms': _ms(min(tiempos)),
+        'max_ms': _ms(max(tiempos)),
+        'consultas': len(consultas),
+        **extra,
+    }
+
+
+def _sin_efectos(funcion):
+    """Ejecuta `funcion` en una transacción que se revierte"""
+    def envoltura():
+        with transaction.atomic():
+            resultado = funcion()
+            transaction.set_rollback(True)
+        return resultado
+    return envoltura
+
+
+def _peticion(cliente, url, params=None):
+    def funcion():
+        response = cliente.get(url, params or {})
+        return {'estado': response.status_code, 'bytes': len(response.content)}
+    return funcion
+
+
+def usuario_de_referencia():
+    """Integrante activo con más proyectos: el peor caso para sus listados"""
+    fila = (
+        ProjectTeam.objects.filter(is_active=True)
+        .values('user')
+        .annotate(total=Count('project'))
+        .order_by('-total', 'user')
+        .first()
+    )
+    return Auth.objects.get(pk=fila['user']) if fila else None
+
+
+def escenarios_vistas(usuario, hoy=None):
+    """[(nombre, url, params)] de las vistas del usuario"""
+    hoy = hoy or timezone.now().date()
+    ids = sorted(proyectos_accesibles(usuario))
+    proyecto = str(ids[0]) if ids else ''
+    rango = {
+        'fecha_desde': (hoy - timedelta(days=90)).isoformat(),
+        'fecha_hasta': hoy.isoformat(),
+    }
+    ingresos = reverse('finanzas:lista_ingresos')
+    egresos = reverse('finanzas:lista_egresos')
+    proyectos = reverse('proyectos:project_list')
+    return [
+        ('ingresos', ingresos, {}),
+        ('ingresos_proyecto', ingresos, {'proyecto': proyecto}),
+        ('ingresos_tipo', ingresos, {'tipo_ingreso': 'pago_avance'}),
+        ('ingresos_estado', ingresos, {'estado': 'pendiente'}),
+        ('ingresos_fechas', ingresos, rango),
+        ('ingresos_vencidos', ingresos, {'solo_vencidos': 'on'}),
+        ('ingresos_combinado', ingresos, {'estado': 'pendiente', 'solo_vencidos': 'on', **rango}),
+        ('egresos', egresos, {}),
+        ('egresos_vencidos', egresos, {'solo_vencidos': 'on'}),
+        ('proyectos', proyectos, {}),
+        ('proyectos_orden_recibido', proyectos, {'orden': '-recibido'}),
+        ('proyectos_vencidos', proyectos, {'vencidos': '1'}),
+        ('dashboard', reverse('core:dashboard'), {}),
+    ]
+
+
+def escenarios_admin():
+    return [
+        (f'admin_{modelo._meta.model_name}', reverse(
+            f'admin:{modelo._meta.app_label}_{modelo._meta.model_name}_changelist'
+        ), {})
+        for modelo in (Ingreso, Egreso, Presupuesto, ProyeccionFlujoCaja, Project)
+    ]
+
+
+def escenarios_calculo(usuario):
+    ids = proyectos_accesibles(usuario) if usuario else list(Project.objects.values_list('pk', flat=True))
+    return [
+        ('calcular_tablero', lambda: {'proyectos': calcular_tablero(ids)['proyectos']}),
+        ('proyectos_con_acumulados', lambda: {'filas': len(Project.objects.with_financials())}),
+        ('presupuestos_sobrepasados', lambda: {'filas': Presupuesto.objects.sobrepresupuestados().count()}),
+        ('agregar_flujos', lambda: {'proyectos': len(agregar_flujos())}),
+        ('verificar_resumenes', lambda: {'diferencias': len(verificar_resumenes())}),
+        ('verificar_presupuestos', lambda: {'diferencias': len(verificar_presupuestos())}),
+        ('recalcular_resumenes', _sin_efectos(lambda: {'filas': recalcular_resumenes()})),
+        ('generar_proyecciones', _sin_efectos(lambda: {'filas': generar_proyecciones()})),
+    ]
+
+
+def volumenes():
+    return {
+        modelo._meta.label: modelo.objects.count()
+        for modelo in (Auth, Project, ProjectTeam, Presupuesto, Ingreso, Egreso, ProyeccionFlujoCaja)
+    }
+
+
+def ejecutar_benchmark(repeticiones=10, usuario=None, filtro=None):
+    """
+    Corre todos los escenarios (o los que contengan `filtro` en el nombre)
+    y devuelve el reporte.
+    """
+    usuario = usuario or usuario_de_referencia()
+    sufijo = uuid.uuid4().hex[:8]
+    admin = Auth.objects.create_superuser(
+        nombre='Benchmark',
+        apellido='Admin',
+        username=f'bench-admin-{sufijo}',
+        email=f'bench-admin-{sufijo}@cortesec.local',
+    )
+    resultados = {}
+    try:
+        cliente = Client()
+        cliente_admin = Client()
+        cliente_admin.force_login(admin)
+        escenarios = []
+        if usuario is not None:
+            cliente.force_login(usuario)
+            escenarios += [
+                (nombre, _peticion(cliente, url, params))
+                for nombre, url, params in escenarios_vistas(usuario)
+            ]
+        escenarios += [
+            (nombre, _peticion(cliente_admin, url, params))
+            for nombre, url, params in escenarios_admin()
+        ]
+        escenarios += escenarios_calculo(usuario)
+
+        for nombre, funcion in escenarios:
+            if filtro and filtro not in nombre:
+                continue
+            resultados[nombre] = medir(funcion, repeticiones)
+    finally:
+        admin.delete()
+
+    return {
+        'motor': connection.vendor,
+        'fecha': timezone.now().isoformat(),
+        'repeticiones': repeticiones,
+        'usuario': usuario.username if usuario else None,
+        'proyectos_usuario': len(proyectos_accesibles(usuario)) if usuario else 0,
+        'volumenes': volumenes(),
+        'escenarios': resultados,
+    }
+
+
+# --- WSGI contra ASGI ---
+
+RUTAS_SERVIDORES = {
+    # nombre: (ruta WSGI, ruta ASGI)
+    'dashboard': ('core:dashboard', 'core:dashboard_asincrono'),
+    'ingresos': ('finanzas:lista_ingresos', 'finanzas:lista_ingresos_asincrona'),
+}
+
+
+class _Carga:
+    """Latencias, errores e hilos vivos de una corrida de carga"""
+
+    def __init__(self):
+        self.tiempos = []
+        self.errores = 0
+        self.hilos_max = threading.active_count()
+        self._lock = threading.Lock()
+
+    def registrar(self, segundos, estado):
+        with self._lock:
+            self.tiempos.append(segundos)
+            self.errores += estado != 200
+            self.hilos_max = max(self.hilos_max, threading.active_count())
+
+    def reporte(self, total):
+        return {
+            'peticiones': len(self.tiempos),
+            'errores': self.errores,
+            'p50_ms': _ms(_percentil(self.tiempos, 0.50)),
+            'p99_ms': _ms(_percentil(self.tiempos, 0.99)),
+            'media_ms': _ms(statistics.fmean(self.tiempos)),
+            'max_ms': _ms(max(self.tiempos)),
+            'por_segundo': round(len(self.tiempos) / total, 1),
+            'hilos_max': self.hilos_max,
+        }
+
+
+def _carga_wsgi(url, usuario, peticiones, concurrencia):
+    """`concurrencia` hilos, como los workers de un servidor WSGI con hilos"""
+    carga = _Carga()
+    por_hilo = [peticiones // concurrencia + (i < peticiones % concurrencia) for i in range(concurrencia)]
+
+    # Las sesiones se crean antes: durante la carga solo hay lecturas
+    clientes = [Client() for _ in range(concurrencia)]
+    for cliente in clientes:
+        cliente.force_login(usuario)
+
+    def trabajador(cliente, cantidad):
+        try:
+            for _ in range(cantidad):
+                inicio = time.perf_counter()
+                estado = cliente.get(url).status_code
+                carga.registrar(time.perf_counter() - inicio, estado)
+        finally:
+            connection.close()
+
+    inicio = time.perf_counter()
+    with ThreadPoolExecutor(concurrencia) as executor:
+        list(executor.map(trabajador, clientes, por_hilo))
+    return carga.reporte(time.perf_counter() - inicio)
+
+
+async def _carga_asgi(url, usuario, peticiones, concurrencia):
+    """`concurrencia` peticiones en curso sobre un solo event loop"""
+    carga = _Carga()
+    cliente = AsyncClient()
+    await cliente.aforce_login(usuario)
+    cola = asyncio.Queue()
+    for _ in range(peticiones):
+        cola.put_nowait(None)
+
+    async def trabajador():
+        while not cola.empty():
+            cola.get_nowait()
+            inicio = time.perf_counter()
+            estado = (await cliente.get(url)).status_code
+            carga.registrar(time.perf_counter() - inicio, estado)
+
+    inicio = time.perf_counter()
+    await asyncio.gather(*(trabajador() for _ in range(concurrencia)))
+    return carga.reporte(time.perf_counter() - inicio)
+
+
+@contextmanager
+def _sin_cache_del_tablero():
+    """Con timeout 0 el tablero no se guarda: cada petición lo calcula"""
+    original = tablero.CACHE_TIMEOUT
+    tablero.CACHE_TIMEOUT = 0
+    try:
+        yield
+    finally:
+        tablero.CACHE_TIMEOUT = original
+
+
+def comparar_servidores(usuario=None, peticiones=200, concurrencia=8, con_cache=False):
+    """
+    Mismas peticiones por WSGI y por ASGI, con `concurrencia` en curso.
+    Sin `con_cache` el tablero se calcula en cada petición: se mide el
+    cálculo y no la lectura de la caché.
+    """
+    usuario = usuario or usuario_de_referencia()
+    if usuario is None:
+        raise ValueError('No hay integrantes de proyectos para el benchmark')
+
+    resultados = {}
+    with nullcontext() if con_cache else _sin_cache_del_tablero():
+        for nombre, (ruta_wsgi, ruta_asgi) in RUTAS_SERVIDORES.items():
+            resultados[nombre] = {
+                'wsgi': _carga_wsgi(reverse(ruta_wsgi), usuario, peticiones, concurrencia),
+                'asgi': asyncio.run(_carga_asgi(reverse(ruta_asgi), usuario, peticiones, concurrencia)),
+            }
+
+    return {
+        'motor': connection.vendor,
+        'fecha': timezone.now().isoformat(),
+        'usuario': usuario.username,
+        'peticiones': peticiones,
+        'concurrencia': concurrencia,
+        'cache_tablero': con_cache,
+        'escenarios': resultados,
+    }
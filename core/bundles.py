@@ -0,0 +1,349 @@
+# core/bundles.py
+"""
+Bundles de CSS/JS por layout (ver comando construir_bundles).
+
+Para cada layout se concatenan los archivos que usa, tomados de los
+estáticos instalados (los mismos vendor que trae Jazzmin para el admin, más
+los que Jazzmin no trae, en static/vendor/), y se escriben en static/bundles/:
+
+    <nombre>.css          CSS completo, podado y minificado
+    <nombre>.critico.css  solo lo que usa el layout mismo; va en línea en <head>
+    <nombre>.js           JS concatenado (las fuentes ya vienen minificadas)
+
+Poda: se conservan las reglas cuyos selectores usan solo clases e ids que
+aparecen en las plantillas, el código Python y el JS de nuestras apps. Una
+clase armada en la plantilla (badge-{{ color }}, badge-{}) conserva todo el
+prefijo. Las clases que agrega el JS de Bootstrap/AdminLTE en tiempo de
+ejecución están en SIEMPRE / PREFIJOS_SIEMPRE.
+
+Los bundles se versionan en el repositorio; collectstatic les agrega el hash
+(ver core.estaticos) y la prueba de core verifica que estén al día.
+
+El admin de Jazzmin no se empaqueta: sus estáticos ya son locales y
+agruparlos exigiría mantener una copia de su admin/base.html.
+"""
+import posixpath
+import re
+from functools import lru_cache
+from pathlib import Path
+
+from django.apps import apps
+from django.conf import settings
+from django.contrib.staticfiles import finders
+
+BUNDLES = {
+    'dashboard': {
+        'plantilla': 'core/templates/core/base_dashboard.html',
+        'css': [
+            'vendor/adminlte/css/adminlte.min.css',
+            'vendor/fontawesome-free/css/all.min.css',
+        ],
+        'js': [
+            'admin/js/vendor/jquery/jquery.min.js',
+            # Jazzmin trae bootstrap.min.js sin Popper (dropdowns, tooltips,
+            # popovers), que Bootstrap toma del global al evaluarse: va antes.
+            # Popper.js 1.16.1, dist/umd (static/vendor/popper/)
+            'vendor/popper/umd/popper.min.js',
+            'vendor/bootstrap/js/bootstrap.min.js',
+            'vendor/adminlte/js/adminlte.min.js',
+        ],
+    },
+}
+
+DIRECTORIO = 'bundles'
+
+# Clases que Bootstrap y AdminLTE agregan desde JS
+SIEMPRE = {
+    'show', 'showing', 'fade', 'collapse', 'collapsing', 'active', 'disabled',
+    'hold-transition', 'menu-open', 'menu-is-opening', 'modal-open', 'modal-backdrop',
+    'dropdown-menu-right', 'was-validated', 'is-invalid', 'is-valid',
+}
+PREFIJOS_SIEMPRE = ('sidebar-', 'control-sidebar', 'layout-', 'tooltip', 'bs-tooltip', 'popover', 'bs-popover')
+
+EXTENSIONES_FUENTE = {'.html', '.py', '.js', '.txt'}
+
+_TOKEN = re.compile(r'[A-Za-z0-9_-]+')
+_PREFIJO = re.compile(r'([A-Za-z0-9_-]+-)(?=\{)')
+_ETIQUETA_HTML = re.compile(r'<([a-zA-Z][a-zA-Z0-9]*)')
+
+_CADENA = re.compile(r'"(?:\\.|[^"\\])*"|\'(?:\\.|[^\'\\])*\'', re.S)
+_COMENTARIO_O_CADENA = re.compile(r'/\*.*?\*/|' + _CADENA.pattern, re.S)
+_ESPECIAL = re.compile(r'[{};"\']')
+_LLAVE = re.compile(r'[{}"\']')
+_URL = re.compile(r'url\(\s*(["\']?)([^)"\']+)\1\s*\)')
+_MAPA_FUENTE = re.compile(r'^\s*//[#@] sourceMappingURL=.*$', re.M)
+
+_NEGACION = re.compile(r':not\([^()]*\)')
+_ATRIBUTO = re.compile(r'\[[^\]]*\]')
+_CLASE = re.compile(r'\.((?:[_a-zA-Z-]|\\.)(?:[\w-]|\\.)*)')
+_ID = re.compile(r'#((?:[\w-]|\\.)+)')
+_ETIQUETA = re.compile(r'(?:^|[\s>+~(,])([a-zA-Z][a-zA-Z0-9]*)(?![\w-])')
+_PSEUDO = re.compile(r'::?[\w-]+(?:\([^()]*\))?')
+
+AGRUPADORES = {'media', 'supports', 'document', '-moz-document', 'layer', 'container'}
+
+
+# --- Vocabulario usado ---
+
+class Vocabulario:
+    """Clases/ids usados por un conjunto de fuentes"""
+
+    def __init__(self, textos, etiquetas=None, siempre=True):
+        self.tokens = set()
+        self.prefijos = set(PREFIJOS_SIEMPRE) if siempre else set()
+        if siempre:
+            self.tokens |= SIEMPRE
+        for texto in textos:
+            self.tokens.update(_TOKEN.findall(texto))
+            self.prefijos.update(_PREFIJO.findall(texto))
+        # None: no se filtra por etiqueta HTML (bundle completo)
+        self.etiquetas = etiquetas
+        self._prefijos = tuple(sorted(self.prefijos))
+        self.usa = lru_cache(maxsize=None)(self._usa)
+
+    def _usa(self, nombre):
+        return nombre in self.tokens or nombre.startswith(self._prefijos)
+
+
+def fuentes_del_proyecto():
+    """Plantillas, Python y JS de las apps del proyecto (no los vendor de terceros ni las pruebas)"""
+    base = Path(settings.BASE_DIR).resolve()
+    raices = [
+        Path(config.path).resolve() for config in apps.get_app_configs()
+        if Path(config.path).resolve().is_relative_to(base)
+    ]
+    raices += [Path(directorio).resolve() for directorio in settings.STATICFILES_DIRS]
+    for raiz in raices:
+        for ruta in sorted(raiz.rglob('*')):
+            if (
+                ruta.suffix in EXTENSIONES_FUENTE
+                and ruta.is_file()
+                and 'migrations' not in ruta.parts
+                and not ruta.name.startswith('tests')
+                and DIRECTORIO not in ruta.parts
+                and 'vendor' not in ruta.parts
+            ):
+                yield ruta
+
+
+def vocabulario_del_proyecto():
+    return Vocabulario(ruta.read_text(encoding='utf-8', errors='ignore') for ruta in fuentes_del_proyecto())
+
+
+def vocabulario_del_layout(plantilla):
+    texto = (Path(settings.BASE_DIR) / plantilla).read_text(encoding='utf-8')
+    etiquetas = {etiqueta.lower() for etiqueta in _ETIQUETA_HTML.findall(texto)} | {'html', 'body'}
+    return Vocabulario([texto], etiquetas=etiquetas, siempre=False)
+
+
+# --- CSS ---
+
+def quitar_comentarios(css):
+    """(css sin comentarios, [comentarios /*! de licencia])"""
+    licencias = []
+
+    def reemplazo(m):
+        texto = m.group()
+        if texto.startswith('/*'):
+            if texto.startswith('/*!'):
+                licencias.append(texto)
+            return ''
+        return texto
+
+    return _COMENTARIO_O_CADENA.sub(reemplazo, css), licencias
+
+
+def _fin_de_cadena(css, inicio):
+    m = _CADENA.match(css, inicio)
+    return m.end() if m else len(css)
+
+
+def _cierre(css, i):
+    nivel = 1
+    while True:
+        m = _LLAVE.search(css, i)
+        if m is None:
+            return len(css)
+        if m.group() in '"\'':
+            i = _fin_de_cadena(css, m.start())
+            continue
+        nivel += 1 if m.group() == '{' else -1
+        if nivel == 0:
+            return m.start()
+        i = m.end()
+
+
+def parsear(css):
+    """[(preludio, cuerpo)]; cuerpo es None en at-rules sin bloque (@import ...;)"""
+    nodos = []
+    i = inicio = 0
+    while True:
+        m = _ESPECIAL.search(css, i)
+        if m is None:
+            return nodos
+        caracter = m.group()
+        if caracter in '"\'':
+            i = _fin_de_cadena(css, m.start())
+        elif caracter == '{':
+            fin = _cierre(css, m.end())
+            nodos.append((css[inicio:m.start()].strip(), css[m.end():fin]))
+            i = inicio = fin + 1
+        else:
+            if caracter == ';' and css[inicio:m.start()].strip():
+                nodos.append((css[inicio:m.start()].strip(), None))
+            i = inicio = m.end()
+
+
+def _separar_selectores(preludio):
+    selectores, nivel, inicio = [], 0, 0
+    for i, caracter in enumerate(preludio):
+        if caracter in '([':
+            nivel += 1
+        elif caracter in ')]':
+            nivel -= 1
+        elif caracter == ',' and nivel == 0:
+            selectores.append(preludio[inicio:i].strip())
+            inicio = i + 1
+    selectores.append(preludio[inicio:].strip())
+    return [selector for selector in selectores if selector]
+
+
+def selector_usado(selector, vocabulario):
+    selector = _ATRIBUTO.sub('', _NEGACION.sub('', selector))
+    for nombre in _CLASE.findall(selector) + _ID.findall(selector):
+        if not vocabulario.usa(nombre.replace('\\', '')):
+            return False
+    if vocabulario.etiquetas is not None:
+        for etiqueta in _ETIQUETA.findall(_PSEUDO.sub('', selector)):
+            if etiqueta.lower() not in vocabulario.etiquetas:
+                return False
+    return True
+
+
+def _nombre_at_rule(preludio):
+    return re.split(r'[\s(]', preludio[1:], maxsplit=1)[0].lower()
+
+
+def podar(nodos, vocabulario):
+    """Quita las reglas y selectores que no usa `vocabulario`"""
+    resultado = []
+    for preludio, cuerpo in nodos:
+        if cuerpo is None:
+            if not preludio.lower().startswith('@charset'):
+                resultado.append((preludio, None))
+        elif preludio.startswith('@'):
+            if _nombre_at_rule(preludio) in AGRUPADORES:
+                hijos = podar(parsear(cuerpo), vocabulario)
+                if hijos:
+                    resultado.append((preludio, hijos))
+            else:
+                resultado.append((preludio, cuerpo))
+        else:
+            selectores = [s for s in _separar_selectores(preludio) if selector_usado(s, vocabulario)]
+            if selectores:
+                resultado.append((','.join(selectores), cuerpo))
+    return _podar_keyframes(resultado)
+
+
+def _declaraciones(nodos):
+    for preludio, cuerpo in nodos:
+        if isinstance(cuerpo, list):
+            yield from _declaraciones(cuerpo)
+        elif cuerpo is not None and not preludio.startswith('@'):
+            yield cuerpo
+
+
+def _podar_keyframes(nodos):
+    animaciones = set()
+    for cuerpo in _declaraciones(nodos):
+        for valor in re.findall(r'animation(?:-name)?\s*:([^;}]+)', cuerpo):
+            animaciones.update(_TOKEN.findall(valor))
+    return [
+        (preludio, cuerpo) for preludio, cuerpo in nodos
+        if not (preludio.startswith('@') and _nombre_at_rule(preludio).endswith('keyframes'))
+        or preludio.split()[-1] in animaciones
+    ]
+
+
+def minificar(texto):
+    """Espacios mínimos fuera de las cadenas"""
+    partes = []
+    inicio = 0
+    for m in _CADENA.finditer(texto):
+        partes.append(_minificar_fragmento(texto[inicio:m.start()]))
+        partes.append(m.group())
+        inicio = m.end()
+    partes.append(_minificar_fragmento(texto[inicio:]))
+    return ''.join(partes).strip()
+
+
+def _minificar_fragmento(texto):
+    texto = re.sub(r'\s+', ' ', texto)
+    texto = re.sub(r'\s*([{};,>])\s*', r'\1', texto)
+    return re.sub(r':\s+', ':', texto).replace(';}', '}')
+
+
+def serializar(nodos):
+    salida = []
+    for preludio, cuerpo in nodos:
+        if cuerpo is None:
+            salida.append(minificar(preludio) + ';')
+        elif isinstance(cuerpo, list):
+            salida.append(f'{minificar(preludio)}{{{serializar(cuerpo)}}}')
+        else:
+            salida.append(f'{minificar(preludio)}{{{minificar(cuerpo).rstrip(";")}}}')
+    return ''.join(salida)
+
+
+def reubicar_urls(css, origen, destino=DIRECTORIO):
+    """Reescribe los url() relativos de `origen` para que funcionen desde `destino`"""
+    carpeta = posixpath.dirname(origen)
+
+    def reemplazo(m):
+        url = m.group(2).strip()
+        if re.match(r'^(?:[a-z]+:|/|#)', url, re.I):
+            return m.group()
+        ruta, separador, resto = url.partition('?') if '?' in url else url.partition('#')
+        absoluta = posixpath.normpath(posixpath.join(carpeta, ruta))
+        return f'url("{posixpath.relpath(absoluta, destino)}{separador}{resto}")'
+
+    return _URL.sub(reemplazo, css)
+
+
+def leer_estatico(ruta):
+    encontrado = finders.find(ruta)
+    if encontrado is None:
+        raise FileNotFoundError(f'No se encontró el estático "{ruta}"')
+    return Path(encontrado).read_text(encoding='utf-8')
+
+
+def construir_css(rutas, vocabulario, licencias=True):
+    comentarios_licencia, nodos = [], []
+    for ruta in rutas:
+        css, comentarios = quitar_comentarios(reubicar_urls(leer_estatico(ruta), ruta))
+        comentarios_licencia += comentarios
+        nodos += parsear(css)
+    cabecera = ''.join(f'{licencia}\n' for licencia in comentarios_licencia) if licencias else ''
+
+    return cabecera + serializar(podar(nodos, vocabulario)) + '\n'
+
+
+def construir_js(rutas):
+    return '\n;\n'.join(_MAPA_FUENTE.sub('', leer_estatico(ruta)).strip() for ruta in rutas) + '\n'
+
+
+def construir(nombre, vocabulario=None):
+    """{archivo: contenido} de un bundle"""
+    definicion = BUNDLES[nombre]
+    vocabulario = vocabulario or vocabulario_del_proyecto()
+    critico = vocabulario_del_layout(definicion['plantilla'])
+    return {
+        f'{nombre}.css': construir_css(definicion['css'], vocabulario),
+        # En línea en cada página: las licencias ya van en el bundle completo
+        f'{nombre}.critico.css': construir_css(definicion['css'], critico, licencias=False),
+        f'{nombre}.js': construir_js(definicion['js']),
+    }
+
+
+def directorio_de_salida():
+    return Path(settings.STATICFILES_DIRS[0]) / DIRECTORIO
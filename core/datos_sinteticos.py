@@ -0,0 +1,279 @@
+# core/datos_sinteticos.py
+"""
+Generador de datos sintéticos con volúmenes y distribuciones parecidas a las
+de producción, para medir rendimiento (ver comandos generar_datos_sinteticos
+y benchmark).
+
+- Montos log-normales: muchos contratos medianos y pocos muy grandes.
+- Movimientos repartidos entre proyectos con pesos de Pareto: unos pocos
+  proyectos concentran la mayoría de ingresos y egresos.
+- Estados según la fecha: lo que ya venció está casi todo recibido/pagado,
+  con una fracción pendiente (vencidos); lo futuro sigue abierto.
+
+Todo se inserta con bulk_create en lotes. bulk_create no dispara señales,
+así que al final se recalculan las tablas derivadas: abonos de apertura,
+resumen financiero, consumo de presupuestos y proyecciones de flujo de caja.
+
+La misma semilla produce los mismos datos (salvo las fechas, relativas a hoy).
+"""
+import random
+from datetime import timedelta
+from decimal import Decimal
+
+from django.contrib.auth.hashers import make_password
+from django.db import transaction
+from django.utils import timezone
+
+from auths.models import Auth
+from finanzas.models import Egreso, Ingreso, Presupuesto
+from finanzas.pagos import registrar_abonos_de_apertura
+from finanzas.presupuestos import reconciliar_presupuestos
+from finanzas.proyecciones import generar_proyecciones
+from finanzas.resumen import recalcular_resumenes
+from proyectos.models import Project, ProjectTeam
+
+ESTADOS_PROYECTO = {
+    'active': 60,
+    'planning': 10,
+    'on_hold': 8,
+    'completed': 17,
+    'cancelled': 5,
+}
+
+# (estado, peso) según si la fecha límite ya pasó
+ESTADOS_MOVIMIENTO_PASADO = {
+    Ingreso: {'recibido': 72, 'parcial': 8, 'pendiente': 15, 'cancelado': 5},
+    Egreso: {'pagado': 75, 'parcial': 7, 'pendiente': 13, 'cancelado': 5},
+}
+ESTADOS_MOVIMIENTO_FUTURO = {
+    Ingreso: {'pendiente': 80, 'parcial': 8, 'recibido': 7, 'cancelado': 5},
+    Egreso: {'pendiente': 78, 'parcial': 8, 'pagado': 9, 'cancelado': 5},
+}
+
+# Reparto típico del presupuesto de obra entre categorías
+PESOS_CATEGORIA = {
+    'materiales': 35,
+    'mano_obra': 25,
+    'subcontratos': 15,
+    'equipo': 10,
+    'administrativos': 5,
+    'indirectos': 5,
+    'contingencia': 3,
+    'otros': 2,
+}
+
+PROVEEDORES = [
+    'Cementos del Valle', 'Ferretería La Central', 'Aceros Andinos', 'Concretos Express',
+    'Maderas El Roble', 'Transportes Rápidos', 'Alquiler de Equipos S.A.S.',
+    'Eléctricos Unidos', 'Hidráulicos del Norte', 'Consultores Asociados',
+]
+
+MONTO_MAXIMO = Decimal('9999999999999.00')  # max_digits=15, decimal_places=2
+
+
+def _pesos(rng, opciones):
+    return rng.choices(list(opciones), weights=list(opciones.values()))[0]
+
+
+def _monto(valor):
+    return min(Decimal(str(round(max(valor, 1000), -3))).quantize(Decimal('0.01')), MONTO_MAXIMO)
+
+
+def _fecha_en(rng, desde, hasta):
+    return desde + timedelta(days=rng.randint(0, max(0, (hasta - desde).days)))
+
+
+def _usuarios(rng, cantidad, prefijo, password):
+    clave = make_password(password)  # un solo hash: PBKDF2 por usuario tardaría minutos
+    return Auth.objects.bulk_create([
+        Auth(
+            nombre=f'Usuario {i}',
+            apellido=prefijo,
+            username=f'{prefijo.lower()}-u{i:05d}',
+            email=f'{prefijo.lower()}-u{i:05d}@cortesec.local',
+            password=clave,
+        )
+        for i in range(cantidad)
+    ])
+
+
+def _proyectos(rng, cantidad, prefijo, usuarios, hoy):
+    proyectos = []
+    for i in range(cantidad):
+        inicio = hoy - timedelta(days=rng.randint(0, 730))
+        fin = inicio + timedelta(days=rng.randint(90, 720))
+        contrato = _monto(rng.lognormvariate(20.5, 0.8))  # mediana ≈ 800 millones
+        estado = _pesos(rng, ESTADOS_PROYECTO)
+        transcurrido = (hoy - inicio).days / max(1, (fin - inicio).days)
+        progreso = 100 if estado == 'completed' else min(99, max(0, round(transcurrido * 100)))
+        proyectos.append(Project(
+            name=f'Obra sintética {i}',
+            code=f'{prefijo}-{i:05d}',
+            client_name=f'Cliente {rng.randint(1, max(1, cantidad // 3))}',
+            location='Sintético',
+            start_date=inicio,
+            end_date=fin,
+            contract_amount=contrato,
+            contract_type=rng.choice([clave for clave, _ in Project.CONTRACT_TYPE]),
+            budget=_monto(contrato * Decimal(str(rng.uniform(0.8, 0.95)))),
+            status=estado,
+            progress=progreso,
+            project_manager=rng.choice(usuarios),
+            created_by=rng.choice(usuarios),
+        ))
+    return Project.objects.bulk_create(proyectos)
+
+
+def _equipos(rng, proyectos, usuarios, miembros):
+    roles = [clave for clave, _ in ProjectTeam.ROLE_CHOICES if clave != 'manager']
+    equipos = []
+    for proyecto in proyectos:
+        integrantes = rng.sample(usuarios, min(miembros, len(usuarios)))
+        for posicion, usuario in enumerate(integrantes):
+            rol = 'manager' if posicion == 0 else rng.choice(roles)
+            equipos.append(ProjectTeam(
+                project=proyecto,
+                user=usuario,
+                role=rol,
+                start_date=proyecto.start_date,
+                is_active=rng.random() < 0.95,
+                can_approve_payments=rol in ('manager', 'accountant'),
+                can_view_financials=rol in ('manager', 'accountant', 'supervisor'),
+            ))
+    return ProjectTeam.objects.bulk_create(equipos)
+
+
+def _presupuestos(rng, proyectos, usuarios, por_proyecto):
+    presupuestos = []
+    for proyecto in proyectos:
+        categorias = rng.sample(list(PESOS_CATEGORIA), min(por_proyecto, len(PESOS_CATEGORIA)))
+        total = sum(PESOS_CATEGORIA[c] for c in categorias)
+        for categoria in categorias:
+            participacion = PESOS_CATEGORIA[categoria] / total * rng.uniform(0.85, 1.15)
+            presupuestos.append(Presupuesto(
+                proyecto=proyecto,
+                categoria=categoria,
+                monto_planeado=_monto(float(proyecto.budget) * participacion),
+                periodo_inicio=proyecto.start_date,
+                periodo_fin=proyecto.end_date,
+                creado_por=rng.choice(usuarios),
+            ))
+    return Presupuesto.objects.bulk_create(presupuestos)
+
+
+def _estado_movimiento(rng, modelo, limite, hoy):
+    estados = ESTADOS_MOVIMIENTO_PASADO if limite < hoy else ESTADOS_MOVIMIENTO_FUTURO
+    return _pesos(rng, estados[modelo])
+
+
+def _ingresos(rng, proyectos, pesos, usuarios, cantidad, hoy):
+    tipos = [clave for clave, _ in Ingreso.TIPO_INGRESO]
+    metodos = [clave for clave, _ in Ingreso.METODO_PAGO]
+    ingresos = []
+    for i, proyecto in enumerate(rng.choices(proyectos, weights=pesos, k=cantidad)):
+        fecha = _fecha_en(rng, proyecto.start_date, proyecto.end_date)
+        estado = _estado_movimiento(rng, Ingreso, fecha, hoy)
+        total = _monto(float(proyecto.contract_amount) / 12 * rng.lognormvariate(0, 0.6))
+        if estado == 'recibido':
+            recibido = total
+        elif estado == 'parcial':
+            recibido = _monto(float(total) * rng.uniform(0.1, 0.9))
+        else:
+            recibido = Decimal('0.00')
+        cobrado = estado in ('recibido', 'parcial')
+        ingresos.append(Ingreso(
+            proyecto=proyecto,
+            concepto=f'Cobro sintético {i}',
+            tipo_ingreso=rng.choice(tipos),
+            monto_total=total,
+            monto_recibido=recibido,
+            fecha_esperada=fecha,
+            fecha_recepcion=min(hoy, fecha + timedelta(days=rng.randint(-5, 20))) if cobrado else None,
+            estado=estado,
+            metodo_pago=rng.choice(metodos) if cobrado else None,
+            creado_por=rng.choice(usuarios),
+        ))
+    return ingresos
+
+
+def _egresos(rng, proyectos, pesos, presupuestos_por_proyecto, usuarios, cantidad, hoy):
+    tipos = [clave for clave, _ in Egreso.TIPO_EGRESO]
+    metodos = [clave for clave, _ in Egreso.METODO_PAGO]
+    egresos = []
+    for i, proyecto in enumerate(rng.choices(proyectos, weights=pesos, k=cantidad)):
+        emision = _fecha_en(rng, proyecto.start_date, proyecto.end_date)
+        vencimiento = emision + timedelta(days=rng.choice([0, 15, 30, 30, 45, 60]))
+        estado = _estado_movimiento(rng, Egreso, vencimiento, hoy)
+        total = _monto(float(proyecto.budget) / 40 * rng.lognormvariate(0, 0.9))
+        if estado == 'pagado':
+            pagado = total
+        elif estado == 'parcial':
+            pagado = _monto(float(total) * rng.uniform(0.1, 0.9))
+        else:
+            pagado = Decimal('0.00')
+        presupuestos = presupuestos_por_proyecto.get(proyecto.pk)
+        egresos.append(Egreso(
+            proyecto=proyecto,
+            presupuesto=rng.choice(presupuestos) if presupuestos and rng.random() < 0.85 else None,
+            concepto=f'Gasto sintético {i}',
+            tipo_egreso=rng.choice(tipos),
+            proveedor=rng.choice(PROVEEDORES),
+            monto_total=total,
+            monto_pagado=pagado,
+            fecha_emision=emision,
+            fecha_vencimiento=vencimiento,
+            fecha_pago=min(hoy, vencimiento) if estado == 'pagado' else None,
+            estado=estado,
+            metodo_pago=rng.choice(metodos) if pagado else None,
+            creado_por=rng.choice(usuarios),
+        ))
+    return egresos
+
+
+def generar_datos(usuarios=50, proyectos=20, miembros=5, presupuestos=6, ingresos=2000,
+                  egresos=4000, semilla=0, prefijo='SIN', password='sintetico',
+                  batch_size=1000, hoy=None):
+    """
+    Inserta un conjunto de datos sintético y devuelve los conteos por tabla.
+    `miembros` y `presupuestos` son por proyecto; `ingresos` y `egresos`, totales.
+    """
+    rng = random.Random(semilla)
+    hoy = hoy or timezone.now().date()
+
+    with transaction.atomic():
+        lista_usuarios = _usuarios(rng, usuarios, prefijo, password)
+        lista_proyectos = _proyectos(rng, proyectos, prefijo, lista_usuarios, hoy)
+        equipos = _equipos(rng, lista_proyectos, lista_usuarios, miembros)
+        lista_presupuestos = _presupuestos(rng, lista_proyectos, lista_usuarios, presupuestos)
+
+        presupuestos_por_proyecto = {}
+        for presupuesto in lista_presupuestos:
+            presupuestos_por_proyecto.setdefault(presupuesto.proyecto_id, []).append(presupuesto)
+        pesos = [rng.paretovariate(1.5) for _ in lista_proyectos]
+
+        lista_ingresos = _ingresos(rng, lista_proyectos, pesos, lista_usuarios, ingresos, hoy)
+        Ingreso.objects.bulk_create(lista_ingresos, batch_size=batch_size)
+        lista_egresos = _egresos(
+            rng, lista_proyectos, pesos, presupuestos_por_proyecto, lista_usuarios, egresos, hoy,
+        )
+        Egreso.objects.bulk_create(lista_egresos, batch_size=batch_size)
+        abonos = (
+            registrar_abonos_de_apertura(lista_ingresos, batch_size=batch_size)
+            + registrar_abonos_de_apertura(lista_egresos, batch_size=batch_size)
+        )
+
+        proyecto_ids = [proyecto.pk for proyecto in lista_proyectos]
+        recalcular_resumenes(proyecto_ids, batch_size=batch_size)
+        reconciliar_presupuestos([presupuesto.pk for presupuesto in lista_presupuestos])
+        proyecciones = generar_proyecciones(proyecto_ids, batch_size=batch_size)
+
+    return {
+        'usuarios': len(lista_usuarios),
+        'proyectos': len(lista_proyectos),
+        'equipos': len(equipos),
+        'presupuestos': len(lista_presupuestos),
+        'ingresos': len(lista_ingresos),
+        'egresos': len(lista_egresos),
+        'abonos': abonos,
+        'proyecciones': proyecciones,
+    }
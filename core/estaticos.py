@@ -0,0 +1,263 @@
+# core/estaticos.py
+"""
+Archivos estáticos para producción sin servidor web delante.
+
+- ManifestComprimidoStorage: nombres con hash de contenido (manifest de
+  Django) y, al correr collectstatic, variantes .gz y .br (brotli es
+  opcional) de los archivos de texto.
+- ArchivosEstaticosMiddleware: sirve STATIC_ROOT desde la aplicación (WSGI
+  o ASGI). Elige la variante precomprimida según Accept-Encoding, responde
+  304 a peticiones condicionales y marca como inmutables, con expiración a
+  un año, los archivos con hash en el nombre. Bajo ASGI el disco solo se
+  toca desde hilos (sync_to_async): os.stat al primer acceso a cada ruta y
+  la lectura del archivo por bloques.
+
+Se activan con ESTATICOS_COMPRIMIDOS y SERVIR_ESTATICOS (ver settings).
+"""
+import gzip
+import mimetypes
+import os
+import posixpath
+import re
+import threading
+import time
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import unquote, urlsplit
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction, sync_to_async
+from django.conf import settings
+from django.contrib.staticfiles.storage import ManifestStaticFilesStorage
+from django.core.exceptions import MiddlewareNotUsed, SuspiciousFileOperation
+from django.core.files.base import ContentFile
+from django.http import FileResponse, StreamingHttpResponse
+from django.utils._os import safe_join
+from django.utils.cache import get_conditional_response
+from django.utils.http import http_date
+
+try:
+    import brotli
+except ImportError:  # dependencia opcional, solo para las variantes .br
+    brotli = None
+
+
+EXTENSIONES_COMPRIMIBLES = {
+    '.css', '.js', '.mjs', '.json', '.map', '.svg', '.txt', '.html', '.xml',
+    '.ico', '.ttf', '.otf', '.eot', '.webmanifest',
+}
+TAMAÑO_MINIMO = 512  # bytes; por debajo la cabecera gzip se come la ganancia
+AHORRO_MINIMO = 0.95  # se descarta la variante si no baja al menos un 5%
+
+# (codificación HTTP, sufijo del archivo), en orden de preferencia
+CODIFICACIONES = [('br', '.br'), ('gzip', '.gz')]
+
+MAX_AGE_INMUTABLE = 365 * 24 * 60 * 60
+MAX_AGE = 60
+
+# nombre.<12 hex>.ext, como los genera ManifestStaticFilesStorage
+_CON_HASH = re.compile(r'\.[0-9a-f]{12}\.[^./]+$')
+
+
+def comprimir(contenido, codificacion):
+    if codificacion == 'gzip':
+        return gzip.compress(contenido, compresslevel=9, mtime=0)
+    return brotli.compress(contenido, quality=11)
+
+
+class ManifestComprimidoStorage(ManifestStaticFilesStorage):
+    """Manifest de Django más variantes precomprimidas de cada archivo"""
+
+    def post_process(self, paths, dry_run=False, **options):
+        nombres = set()
+        for nombre, nombre_hash, procesado in super().post_process(paths, dry_run, **options):
+            if not isinstance(procesado, Exception):
+                nombres.add(nombre)
+                if nombre_hash:
+                    nombres.add(nombre_hash)
+            yield nombre, nombre_hash, procesado
+
+        if dry_run:
+            return
+        # zlib y brotli liberan el GIL: los hilos sí comprimen en paralelo
+        with ThreadPoolExecutor() as executor:
+            list(executor.map(self.comprimir_variantes, sorted(nombres)))
+
+    def comprimir_variantes(self, nombre):
+        if os.path.splitext(nombre)[1].lower() not in EXTENSIONES_COMPRIMIBLES:
+            return
+        with self.open(nombre) as archivo:
+            contenido = archivo.read()
+        if len(contenido) < TAMAÑO_MINIMO:
+            return
+        for codificacion, sufijo in CODIFICACIONES:
+            if codificacion == 'br' and brotli is None:
+                continue
+            comprimido = comprimir(contenido, codificacion)
+            if len(comprimido) < len(contenido) * AHORRO_MINIMO:
+                if self.exists(nombre + sufijo):
+                    self.delete(nombre + sufijo)
+                self._save(nombre + sufijo, ContentFile(comprimido))
+
+
+# --- Servidor ---
+
+Variante = namedtuple('Variante', ['ruta', 'etag', 'tamaño'])
+ArchivoEstatico = namedtuple('ArchivoEstatico', ['content_type', 'modificado', 'inmutable', 'variantes'])
+
+
+def _calidad(aceptadas, codificacion):
+    """q de `codificacion` en un Accept-Encoding ya separado; 0 si no está"""
+    for token in aceptadas:
+        nombre, _, parametros = token.partition(';')
+        if nombre.strip().lower() in (codificacion, '*'):
+            parametros = parametros.strip().lower()
+            if parametros.startswith('q='):
+                try:
+                    return float(parametros[2:])
+                except ValueError:
+                    return 0
+            return 1
+    return 0
+
+
+def _en_hilo(funcion):
+    """E/S de disco fuera del event loop, en el pool de hilos (no en el hilo de las vistas sync)"""
+    return sync_to_async(funcion, thread_sensitive=False)
+
+
+async def leer_por_bloques(ruta, tamaño_bloque=FileResponse.block_size):
+    """Contenido de `ruta` en bloques; open/read/close corren en un hilo"""
+    archivo = await _en_hilo(open)(ruta, 'rb')
+    try:
+        while bloque := await _en_hilo(archivo.read)(tamaño_bloque):
+            yield bloque
+    finally:
+        await _en_hilo(archivo.close)()
+
+
+def elegir_codificacion(accept_encoding, disponibles):
+    aceptadas = [token for token in accept_encoding.split(',') if token.strip()]
+    for codificacion, _ in CODIFICACIONES:
+        if codificacion in disponibles and _calidad(aceptadas, codificacion) > 0:
+            return codificacion
+    return None
+
+
+class ArchivosEstaticosMiddleware:
+    """
+    Va justo después de SecurityMiddleware: los estáticos no pasan por
+    sesión, CSRF ni autenticación. Bajo ASGI corre en el event loop: las
+    rutas ya vistas salen de memoria, las nuevas se buscan en un hilo y el
+    archivo se envía con un iterador asíncrono (un FileResponse haría que
+    Django lo leyera completo en memoria antes de enviarlo).
+    """
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        if not getattr(settings, 'SERVIR_ESTATICOS', False) or not settings.STATIC_ROOT:
+            raise MiddlewareNotUsed
+        self.get_response = get_response
+        self.asincrono = iscoroutinefunction(get_response)
+        if self.asincrono:
+            markcoroutinefunction(self)
+        self.prefijo = urlsplit(settings.STATIC_URL).path
+        if not self.prefijo.startswith('/'):
+            self.prefijo = '/' + self.prefijo
+        self.raiz = os.fspath(settings.STATIC_ROOT)
+        self._archivos = {}  # ruta relativa -> ArchivoEstatico; solo los que existen
+        self._lock = threading.Lock()
+
+    def __call__(self, request):
+        if self.asincrono:
+            return self.__acall__(request)
+        ruta = self.ruta_de(request)
+        archivo = self.buscar(ruta) if ruta is not None else None
+        if archivo is not None:
+            return self.servir(request, archivo)
+        return self.get_response(request)
+
+    async def __acall__(self, request):
+        ruta = self.ruta_de(request)
+        if ruta is not None:
+            archivo = self._archivos.get(ruta)
+            if archivo is None:
+                archivo = await _en_hilo(self.buscar)(ruta)
+            if archivo is not None:
+                return self.servir(request, archivo, asincrono=True)
+        return await self.get_response(request)
+
+    def ruta_de(self, request):
+        """Ruta relativa a STATIC_ROOT pedida por `request`; None si no es un estático"""
+        if request.method in ('GET', 'HEAD') and request.path_info.startswith(self.prefijo):
+            return posixpath.normpath(unquote(request.path_info[len(self.prefijo):])).lstrip('/')
+        return None
+
+    def buscar(self, ruta):
+        archivo = self._archivos.get(ruta)
+        if archivo is None:
+            archivo = self._cargar(ruta)
+            if archivo is not None:
+                with self._lock:
+                    self._archivos[ruta] = archivo
+        return archivo
+
+    def _cargar(self, ruta):
+        try:
+            completa = safe_join(self.raiz, ruta)
+        except SuspiciousFileOperation:
+            return None
+        if not os.path.isfile(completa):
+            return None
+
+        estado = os.stat(completa)
+        variantes = {
+            None: Variante(completa, f'"{int(estado.st_mtime):x}-{estado.st_size:x}"', estado.st_size),
+        }
+        for codificacion, sufijo in CODIFICACIONES:
+            try:
+                tamaño = os.stat(completa + sufijo).st_size
+            except OSError:
+                continue
+            variantes[codificacion] = Variante(
+                completa + sufijo, f'"{int(estado.st_mtime):x}-{tamaño:x}-{codificacion}"', tamaño,
+            )
+
+        content_type = mimetypes.guess_type(completa)[0] or 'application/octet-stream'
+        if content_type.startswith('text/') or content_type in ('application/javascript', 'application/json'):
+            content_type += '; charset=utf-8'
+        return ArchivoEstatico(
+            content_type=content_type,
+            modificado=int(estado.st_mtime),
+            inmutable=bool(_CON_HASH.search(ruta)),
+            variantes=variantes,
+        )
+
+    def servir(self, request, archivo, asincrono=False):
+        """Respuesta para `archivo`; con `asincrono` no hace E/S en el hilo que llama"""
+        codificacion = elegir_codificacion(
+            request.META.get('HTTP_ACCEPT_ENCODING', ''), archivo.variantes,
+        )
+        variante = archivo.variantes[codificacion]
+
+        response = get_conditional_response(request, etag=variante.etag, last_modified=archivo.modificado)
+        if response is None:
+            if asincrono:
+                response = StreamingHttpResponse(
+                    leer_por_bloques(variante.ruta), content_type=archivo.content_type,
+                )
+                response['Content-Length'] = variante.tamaño
+            else:
+                response = FileResponse(open(variante.ruta, 'rb'), content_type=archivo.content_type)
+                response.headers.pop('Content-Disposition', None)
+            if codificacion:
+                response['Content-Encoding'] = codificacion
+
+        max_age = MAX_AGE_INMUTABLE if archivo.inmutable else MAX_AGE
+        response['Cache-Control'] = f'public, max-age={max_age}' + (', immutable' if archivo.inmutable else '')
+        response['Expires'] = http_date(time.time() + max_age)
+        response['ETag'] = variante.etag
+        response['Last-Modified'] = http_date(archivo.modificado)
+        if len(archivo.variantes) > 1:
+            response['Vary'] = 'Accept-Encoding'
+        return response
@@ -0,0 +1,73 @@
+# core/management/commands/benchmark.py
+import json
+
+from django.core.management.base import BaseCommand, CommandError
+
+from auths.models import Auth
+from core.benchmark import comparar_servidores, ejecutar_benchmark
+
+
+class Command(BaseCommand):
+    help = (
+        "Mide latencia y consultas SQL de los listados, el dashboard, los changelists "
+        "del admin y los cálculos financieros sobre los datos actuales (ver "
+        "generar_datos_sinteticos). Imprime un reporte JSON. Con --servidores compara "
+        "bajo carga concurrente las vistas por WSGI y por ASGI."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--repeticiones', type=int, default=10, help='Repeticiones por escenario')
+        parser.add_argument(
+            '--usuario',
+            help='Username para las vistas; por defecto, el integrante con más proyectos',
+        )
+        parser.add_argument('--escenario', help='Solo escenarios cuyo nombre contenga este texto')
+        parser.add_argument('--salida', help='Archivo donde escribir el reporte JSON')
+        parser.add_argument(
+            '--servidores', action='store_true',
+            help='Comparar WSGI y ASGI (tablero y listado de ingresos) en vez de los escenarios',
+        )
+        parser.add_argument('--peticiones', type=int, default=200, help='Peticiones por ruta (--servidores)')
+        parser.add_argument('--concurrencia', type=int, default=8, help='Peticiones en curso (--servidores)')
+        parser.add_argument(
+            '--con-cache', action='store_true',
+            help='No desactivar la caché del tablero (--servidores)',
+        )
+
+    def handle(self, *args, **options):
+        if options['repeticiones'] < 1:
+            raise CommandError('--repeticiones debe ser al menos 1')
+        usuario = None
+        if options['usuario']:
+            try:
+                usuario = Auth.objects.get(username=options['usuario'])
+            except Auth.DoesNotExist:
+                raise CommandError(f'No existe el usuario "{options["usuario"]}"')
+
+        if options['servidores']:
+            if options['peticiones'] < 1 or options['concurrencia'] < 1:
+                raise CommandError('--peticiones y --concurrencia deben ser al menos 1')
+            try:
+                reporte = comparar_servidores(
+                    usuario=usuario,
+                    peticiones=options['peticiones'],
+                    concurrencia=options['concurrencia'],
+                    con_cache=options['con_cache'],
+                )
+            except ValueError as error:
+                raise CommandError(str(error))
+        else:
+            reporte = ejecutar_benchmark(
+                repeticiones=options['repeticiones'],
+                usuario=usuario,
+                filtro=options['escenario'],
+            )
+        contenido = json.dumps(reporte, indent=2, ensure_ascii=False)
+        if options['salida']:
+            with open(options['salida'], 'w', encoding='utf-8') as archivo:
+                archivo.write(contenido)
+            self.stdout.write(self.style.SUCCESS(
+                f'Reporte de {len(reporte["escenarios"])} escenarios en {options["salida"]}'
+            ))
+        else:
+            self.stdout.write(contenido)
@@ -0,0 +1,122 @@
+# core/management/commands/benchmark_escrituras.py
+import json
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date
+from decimal import Decimal
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import OperationalError, connection, connections, transaction
+
+from auths.models import Auth
+from finanzas.models import Ingreso
+from proyectos.models import Project
+
+
+class Command(BaseCommand):
+    help = (
+        "Mide el throughput de escrituras concurrentes de Ingreso sobre el perfil "
+        "de base de datos configurado (CORTESEC_DB_ENGINE). Ejecutar una vez por perfil "
+        "y comparar la salida JSON. ESCRIBE EN LA BASE DE DATOS DE DATABASES: crea un "
+        "usuario, un proyecto y hilos x escrituras ingresos, y los borra al terminar; "
+        "por eso exige --confirmar. No usarlo contra producción."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--hilos', type=int, default=8, help='Escritores concurrentes')
+        parser.add_argument('--escrituras', type=int, default=200, help='Escrituras por hilo')
+        parser.add_argument('--json', action='store_true', help='Salida JSON en una línea')
+        parser.add_argument(
+            '--confirmar', action='store_true',
+            help='Confirma que se puede escribir en la base configurada',
+        )
+
+    def handle(self, *args, **options):
+        hilos = options['hilos']
+        escrituras = options['escrituras']
+        if hilos < 1:
+            raise CommandError('--hilos debe ser al menos 1')
+        if escrituras < 1:
+            raise CommandError('--escrituras debe ser al menos 1')
+        if not options['confirmar']:
+            raise CommandError(
+                f'Este benchmark escribe en la base "{connection.settings_dict["NAME"]}" '
+                f'({connection.vendor}). Repetir con --confirmar para continuar.'
+            )
+        sufijo = uuid.uuid4().hex[:8]
+
+        usuario = Auth.objects.create_user(
+            nombre='Benchmark',
+            apellido='Escrituras',
+            username=f'bench-{sufijo}',
+            email=f'bench-{sufijo}@cortesec.local',
+        )
+        proyecto = Project.objects.create(
+            name='Benchmark de escrituras',
+            code=f'BENCH-{sufijo}',
+            client_name='Benchmark',
+            location='N/A',
+            start_date=date.today(),
+            end_date=date.today(),
+            contract_amount=Decimal('0'),
+            budget=Decimal('0'),
+            created_by=usuario,
+        )
+
+        def escritor(numero):
+            errores = 0
+            latencias = []
+            try:
+                for i in range(escrituras):
+                    inicio = time.perf_counter()
+                    try:
+                        with transaction.atomic():
+                            Ingreso.objects.create(
+                                proyecto=proyecto,
+                                concepto=f'Benchmark {numero}-{i}',
+                                monto_total=Decimal('1000.00'),
+                                fecha_esperada=date.today(),
+                                creado_por=usuario,
+                            )
+                    except OperationalError:
+                        errores += 1
+                    latencias.append(time.perf_counter() - inicio)
+            finally:
+                connections.close_all()
+            return latencias, errores
+
+        try:
+            inicio = time.perf_counter()
+            with ThreadPoolExecutor(max_workers=hilos) as executor:
+                resultados = list(executor.map(escritor, range(hilos)))
+            duracion = time.perf_counter() - inicio
+        finally:
+            proyecto.delete()
+            usuario.delete()
+
+        latencias = sorted(l for lista, _ in resultados for l in lista)
+        errores = sum(e for _, e in resultados)
+        total = len(latencias) - errores
+
+        def percentil(p):
+            return round(latencias[min(len(latencias) - 1, int(len(latencias) * p))] * 1000, 2)
+
+        reporte = {
+            'motor': connection.vendor,
+            'conn_max_age': connection.settings_dict.get('CONN_MAX_AGE'),
+            'pool': bool(connection.settings_dict.get('OPTIONS', {}).get('pool')),
+            'hilos': hilos,
+            'escrituras': total,
+            'errores': errores,
+            'segundos': round(duracion, 3),
+            'escrituras_por_segundo': round(total / duracion, 1) if duracion else None,
+            'latencia_p50_ms': percentil(0.50),
+            'latencia_p99_ms': percentil(0.99),
+        }
+
+        if options['json']:
+            self.stdout.write(json.dumps(reporte))
+        else:
+            for clave, valor in reporte.items():
+                self.stdout.write(f'{clave}: {valor}')
@@ -0,0 +1,49 @@
+# core/management/commands/construir_bundles.py
+import gzip
+
+from django.core.management.base import BaseCommand, CommandError
+
+from core.bundles import BUNDLES, construir, directorio_de_salida, vocabulario_del_proyecto
+
+
+class Command(BaseCommand):
+    help = (
+        "Concatena, poda y minifica el CSS/JS de cada layout en static/bundles/ "
+        "(ver core.bundles). Correr después de cambiar plantillas y antes de collectstatic."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--verificar',
+            action='store_true',
+            help='No escribe nada; falla si los bundles versionados no están al día.',
+        )
+
+    def handle(self, *args, **options):
+        salida = directorio_de_salida()
+        vocabulario = vocabulario_del_proyecto()
+        desactualizados = []
+
+        for nombre in BUNDLES:
+            for archivo, contenido in construir(nombre, vocabulario).items():
+                destino = salida / archivo
+                actual = destino.read_text(encoding='utf-8') if destino.exists() else None
+                if options['verificar']:
+                    if actual != contenido:
+                        desactualizados.append(archivo)
+                    continue
+                if actual != contenido:
+                    salida.mkdir(parents=True, exist_ok=True)
+                    destino.write_text(contenido, encoding='utf-8')
+                self.stdout.write(
+                    f'{archivo}: {len(contenido.encode()) / 1024:.1f} KB '
+                    f'({len(gzip.compress(contenido.encode())) / 1024:.1f} KB gzip)'
+                )
+
+        if desactualizados:
+            raise CommandError(
+                f'Bundles desactualizados: {", ".join(desactualizados)}; '
+                f'corra manage.py construir_bundles'
+            )
+        if options['verificar']:
+            self.stdout.write(self.style.SUCCESS('Bundles al día'))
@@ -0,0 +1,59 @@
+# core/management/commands/generar_datos_sinteticos.py
+import json
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+
+from core.datos_sinteticos import generar_datos
+from proyectos.models import Project
+
+
+class Command(BaseCommand):
+    help = (
+        "Genera un conjunto de datos sintético (usuarios, proyectos, equipos, "
+        "presupuestos, ingresos, egresos y proyecciones) para medir rendimiento. "
+        "Usar solo en bases de desarrollo o de benchmark."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--usuarios', type=int, default=50)
+        parser.add_argument('--proyectos', type=int, default=20)
+        parser.add_argument('--miembros', type=int, default=5, help='Integrantes por proyecto')
+        parser.add_argument('--presupuestos', type=int, default=6, help='Categorías de presupuesto por proyecto')
+        parser.add_argument('--ingresos', type=int, default=2000, help='Total de ingresos')
+        parser.add_argument('--egresos', type=int, default=4000, help='Total de egresos')
+        parser.add_argument('--semilla', type=int, default=0, help='Semilla del generador aleatorio')
+        parser.add_argument(
+            '--prefijo',
+            default='SIN',
+            help='Prefijo de códigos de proyecto y usuarios; debe ser nuevo en la base',
+        )
+        parser.add_argument('--password', default='sintetico', help='Contraseña de los usuarios generados')
+        parser.add_argument('--json', action='store_true', help='Salida JSON en una línea')
+
+    def handle(self, *args, **options):
+        if min(options['usuarios'], options['proyectos']) < 1:
+            raise CommandError('Se necesita al menos un usuario y un proyecto')
+        prefijo = options['prefijo']
+        if Project.objects.filter(code__startswith=f'{prefijo}-').exists():
+            raise CommandError(f'Ya hay proyectos con el prefijo "{prefijo}"; use otro --prefijo')
+
+        inicio = time.perf_counter()
+        conteos = generar_datos(
+            usuarios=options['usuarios'],
+            proyectos=options['proyectos'],
+            miembros=options['miembros'],
+            presupuestos=options['presupuestos'],
+            ingresos=options['ingresos'],
+            egresos=options['egresos'],
+            semilla=options['semilla'],
+            prefijo=prefijo,
+            password=options['password'],
+        )
+        conteos['segundos'] = round(time.perf_counter() - inicio, 2)
+
+        if options['json']:
+            self.stdout.write(json.dumps(conteos))
+        else:
+            for clave, valor in conteos.items():
+                self.stdout.write(f'{clave}: {valor}')
@@ -0,0 +1,223 @@
+# core/middleware.py
+"""
+Métricas por petición: consultas SQL, tiempo en base de datos, tiempo de
+render de plantillas, tiempo total y tamaño de la respuesta.
+
+- Las consultas se cuentan con connection.execute_wrapper en todas las
+  conexiones, así que incluyen sesión, autenticación y lo que haga la vista.
+- El render se mide en el backend de plantillas core.plantillas.PlantillasMedidas
+  (TEMPLATES['BACKEND']), que usan tanto render() como TemplateResponse.
+- Cada petición deja una línea JSON en el logger `cortesec.metricas` y, con
+  METRICAS_CABECERAS, las cabeceras Server-Timing y X-Consultas-SQL.
+
+Presupuesto de consultas: una vista lo declara con el atributo
+`presupuesto_consultas` (vistas basadas en clase, y ModelAdmin para el
+listado de su changelist) o con el decorador @presupuesto_consultas(n)
+(funciones). Si se excede, se registra una advertencia; con METRICAS_ESTRICTO (activo al correr
+las pruebas) se lanza PresupuestoConsultasExcedido y la prueba falla.
+
+En respuestas en streaming solo se mide hasta que la vista devuelve la
+respuesta; las consultas del iterador no entran en la cuenta.
+
+Bajo ASGI el middleware es asíncrono, así que la cadena no se adapta con
+async_to_sync. Las envolturas se instalan en el hilo donde el ORM ejecuta las
+consultas de la petición (sync_to_async con thread_sensitive, un hilo por
+petición). Las consultas que las vistas asíncronas lanzan en hilos del pool
+(core.asincrono.en_paralelo) también cuentan; su tiempo se suma, así que
+sql_ms puede superar al tiempo total de la petición.
+"""
+import contextvars
+import json
+import logging
+import threading
+import time
+from contextlib import ExitStack, contextmanager, nullcontext
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction, sync_to_async
+from django.conf import settings
+from django.db import connections
+
+logger = logging.getLogger('cortesec.metricas')
+
+_metricas_actuales = contextvars.ContextVar('metricas_peticion', default=None)
+
+
+class PresupuestoConsultasExcedido(AssertionError):
+    """Una vista ejecutó más consultas SQL que las declaradas"""
+
+
+def presupuesto_consultas(maximo):
+    """Declara el máximo de consultas SQL por petición de una vista función"""
+    def decorador(vista):
+        vista.presupuesto_consultas = maximo
+        return vista
+    return decorador
+
+
+def _presupuesto_de(vista, metodo):
+    """
+    Busca el presupuesto en la función, la clase de la vista o el ModelAdmin;
+    el de un ModelAdmin aplica solo al listado (GET) de su changelist, no a
+    las acciones ni a la edición en bloque.
+    """
+    model_admin = getattr(vista, 'model_admin', None)
+    if model_admin is not None and (vista.__name__ != 'changelist_view' or metodo != 'GET'):
+        return None
+    for objetivo in (vista, getattr(vista, 'view_class', None), model_admin):
+        maximo = getattr(objetivo, 'presupuesto_consultas', None)
+        if maximo is not None:
+            return maximo
+    return None
+
+
+def _nombre_vista(vista):
+    model_admin = getattr(vista, 'model_admin', None)
+    if model_admin is not None:
+        return f'{type(model_admin).__module__}.{type(model_admin).__name__}.{vista.__name__}'
+    clase = getattr(vista, 'view_class', None)
+    if clase is not None:
+        return f'{clase.__module__}.{clase.__name__}'
+    return f'{vista.__module__}.{getattr(vista, "__name__", type(vista).__name__)}'
+
+
+class MetricasPeticion:
+
+    def __init__(self):
+        self.inicio = time.perf_counter()
+        self.consultas = 0
+        self.tiempo_sql = 0.0
+        self.tiempo_plantillas = 0.0
+        self.profundidad_plantillas = 0
+        self._lock = threading.Lock()
+
+    def __call__(self, execute, sql, params, many, context):
+        """Envoltura para connection.execute_wrapper"""
+        inicio = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            duracion = time.perf_counter() - inicio
+            with self._lock:
+                self.consultas += 1
+                self.tiempo_sql += duracion
+
+
+def instrumentar(conexion):
+    """
+    Cuenta en las métricas de la petición en curso las consultas de
+    `conexion`; para conexiones de otros hilos (ver core.asincrono)
+    """
+    metricas = _metricas_actuales.get()
+    if metricas is None:
+        return nullcontext()
+    return conexion.execute_wrapper(metricas)
+
+
+@contextmanager
+def medir_plantilla():
+    """
+    Suma el render al tiempo de plantillas de la petición en curso; solo el
+    más externo, porque un render_to_string anidado ya está dentro
+    """
+    metricas = _metricas_actuales.get()
+    if metricas is None:
+        yield
+        return
+    metricas.profundidad_plantillas += 1
+    inicio = time.perf_counter()
+    try:
+        yield
+    finally:
+        metricas.profundidad_plantillas -= 1
+        if metricas.profundidad_plantillas == 0:
+            metricas.tiempo_plantillas += time.perf_counter() - inicio
+
+
+def _instrumentar_conexiones(pila, metricas):
+    """Instala las envolturas en las conexiones del hilo actual"""
+    for conexion in connections.all(initialized_only=False):
+        pila.enter_context(conexion.execute_wrapper(metricas))
+
+
+class MetricasMiddleware:
+    """Va primero en MIDDLEWARE para medir también a los demás middlewares"""
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        self.asincrono = iscoroutinefunction(get_response)
+        if self.asincrono:
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if self.asincrono:
+            return self.__acall__(request)
+        metricas = MetricasPeticion()
+        token = _metricas_actuales.set(metricas)
+        try:
+            with ExitStack() as pila:
+                _instrumentar_conexiones(pila, metricas)
+                response = self.get_response(request)
+        finally:
+            _metricas_actuales.reset(token)
+        return self._registrar(request, response, metricas)
+
+    async def __acall__(self, request):
+        metricas = MetricasPeticion()
+        token = _metricas_actuales.set(metricas)
+        try:
+            with ExitStack() as pila:
+                # El ORM asíncrono consulta desde el hilo de sync_to_async de
+                # la petición: las envolturas se instalan y se quitan allí
+                await sync_to_async(_instrumentar_conexiones)(pila, metricas)
+                try:
+                    response = await self.get_response(request)
+                finally:
+                    await sync_to_async(pila.close)()
+        finally:
+            _metricas_actuales.reset(token)
+        return self._registrar(request, response, metricas)
+
+    def _registrar(self, request, response, metricas):
+        """Línea de log, cabeceras y control del presupuesto"""
+        total = time.perf_counter() - metricas.inicio
+        vista = getattr(request, '_metricas_vista', None)
+        presupuesto = getattr(request, '_metricas_presupuesto', None)
+        tamaño = None if response.streaming else len(response.content)
+
+        logger.info(json.dumps({
+            'metodo': request.method,
+            'ruta': request.path,
+            'vista': vista,
+            'estado': response.status_code,
+            'consultas': metricas.consultas,
+            'presupuesto': presupuesto,
+            'sql_ms': round(metricas.tiempo_sql * 1000, 2),
+            'plantillas_ms': round(metricas.tiempo_plantillas * 1000, 2),
+            'total_ms': round(total * 1000, 2),
+            'bytes': tamaño,
+            'streaming': response.streaming,
+        }))
+
+        if getattr(settings, 'METRICAS_CABECERAS', False):
+            response['Server-Timing'] = (
+                f'db;dur={metricas.tiempo_sql * 1000:.2f}, '
+                f'tpl;dur={metricas.tiempo_plantillas * 1000:.2f}, '
+                f'total;dur={total * 1000:.2f}'
+            )
+            response['X-Consultas-SQL'] = str(metricas.consultas)
+
+        if presupuesto is not None and metricas.consultas > presupuesto:
+            mensaje = (
+                f'{vista} ejecutó {metricas.consultas} consultas SQL '
+                f'(presupuesto: {presupuesto}) en {request.method} {request.path}'
+            )
+            if getattr(settings, 'METRICAS_ESTRICTO', False):
+                raise PresupuestoConsultasExcedido(mensaje)
+            logger.warning(mensaje)
+        return response
+
+    def process_view(self, request, view_func, view_args, view_kwargs):
+        request._metricas_vista = _nombre_vista(view_func)
+        request._metricas_presupuesto = _presupuesto_de(view_func, request.method)
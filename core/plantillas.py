@@ -0,0 +1,26 @@
+# core/plantillas.py
+"""
+Backend de plantillas de Django que mide el render para las métricas por
+petición (ver core.middleware). Se configura en TEMPLATES['BACKEND'] con
+NAME 'django', el mismo alias del backend original; fuera de una petición
+medida se comporta igual que DjangoTemplates.
+"""
+from django.template.backends.django import DjangoTemplates, Template
+
+from core.middleware import medir_plantilla
+
+
+class PlantillaMedida(Template):
+
+    def render(self, context=None, request=None):
+        with medir_plantilla():
+            return super().render(context, request)
+
+
+class PlantillasMedidas(DjangoTemplates):
+
+    def from_string(self, template_code):
+        return PlantillaMedida(super().from_string(template_code).template, self)
+
+    def get_template(self, template_name):
+        return PlantillaMedida(super().get_template(template_name).template, self)
@@ -0,0 +1,140 @@
+# core/templatetags/core_extras.py
+import hashlib
+import re
+from functools import lru_cache
+from pathlib import Path
+
+from django import template
+from django.conf import settings
+from django.contrib.staticfiles import finders
+from django.core.cache import caches
+from django.template import TemplateDoesNotExist
+from django.templatetags.static import static
+from django.utils import timezone, translation
+from django.utils.html import format_html
+from django.utils.safestring import mark_safe
+
+from core.bundles import DIRECTORIO
+
+register = template.Library()
+
+_URL_RELATIVA = re.compile(r'url\("\.\./([^"?#]+)([^"]*)"\)')
+
+
+@lru_cache(maxsize=None)
+def _css_critico(nombre):
+    """CSS crítico con los url() absolutos (en línea ya no es relativo a bundles/)"""
+    ruta = finders.find(f'{DIRECTORIO}/{nombre}.critico.css')
+    if ruta is None:
+        return ''
+    css = Path(ruta).read_text(encoding='utf-8')
+    return _URL_RELATIVA.sub(lambda m: f'url("{static(m.group(1))}{m.group(2)}")', css)
+
+
+@register.simple_tag
+def bundle_css(nombre):
+    """
+    CSS crítico en línea y el bundle completo sin bloquear el primer
+    render (preload + onload); sin JS se carga como hoja normal.
+    """
+    url = static(f'{DIRECTORIO}/{nombre}.css')
+    return format_html(
+        '<style>{}</style>\n'
+        '<link rel="preload" href="{}" as="style" onload="this.onload=null;this.rel=\'stylesheet\'">\n'
+        '<noscript><link rel="stylesheet" href="{}"></noscript>',
+        mark_safe(_css_critico(nombre)),
+        url,
+        url,
+    )
+
+
+@register.simple_tag
+def bundle_js(nombre):
+    return format_html('<script src="{}"></script>', static(f'{DIRECTORIO}/{nombre}.js'))
+
+
+# --- Caché de filas de listados ---
+
+def _version_plantilla(parser):
+    """Hash del código de la plantilla: al editarla cambian todas las claves"""
+    origen = parser.origin
+    try:
+        fuente = origen.loader.get_contents(origen)
+    except (AttributeError, TemplateDoesNotExist):  # plantillas armadas desde un string
+        return ''
+    return hashlib.md5(fuente.encode(), usedforsecurity=False).hexdigest()[:8]
+
+
+class FilasEnCacheNode(template.Node):
+
+    def __init__(self, nombre, variable, secuencia, variaciones, nodelist, version):
+        self.nombre = nombre
+        self.variable = variable
+        self.secuencia = secuencia
+        self.variaciones = variaciones
+        self.nodelist = nodelist
+        self.version = version
+
+    def clave(self, prefijo, context):
+        valores = '|'.join(str(variacion.resolve(context)) for variacion in self.variaciones)
+        return f'{prefijo}:{hashlib.md5(valores.encode(), usedforsecurity=False).hexdigest()}'
+
+    def render(self, context):
+        filas = list(self.secuencia.resolve(context, ignore_failures=True) or [])
+        if not filas:
+            return ''
+        # El día va en la clave (mismo criterio que esta_vencido): "vencido"
+        # cambia de un día a otro sin que cambie la fila
+        prefijo = (
+            f'filas:{self.nombre.resolve(context)}:{self.version}:'
+            f'{translation.get_language()}:{timezone.now().date().isoformat()}'
+        )
+        claves = []
+        for fila in filas:
+            with context.push({self.variable: fila}):
+                claves.append(self.clave(prefijo, context))
+
+        cache = caches[settings.CACHE_FILAS]
+        en_cache = cache.get_many(claves)
+        nuevas = {}
+        partes = []
+        for fila, clave in zip(filas, claves):
+            html = en_cache.get(clave)
+            if html is None:
+                with context.push({self.variable: fila}):
+                    html = nuevas[clave] = self.nodelist.render(context)
+            partes.append(html)
+        if nuevas:
+            cache.set_many(nuevas, settings.CACHE_FILAS_TIMEOUT)
+        return mark_safe(''.join(partes))
+
+
+@register.tag
+def filas_en_cache(parser, token):
+    """
+    Renderiza las filas de un listado con caché por fila:
+
+        {% filas_en_cache 'ingresos' ingreso in ingresos ingreso.pk ingreso.actualizado_en %}
+          <tr>...</tr>
+        {% endfilas_en_cache %}
+
+    La clave de cada fila sale de los valores que siguen a la secuencia
+    (pk, fecha de modificación y lo que se muestre de otros modelos), del
+    día y de la versión de la plantilla. Todas las filas se piden a la
+    caché en un solo get_many; solo se renderizan las que faltan.
+    """
+    bits = token.split_contents()
+    if len(bits) < 6 or bits[3] != 'in':
+        raise template.TemplateSyntaxError(
+            f"'{bits[0]}' espera: nombre fila in secuencia valor [valor ...]"
+        )
+    nodelist = parser.parse(('endfilas_en_cache',))
+    parser.delete_first_token()
+    return FilasEnCacheNode(
+        parser.compile_filter(bits[1]),
+        bits[2],
+        parser.compile_filter(bits[4]),
+        [parser.compile_filter(bit) for bit in bits[5:]],
+        nodelist,
+        _version_plantilla(parser),
+    )
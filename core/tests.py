@@ -1,3 +1,489 @@
-from django.test import TestCase
+# core/tests.py
+import asyncio
+import gzip
+import io
+import json
+import logging
+import os
+import tempfile
+import threading
+from pathlib import Path
+from unittest import mock
 
-# Create your tests here.
+from django.conf import settings
+from django.contrib.staticfiles.storage import staticfiles_storage
+from django.core.cache import cache
+from django.core.management import call_command
+from django.core.management.base import CommandError
+from django.db import connection
+from asgiref.sync import async_to_sync, iscoroutinefunction
+from django.http import HttpResponse
+from django.template import engines
+from django.test import RequestFactory, SimpleTestCase, TestCase, TransactionTestCase, override_settings
+from django.urls import reverse
+
+from auths.models import Auth
+from CorteSec.cache import configurar_caches, configurar_sesiones
+from CorteSec.database import configurar_base_datos
+from finanzas.models import Egreso, Ingreso, ProyeccionFlujoCaja
+from finanzas.pagos import verificar_abonos
+from finanzas.presupuestos import verificar_presupuestos
+from finanzas.resumen import verificar_resumenes
+from finanzas.tablero import acalcular_tablero, calcular_tablero
+from finanzas.tests import asignar, crear_ingreso, crear_proyecto, crear_usuario
+from finanzas.views import IngresoListView
+from proyectos.views import project_list
+from .asincrono import en_paralelo
+from .benchmark import comparar_servidores, ejecutar_benchmark
+from .bundles import (
+    BUNDLES, Vocabulario, construir_css, construir_js, minificar, parsear, podar, quitar_comentarios,
+    serializar,
+)
+from .datos_sinteticos import generar_datos
+from .estaticos import ArchivosEstaticosMiddleware, brotli
+from .middleware import MetricasMiddleware, PresupuestoConsultasExcedido
+from .plantillas import PlantillaMedida, PlantillasMedidas
+
+
+class PerfilBaseDatosTests(SimpleTestCase):
+
+    def test_sqlite_por_defecto(self):
+        config = configurar_base_datos(Path('/tmp'), env={})
+        self.assertEqual(config['ENGINE'], 'django.db.backends.sqlite3')
+        self.assertEqual(config['OPTIONS']['transaction_mode'], 'IMMEDIATE')
+
+    def test_postgresql_con_conexiones_persistentes(self):
+        config = configurar_base_datos(Path('/tmp'), env={
+            'CORTESEC_DB_ENGINE': 'postgresql',
+            'CORTESEC_DB_CONN_MAX_AGE': '120',
+        })
+        self.assertEqual(config['ENGINE'], 'django.db.backends.postgresql')
+        self.assertEqual(config['CONN_MAX_AGE'], 120)
+        self.assertTrue(config['CONN_HEALTH_CHECKS'])
+        self.assertNotIn('pool', config['OPTIONS'])
+
+    def test_postgresql_con_pool_desactiva_persistencia(self):
+        config = configurar_base_datos(Path('/tmp'), env={
+            'CORTESEC_DB_ENGINE': 'postgresql',
+            'CORTESEC_DB_POOL': '1',
+            'CORTESEC_DB_POOL_MAX_SIZE': '20',
+        })
+        self.assertEqual(config['CONN_MAX_AGE'], 0)
+        self.assertEqual(config['OPTIONS']['pool']['max_size'], 20)
+
+
+class PerfilCacheTests(SimpleTestCase):
+
+    def test_locmem_y_sesiones_cache_db_por_defecto(self):
+        self.assertEqual(
+            configurar_caches(env={})['default']['BACKEND'],
+            'django.core.cache.backends.locmem.LocMemCache',
+        )
+        self.assertEqual(configurar_sesiones(env={}), 'django.contrib.sessions.backends.cached_db')
+
+    def test_redis_y_cookies_firmadas(self):
+        config = configurar_caches(env={
+            'CORTESEC_CACHE': 'redis',
+            'CORTESEC_CACHE_URL': 'redis://cache:6379/1',
+        })['default']
+        self.assertEqual(config['BACKEND'], 'django.core.cache.backends.redis.RedisCache')
+        self.assertEqual(config['LOCATION'], 'redis://cache:6379/1')
+        self.assertEqual(
+            configurar_sesiones(env={'CORTESEC_SESIONES': 'cookies'}),
+            'django.contrib.sessions.backends.signed_cookies',
+        )
+        with self.assertRaises(ValueError):
+            configurar_caches(env={'CORTESEC_CACHE': 'archivo'})
+
+
+class PragmasSqliteTests(TestCase):
+
+    def test_pragmas_aplicados_a_la_conexion(self):
+        if connection.vendor != 'sqlite':
+            self.skipTest('Solo aplica al perfil SQLite')
+        with connection.cursor() as cursor:
+            cursor.execute('PRAGMA synchronous')
+            self.assertEqual(cursor.fetchone()[0], 1)  # NORMAL
+
+
+class MetricasMiddlewareTests(TestCase):
+
+    def setUp(self):
+        cache.clear()
+        self.usuario = crear_usuario()
+        proyecto = crear_proyecto(self.usuario)
+        asignar(self.usuario, proyecto)
+        crear_ingreso(proyecto)
+        self.client.force_login(self.usuario)
+        self.url = reverse('finanzas:lista_ingresos')
+
+    @override_settings(METRICAS_CABECERAS=True)
+    def test_cabeceras_y_linea_de_log(self):
+        with self.assertLogs('cortesec.metricas', level='INFO') as logs:
+            response = self.client.get(self.url)
+
+        consultas = int(response['X-Consultas-SQL'])
+        self.assertGreater(consultas, 0)
+        self.assertRegex(response['Server-Timing'], r'^db;dur=[\d.]+, tpl;dur=[\d.]+, total;dur=[\d.]+$')
+
+        linea = json.loads(logs.records[-1].getMessage())
+        self.assertEqual(linea['vista'], 'finanzas.views.IngresoListView')
+        self.assertEqual(linea['consultas'], consultas)
+        self.assertEqual(linea['presupuesto'], IngresoListView.presupuesto_consultas)
+        self.assertEqual(linea['bytes'], len(response.content))
+        self.assertGreater(linea['plantillas_ms'], 0)
+
+    def test_backend_de_plantillas_medido(self):
+        self.assertIsInstance(engines['django'], PlantillasMedidas)
+        plantilla = engines['django'].from_string('{{ valor }}')
+        self.assertIsInstance(plantilla, PlantillaMedida)
+        # Fuera de una petición medida se comporta igual
+        self.assertEqual(plantilla.render({'valor': 7}), '7')
+
+    @override_settings(METRICAS_CABECERAS=False)
+    def test_sin_cabeceras_por_defecto_en_produccion(self):
+        self.assertNotIn('X-Consultas-SQL', self.client.get(self.url))
+
+    def test_presupuesto_excedido_falla_en_modo_estricto(self):
+        with mock.patch.object(IngresoListView, 'presupuesto_consultas', 1):
+            with self.assertRaises(PresupuestoConsultasExcedido):
+                self.client.get(self.url)
+
+        # Con sesión y usuario en caché el listado de obras hace una sola consulta
+        with mock.patch.object(project_list, 'presupuesto_consultas', 0, create=True):
+            with self.assertRaises(PresupuestoConsultasExcedido):
+                self.client.get(reverse('proyectos:project_list'))
+
+    @override_settings(METRICAS_ESTRICTO=False)
+    def test_presupuesto_excedido_solo_advierte_fuera_de_pruebas(self):
+        with mock.patch.object(IngresoListView, 'presupuesto_consultas', 1):
+            with self.assertLogs('cortesec.metricas', level='WARNING') as logs:
+                response = self.client.get(self.url)
+        self.assertEqual(response.status_code, 200)
+        self.assertIn('presupuesto: 1', logs.output[-1])
+
+
+class DatosSinteticosTests(TestCase):
+
+    def test_genera_datos_consistentes_y_reproducibles(self):
+        conteos = generar_datos(
+            usuarios=6, proyectos=3, miembros=3, presupuestos=4,
+            ingresos=40, egresos=60, semilla=7, prefijo='T1',
+        )
+        self.assertEqual(conteos['proyectos'], 3)
+        self.assertEqual(conteos['equipos'], 9)
+        self.assertEqual(conteos['presupuestos'], 12)
+        self.assertEqual(conteos['ingresos'], 40)
+        self.assertGreater(conteos['proyecciones'], 0)
+        # Las tablas derivadas quedan al día aunque bulk_create no dispare señales
+        self.assertEqual(verificar_resumenes(), [])
+        self.assertEqual(verificar_presupuestos(), [])
+        self.assertGreater(conteos['abonos'], 0)
+        self.assertEqual(verificar_abonos(Ingreso), [])
+        self.assertEqual(verificar_abonos(Egreso), [])
+
+        montos = list(Egreso.objects.order_by('pk').values_list('monto_total', 'estado'))
+        Egreso.objects.all().delete()
+        generar_datos(
+            usuarios=6, proyectos=3, miembros=3, presupuestos=4,
+            ingresos=40, egresos=60, semilla=7, prefijo='T2',
+        )
+        self.assertEqual(
+            list(Egreso.objects.filter(proyecto__code__startswith='T2-')
+                 .order_by('pk').values_list('monto_total', 'estado')),
+            montos,
+        )
+
+    def test_benchmark_reporta_escenarios_sin_modificar_datos(self):
+        generar_datos(usuarios=4, proyectos=2, miembros=2, ingresos=20, egresos=20, prefijo='BM')
+        proyecciones = ProyeccionFlujoCaja.objects.count()
+
+        reporte = ejecutar_benchmark(repeticiones=2)
+
+        escenarios = reporte['escenarios']
+        for nombre in ('ingresos_vencidos', 'proyectos', 'dashboard', 'admin_ingreso', 'generar_proyecciones'):
+            self.assertIn(nombre, escenarios)
+        for nombre, resultado in escenarios.items():
+            self.assertLessEqual(resultado['p50_ms'], resultado['p95_ms'])
+            if 'estado' in resultado:
+                self.assertEqual(resultado['estado'], 200, nombre)
+        json.dumps(reporte)
+        self.assertEqual(ProyeccionFlujoCaja.objects.count(), proyecciones)
+        self.assertFalse(Auth.objects.filter(username__startswith='bench-admin-').exists())
+
+    def test_benchmark_de_escrituras_valida_argumentos(self):
+        for argumentos in (['--hilos', '0'], ['--escrituras', '0'], []):
+            with self.subTest(argumentos=argumentos), self.assertRaises(CommandError):
+                call_command('benchmark_escrituras', *argumentos, stdout=io.StringIO())
+        self.assertFalse(Auth.objects.filter(username__startswith='bench-').exists())
+
+
+class EstaticosComprimidosTests(TestCase):
+
+    def setUp(self):
+        self.temporal = tempfile.TemporaryDirectory()
+        self.addCleanup(self.temporal.cleanup)
+        origen = Path(self.temporal.name) / 'origen'
+        (origen / 'css').mkdir(parents=True)
+        (origen / 'css' / 'app.css').write_text('.tarjeta { color: #333; }\n' * 200)
+        (origen / 'css' / 'logo.png').write_bytes(b'\x89PNG' + bytes(2000))
+
+        configuracion = override_settings(
+            STATIC_ROOT=str(Path(self.temporal.name) / 'publico'),
+            STATICFILES_DIRS=[str(origen)],
+            STATICFILES_FINDERS=['django.contrib.staticfiles.finders.FileSystemFinder'],
+            STORAGES={
+                'default': {'BACKEND': 'django.core.files.storage.FileSystemStorage'},
+                'staticfiles': {'BACKEND': 'core.estaticos.ManifestComprimidoStorage'},
+            },
+            SERVIR_ESTATICOS=True,
+        )
+        configuracion.enable()
+        self.addCleanup(configuracion.disable)
+        call_command('collectstatic', '--noinput', verbosity=0)
+        self.publico = Path(settings.STATIC_ROOT)
+        with override_settings(DEBUG=False):
+            self.url = staticfiles_storage.url('css/app.css')
+
+    def get(self, url, **extra):
+        response = self.client.get(url, **extra)
+        self.addCleanup(response.close)
+        return response
+
+    def test_collectstatic_genera_hash_y_variantes(self):
+        self.assertRegex(self.url, r'^/static/css/app\.[0-9a-f]{12}\.css$')
+        hasheado = self.publico / self.url[len('/static/'):]
+        original = hasheado.read_bytes()
+        self.assertEqual(gzip.decompress((self.publico / f'{hasheado}.gz').read_bytes()), original)
+        self.assertEqual(brotli is not None, Path(f'{hasheado}.br').exists())
+        # Binarios sin ganancia: sin variantes
+        self.assertFalse(list(self.publico.glob('css/logo*.gz')))
+
+    def test_sirve_la_variante_comprimida_e_inmutable(self):
+        response = self.get(self.url, HTTP_ACCEPT_ENCODING='gzip, deflate')
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response['Content-Encoding'], 'gzip')
+        self.assertEqual(response['Vary'], 'Accept-Encoding')
+        self.assertIn('immutable', response['Cache-Control'])
+        self.assertTrue(response['Content-Type'].startswith('text/css'))
+        self.assertEqual(
+            gzip.decompress(b''.join(response.streaming_content)),
+            (self.publico / self.url[len('/static/'):]).read_bytes(),
+        )
+
+        sin_gzip = self.get(self.url, HTTP_ACCEPT_ENCODING='gzip;q=0')
+        self.assertFalse(sin_gzip.has_header('Content-Encoding'))
+        self.assertNotEqual(sin_gzip['ETag'], response['ETag'])
+
+        sin_hash = self.get('/static/css/app.css')
+        self.assertNotIn('immutable', sin_hash['Cache-Control'])
+
+    def test_peticiones_condicionales(self):
+        primera = self.get(self.url, HTTP_ACCEPT_ENCODING='gzip')
+        por_etag = self.get(self.url, HTTP_ACCEPT_ENCODING='gzip', HTTP_IF_NONE_MATCH=primera['ETag'])
+        self.assertEqual(por_etag.status_code, 304)
+        self.assertEqual(por_etag['ETag'], primera['ETag'])
+        por_fecha = self.get(self.url, HTTP_IF_MODIFIED_SINCE=primera['Last-Modified'])
+        self.assertEqual(por_fecha.status_code, 304)
+
+    def test_no_sale_de_static_root(self):
+        self.assertEqual(self.get('/static/../manage.py').status_code, 404)
+        self.assertEqual(self.get('/static/css/no-existe.css').status_code, 404)
+
+    def test_sirve_bajo_asgi_sin_adaptar(self):
+        async def vista(request):
+            return HttpResponse('vista')
+
+        middleware = ArchivosEstaticosMiddleware(vista)
+        self.assertTrue(iscoroutinefunction(middleware))
+        fabrica = RequestFactory()
+        response = async_to_sync(middleware)(fabrica.get(self.url, HTTP_ACCEPT_ENCODING='gzip'))
+        self.addCleanup(response.close)
+        self.assertEqual(response['Content-Encoding'], 'gzip')
+        otra = async_to_sync(middleware)(fabrica.get('/otra/'))
+        self.assertEqual(otra.content, b'vista')
+
+    def test_bajo_asgi_el_disco_se_lee_fuera_del_event_loop(self):
+        en_el_loop = []
+
+        def registrar(funcion):
+            def envoltura(*args, **kwargs):
+                try:
+                    asyncio.get_running_loop()
+                    en_el_loop.append(funcion.__name__)
+                except RuntimeError:
+                    pass
+                return funcion(*args, **kwargs)
+            return envoltura
+
+        async def vista(request):
+            return HttpResponse('vista')
+
+        async def pedir(middleware):
+            response = await middleware(RequestFactory().get(self.url, HTTP_ACCEPT_ENCODING='gzip'))
+            return response, b''.join([bloque async for bloque in response.streaming_content])
+
+        middleware = ArchivosEstaticosMiddleware(vista)
+        with mock.patch('core.estaticos.os.stat', registrar(os.stat)), \
+                mock.patch('core.estaticos.open', registrar(open), create=True):
+            response, cuerpo = async_to_sync(pedir)(middleware)
+            # Ya en memoria: ni os.stat
+            with mock.patch.object(middleware, '_cargar', side_effect=AssertionError):
+                async_to_sync(pedir)(middleware)
+
+        self.assertEqual(en_el_loop, [])
+        self.assertTrue(response.is_async)
+        comprimido = self.publico / f"{self.url[len('/static/'):]}.gz"
+        self.assertEqual(cuerpo, comprimido.read_bytes())
+        self.assertEqual(int(response['Content-Length']), len(cuerpo))
+
+
+class BundlesTests(TestCase):
+
+    def podar(self, css, *textos, etiquetas=None):
+        vocabulario = Vocabulario(textos, etiquetas=etiquetas, siempre=False)
+        return minificar(serializar(podar(parsear(css), vocabulario)))
+
+    def test_poda_selectores_no_usados(self):
+        css = """
+            .btn, .btn-sin-uso { color: red; }
+            .card .card-title:hover { margin: 0; }
+            .modal { display: none; }
+            .badge-success, .badge-danger { color: green; }
+            @media (min-width: 768px) { .modal { top: 0; } .btn { top: 1px; } }
+            @media print { .modal { display: block; } }
+            @keyframes girar { to { transform: rotate(1turn); } }
+            @keyframes latir { to { opacity: 0; } }
+            .spinner { animation: girar 1s; }
+        """
+        resultado = self.podar(css, '<a class="btn card spinner">', 'card-title badge-{{ color }}')
+        self.assertIn('.btn{color:red}', resultado)
+        self.assertIn('.card .card-title:hover', resultado)
+        self.assertIn('.badge-success,.badge-danger', resultado)
+        self.assertIn('@media (min-width:768px){.btn{top:1px}}', resultado)
+        self.assertIn('@keyframes girar', resultado)
+        for ausente in ('btn-sin-uso', 'modal', '@media print', 'latir'):
+            self.assertNotIn(ausente, resultado)
+
+    def test_critico_filtra_por_etiqueta(self):
+        resultado = self.podar('table td { padding: 0; } .btn { color: red; }', 'btn', etiquetas={'a'})
+        self.assertEqual(resultado, '.btn{color:red}')
+
+    def test_conserva_licencias_en_el_bundle_completo(self):
+        css = '/*! licencia */\n/* comentario */\n.btn { color: red; }\n.sin-uso { top: 0; }\n'
+        sin_comentarios, licencias = quitar_comentarios(css)
+        self.assertEqual(licencias, ['/*! licencia */'])
+        self.assertNotIn('comentario', sin_comentarios)
+
+        vocabulario = Vocabulario(['btn'], siempre=False)
+        with mock.patch('core.bundles.leer_estatico', return_value=css):
+            completo = construir_css(['vendor/tema.css'], vocabulario)
+            critico = construir_css(['vendor/tema.css'], vocabulario, licencias=False)
+        self.assertEqual(completo, '/*! licencia */\n.btn{color:red}\n')
+        self.assertEqual(critico, '.btn{color:red}\n')
+
+    def test_bundles_al_dia(self):
+        call_command('construir_bundles', '--verificar', verbosity=0, stdout=io.StringIO())
+
+    def test_popper_va_antes_de_bootstrap(self):
+        js = construir_js(BUNDLES['dashboard']['js'])
+        self.assertLess(js.index('Federico Zivolo'), js.index('Bootstrap v4'))
+        self.assertNotIn('sourceMappingURL', js)
+
+    def test_dashboard_usa_el_bundle(self):
+        usuario = crear_usuario('bundle')
+        self.client.force_login(usuario)
+        contenido = self.client.get(reverse('core:dashboard')).content.decode()
+        self.assertIn('<style>', contenido)
+        self.assertIn('bundles/dashboard.css', contenido)
+        self.assertIn('bundles/dashboard.js', contenido)
+        self.assertNotIn('cdn.jsdelivr.net', contenido)
+
+
+class VistasAsincronasTests(TestCase):
+
+    def setUp(self):
+        cache.clear()
+        self.usuario = crear_usuario()
+        self.proyecto = crear_proyecto(self.usuario)
+        asignar(self.usuario, self.proyecto)
+        for i in range(25):
+            crear_ingreso(self.proyecto, f'{100 + i}.00', concepto=f'Ingreso {i}')
+        self.client.force_login(self.usuario)
+
+    def test_tablero_async_igual_al_sincrono(self):
+        ids = [self.proyecto.pk]
+        self.assertEqual(async_to_sync(acalcular_tablero)(ids), calcular_tablero(ids))
+
+    def test_vistas_async_responden_lo_mismo(self):
+        for sincrona, asincrona in (
+            ('core:dashboard', 'core:dashboard_asincrono'),
+            ('finanzas:lista_ingresos', 'finanzas:lista_ingresos_asincrona'),
+        ):
+            cache.clear()
+            esperada = self.client.get(reverse(sincrona))
+            cache.clear()
+            response = self.client.get(reverse(asincrona))
+            self.assertEqual(response.status_code, 200)
+            for clave in ('tablero', 'total_ingresos'):
+                if clave in esperada.context:
+                    self.assertEqual(response.context[clave], esperada.context[clave])
+        self.assertEqual(
+            [i.pk for i in response.context['ingresos']],
+            [i.pk for i in esperada.context['ingresos']],
+        )
+
+        self.client.logout()
+        response = self.client.get(reverse('finanzas:lista_ingresos_asincrona'))
+        self.assertEqual(response.status_code, 302)
+
+    @override_settings(METRICAS_CABECERAS=True)
+    def test_metricas_sin_adaptar_la_cadena(self):
+        async def vista(request):
+            return HttpResponse()
+
+        self.assertTrue(iscoroutinefunction(MetricasMiddleware(vista)))
+        url = reverse('core:dashboard_asincrono')
+        cache.clear()
+        esperadas = self.client.get(url)['X-Consultas-SQL']
+        self.async_client.force_login(self.usuario)
+        cache.clear()
+        response = async_to_sync(self.async_client.get)(url)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response['X-Consultas-SQL'], esperadas)
+
+
+class EnParaleloTests(TransactionTestCase):
+    """Fuera de una transacción las consultas sí van en hilos del pool"""
+
+    def test_hilos_propios_y_metricas(self):
+        principal = threading.get_ident()
+        hilos = async_to_sync(en_paralelo)(threading.get_ident, threading.get_ident)
+        self.assertNotIn(principal, hilos)
+
+        usuario = crear_usuario()
+        proyecto = crear_proyecto(usuario)
+        asignar(usuario, proyecto)
+        crear_ingreso(proyecto)
+        self.client.force_login(usuario)
+        consultas = {}
+        with override_settings(METRICAS_CABECERAS=True):
+            for nombre in ('core:dashboard', 'core:dashboard_asincrono'):
+                cache.clear()
+                consultas[nombre] = int(self.client.get(reverse(nombre))['X-Consultas-SQL'])
+        # Las consultas de los hilos del pool también cuentan
+        self.assertEqual(consultas['core:dashboard_asincrono'], consultas['core:dashboard'])
+
+    # Cada hilo abre su conexión y los pragmas de SQLite cuentan en la primera petición
+    @override_settings(METRICAS_ESTRICTO=False)
+    def test_comparar_servidores(self):
+        generar_datos(usuarios=4, proyectos=2, miembros=2, ingresos=20, egresos=20, prefijo='CS')
+        with mock.patch.object(logging.getLogger('cortesec.metricas'), 'disabled', True):
+            reporte = comparar_servidores(peticiones=4, concurrencia=2)
+        for nombre in ('dashboard', 'ingresos'):
+            for servidor in ('wsgi', 'asgi'):
+                resultado = reporte['escenarios'][nombre][servidor]
+                self.assertEqual(resultado['peticiones'], 4)
+                self.assertEqual(resultado['errores'], 0)
+                self.assertLessEqual(resultado['p50_ms'], resultado['p99_ms'])
+        json.dumps(reporte)
@@ -1,11 +1,17 @@
 # core/urls.py
+from django.conf import settings
 from django.urls import path
 from . import views
 
 app_name = 'core'
 
 urlpatterns = [
-    path('', views.dashboard_view, name='dashboard'),
+    path(
+        '',
+        views.dashboard_view_async if settings.VISTAS_ASINCRONAS else views.dashboard_view,
+        name='dashboard',
+    ),
+    path('asincrono/', views.dashboard_view_async, name='dashboard_asincrono'),
     path('nosotros/', views.nosotros, name='nosotros'),
     path('caracteristicas/', views.caracteristicas, name='caracteristicas'),
     path('precios/', views.precios, name='precios'),
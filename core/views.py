@@ -1,18 +1,44 @@
+from django.contrib.auth.decorators import login_required
 from django.shortcuts import render
+from django.template.response import TemplateResponse
+
+from finanzas.tablero import aobtener_tablero, obtener_tablero
+from .middleware import presupuesto_consultas
 # Create your views here.
 # core/views.py
 
 
+@login_required
+@presupuesto_consultas(10)
 def dashboard_view(request):
     """
     Vista principal del sistema.
-    Muestra el panel de control con opciones para gestionar usuarios, roles y permisos.
+    Muestra el resumen financiero de los proyectos del usuario (ver
+    finanzas.tablero) y los accesos a las secciones principales.
     """
     context = {
-        'page_title': 'Dashboard - Corte-Sec'
+        'page_title': 'Dashboard - Corte-Sec',
+        'tablero': obtener_tablero(request.user),
     }
     return render(request, 'core/dashboard.html', context)
 
+
+@login_required
+@presupuesto_consultas(10)
+async def dashboard_view_async(request):
+    """
+    dashboard_view para el perfil ASGI: las consultas del tablero van en
+    paralelo (finanzas.tablero.acalcular_tablero).
+    """
+    # El resto (plantilla, context processors) usa request.user sin await
+    request.user = await request.auser()
+    context = {
+        'page_title': 'Dashboard - Corte-Sec',
+        'tablero': await aobtener_tablero(request.user),
+    }
+    # TemplateResponse: Django la renderiza fuera del event loop
+    return TemplateResponse(request, 'core/dashboard.html', context)
+
 def nosotros(request):
     return render(request, 'core/nosotros.html')
 
@@ -1,12 +1,20 @@
 # finanzas/admin.py
-from django.contrib import admin
-from django.utils import timezone
-from .models import Ingreso, Presupuesto, ProyeccionFlujoCaja
+from django.contrib import admin, messages
+from django.core.exceptions import ValidationError
+
+from core.admin import SelectRelatedAutomaticoMixin
+from proyectos.models import Project, ProjectTeam
+from .models import (
+    Ingreso, Egreso, Presupuesto, ProyeccionFlujoCaja, ResumenFinancieroProyecto,
+    AbonoIngreso, AbonoEgreso,
+)
+from .pagos import pagar_egresos, registrar_abonos_de_apertura
 
 
 # === Filtros personalizados ===
 
-class IngresoVencidoFilter(admin.SimpleListFilter):
+class MovimientoVencidoFilter(admin.SimpleListFilter):
+    """Para Ingreso y Egreso (ver MovimientoQuerySet)"""
     title = '¿Está vencido?'
     parameter_name = 'vencido'
 
@@ -17,17 +25,10 @@ class IngresoVencidoFilter(admin.SimpleListFilter):
         )
 
     def queryset(self, request, queryset):
-        today = timezone.now().date()
         if self.value() == 'si':
-            return queryset.filter(
-                estado__in=['pendiente', 'parcial'],
-                fecha_esperada__lt=today
-            )
+            return queryset.vencidos()
         if self.value() == 'no':
-            return queryset.exclude(
-                estado__in=['pendiente', 'parcial'],
-                fecha_esperada__lt=today
-            )
+            return queryset.no_vencidos()
         return queryset
 
 
@@ -43,16 +44,73 @@ class PresupuestoSobrepasadoFilter(admin.SimpleListFilter):
 
     def queryset(self, request, queryset):
         if self.value() == 'si':
-            return queryset.extra(where=["monto_gastado > monto_planeado"])
+            return queryset.sobrepresupuestados()
         if self.value() == 'no':
-            return queryset.extra(where=["monto_gastado <= monto_planeado"])
+            return queryset.dentro_del_presupuesto()
+        return queryset
+
+
+class UsoPresupuestoFilter(admin.SimpleListFilter):
+    """Rangos sobre la columna generada uso_porcentaje (indexada)"""
+    title = 'Uso del presupuesto'
+    parameter_name = 'uso'
+    rangos = {
+        'bajo': ('Menos del 50%', None, 50),
+        'medio': ('Entre 50% y 80%', 50, 80),
+        'alto': ('Entre 80% y 100%', 80, 100),
+        'excedido': ('Más del 100%', 100, None),
+    }
+
+    def lookups(self, request, model_admin):
+        return [(clave, etiqueta) for clave, (etiqueta, _, _) in self.rangos.items()]
+
+    def queryset(self, request, queryset):
+        if self.value() not in self.rangos:
+            return queryset
+        _, desde, hasta = self.rangos[self.value()]
+        if desde is not None:
+            queryset = queryset.filter(uso_porcentaje__gt=desde)
+        if hasta is not None:
+            queryset = queryset.filter(uso_porcentaje__lte=hasta)
         return queryset
 
 
 # === Registros en el Admin ===
 
+class CamposDePagoMixin:
+    """
+    Lo recibido/pagado solo se escribe al crear (queda como abono de
+    apertura); después cambia con cada abono registrado
+    """
+    campos_de_pago = ()
+
+    def get_readonly_fields(self, request, obj=None):
+        campos = super().get_readonly_fields(request, obj)
+        if obj is not None:
+            campos = [*campos, *self.campos_de_pago]
+        return campos
+
+    def save_model(self, request, obj, form, change):
+        super().save_model(request, obj, form, change)
+        if not change:
+            registrar_abonos_de_apertura([obj])
+
+
+class AbonoIngresoInline(admin.TabularInline):
+    """Historial de abonos; se registran desde la recepción del ingreso"""
+    model = AbonoIngreso
+    extra = 0
+    fields = ['fecha', 'monto', 'metodo_pago', 'numero_referencia', 'registrado_por', 'creado_en']
+    readonly_fields = fields
+    can_delete = False
+
+    def has_add_permission(self, request, obj=None):
+        return False
+
+
 @admin.register(Ingreso)
-class IngresoAdmin(admin.ModelAdmin):
+class IngresoAdmin(CamposDePagoMixin, SelectRelatedAutomaticoMixin, admin.ModelAdmin):
+    presupuesto_consultas = 12  # consultas del changelist, ver core.middleware
     list_display = [
         'proyecto',
         'concepto',
@@ -72,7 +130,7 @@ class IngresoAdmin(admin.ModelAdmin):
         'fecha_esperada',
         'fecha_recepcion',
         'proyecto__status',
-        IngresoVencidoFilter,  # ✅ Filtro personalizado
+        MovimientoVencidoFilter,  # ✅ Filtro personalizado
     ]
     search_fields = [
         'proyecto__name',
@@ -86,7 +144,9 @@ class IngresoAdmin(admin.ModelAdmin):
     date_hierarchy = 'fecha_esperada'
     ordering = ['-fecha_esperada', '-creado_en']
     readonly_fields = ['creado_en', 'actualizado_en', 'dias_vencidos']
+    campos_de_pago = ['monto_recibido', 'fecha_recepcion']
     autocomplete_fields = ['proyecto', 'creado_por', 'aprobado_por']
+    inlines = [AbonoIngresoInline]
 
     fieldsets = (
         ('Información General', {
@@ -109,22 +169,140 @@ class IngresoAdmin(admin.ModelAdmin):
     )
 
 
+class AbonoEgresoInline(admin.TabularInline):
+    """Historial de pagos; se registran desde el pago del egreso"""
+    model = AbonoEgreso
+    extra = 0
+    fields = ['fecha', 'monto', 'metodo_pago', 'numero_referencia', 'registrado_por', 'creado_en']
+    readonly_fields = fields
+    can_delete = False
+
+    def has_add_permission(self, request, obj=None):
+        return False
+
+
+@admin.register(Egreso)
+class EgresoAdmin(CamposDePagoMixin, SelectRelatedAutomaticoMixin, admin.ModelAdmin):
+    presupuesto_consultas = 12  # consultas del changelist, ver core.middleware
+    list_display = [
+        'proyecto',
+        'concepto',
+        'proveedor',
+        'tipo_egreso',
+        'monto_total',
+        'monto_pagado',
+        'estado',
+        'fecha_vencimiento',
+        'fecha_pago',
+        'esta_vencido',
+    ]
+    list_filter = [
+        'estado',
+        'tipo_egreso',
+        'metodo_pago',
+        'fecha_vencimiento',
+        'fecha_pago',
+        'proyecto__status',
+        MovimientoVencidoFilter,
+    ]
+    search_fields = [
+        'proyecto__name',
+        'proyecto__code',
+        'concepto',
+        'proveedor',
+        'nit_proveedor',
+        'numero_factura',
+        'numero_orden_compra',
+    ]
+    list_select_related = ['proyecto']
+    date_hierarchy = 'fecha_vencimiento'
+    ordering = ['-fecha_vencimiento', '-creado_en']
+    readonly_fields = ['creado_en', 'actualizado_en', 'dias_vencidos', 'monto_neto_pagar']
+    campos_de_pago = ['monto_pagado', 'fecha_pago']
+    autocomplete_fields = ['proyecto', 'presupuesto', 'creado_por', 'aprobado_por']
+    inlines = [AbonoEgresoInline]
+    actions = ['pagar_saldo']
+
+    fieldsets = (
+        ('Información General', {
+            'fields': ('proyecto', 'presupuesto', 'concepto', 'descripcion', 'tipo_egreso', 'notas')
+        }),
+        ('Proveedor', {
+            'fields': ('proveedor', 'nit_proveedor', 'cuenta_bancaria')
+        }),
+        ('Montos y Fechas', {
+            'fields': (
+                'monto_total', 'monto_pagado', 'retencion_iva', 'retencion_fuente', 'monto_neto_pagar',
+                'fecha_emision', 'fecha_vencimiento', 'fecha_pago',
+            )
+        }),
+        ('Estado y Pago', {
+            'fields': ('estado', 'metodo_pago')
+        }),
+        ('Documentación', {
+            'fields': ('numero_factura', 'numero_orden_compra', 'documento_soporte'),
+            'classes': ('collapse',)
+        }),
+        ('Auditoría', {
+            'fields': ('creado_por', 'aprobado_por', 'creado_en', 'actualizado_en', 'dias_vencidos'),
+            'classes': ('collapse',)
+        }),
+    )
+
+    def _proyectos_sin_aprobacion(self, request, queryset):
+        """Códigos de los proyectos seleccionados donde el usuario no aprueba pagos"""
+        if request.user.is_superadmin or request.user.is_superuser:
+            return []
+        aprobados = ProjectTeam.objects.filter(
+            user=request.user, is_active=True, can_approve_payments=True,
+        ).values('project_id')
+        return sorted(
+            Project.objects
+            .filter(pk__in=queryset.order_by().values('proyecto_id'))
+            .exclude(pk__in=aprobados)
+            .values_list('code', flat=True)
+        )
+
+    @admin.action(description='Pagar el saldo de los egresos seleccionados', permissions=['change'])
+    def pagar_saldo(self, request, queryset):
+        """Corrida de pagos: paga el saldo de los egresos seleccionados"""
+        sin_aprobacion = self._proyectos_sin_aprobacion(request, queryset)
+        if sin_aprobacion:
+            self.message_user(
+                request,
+                f'No tiene permiso para aprobar pagos en: {", ".join(sin_aprobacion)}. '
+                f'No se pagó ningún egreso.',
+                messages.ERROR,
+            )
+            return
+        try:
+            pagados, total = pagar_egresos(queryset, aprobado_por=request.user)
+        except ValidationError as e:
+            self.message_user(request, ' '.join(e.messages), messages.ERROR)
+            return
+        self.message_user(request, f'{pagados} egresos pagados por ${total:,.2f}', messages.SUCCESS)
+
+
 @admin.register(Presupuesto)
-class PresupuestoAdmin(admin.ModelAdmin):
+class PresupuestoAdmin(SelectRelatedAutomaticoMixin, admin.ModelAdmin):
+    presupuesto_consultas = 10  # consultas del changelist, ver core.middleware
     list_display = [
         'proyecto',
         'categoria',
         'monto_planeado',
         'monto_comprometido',
         'monto_gastado',
-        'porcentaje_uso',
-        'esta_sobrepresupuestado',
+        'disponible_display',
+        'uso_porcentaje',
+        'sobrepresupuestado_display',
     ]
     list_filter = [
         'categoria',
         'proyecto__status',
         PresupuestoSobrepasadoFilter,  # ✅ Filtro personalizado
+        UsoPresupuestoFilter,
     ]
+    list_select_related = ['proyecto']
     search_fields = [
         'proyecto__name',
         'proyecto__code',
@@ -132,7 +310,11 @@ class PresupuestoAdmin(admin.ModelAdmin):
         'descripcion',
     ]
     ordering = ['proyecto', 'categoria']
-    readonly_fields = ['creado_en', 'actualizado_en', 'porcentaje_uso', 'monto_disponible']
+    # Comprometido y gastado se derivan de los egresos (finanzas.presupuestos)
+    readonly_fields = [
+        'monto_comprometido', 'monto_gastado', 'creado_en', 'actualizado_en',
+        'porcentaje_uso', 'monto_disponible',
+    ]
     autocomplete_fields = ['proyecto', 'creado_por']
 
     fieldsets = (
@@ -151,9 +333,24 @@ class PresupuestoAdmin(admin.ModelAdmin):
         }),
     )
 
+    def get_queryset(self, request):
+        # Columnas calculadas en SQL para poder ordenar por ellas
+        return super().get_queryset(request).con_uso()
+
+    def disponible_display(self, obj):
+        return obj.disponible
+    disponible_display.short_description = 'Disponible'
+    disponible_display.admin_order_field = 'disponible'
+
+    def sobrepresupuestado_display(self, obj):
+        return obj.sobrepresupuestado
+    sobrepresupuestado_display.short_description = '¿Sobrepresupuestado?'
+    sobrepresupuestado_display.admin_order_field = 'sobrepresupuestado'
+    sobrepresupuestado_display.boolean = True
+
 
 @admin.register(ProyeccionFlujoCaja)
-class ProyeccionFlujoCajaAdmin(admin.ModelAdmin):
+class ProyeccionFlujoCajaAdmin(SelectRelatedAutomaticoMixin, admin.ModelAdmin):
     list_display = [
         'proyecto',
         'mes',
@@ -204,4 +401,32 @@ class ProyeccionFlujoCajaAdmin(admin.ModelAdmin):
             'fields': ('creado_en', 'actualizado_en'),
             'classes': ('collapse',)
         }),
-    )
\ No newline at end of file
+    )
+
+
+@admin.register(ResumenFinancieroProyecto)
+class ResumenFinancieroProyectoAdmin(SelectRelatedAutomaticoMixin, admin.ModelAdmin):
+    list_display = [
+        'proyecto',
+        'ingresos_total',
+        'ingresos_recibido',
+        'ingresos_pendiente',
+        'ingresos_vencido',
+        'egresos_total',
+        'egresos_pagado',
+        'egresos_pendiente',
+        'egresos_vencido',
+        'actualizado_en',
+    ]
+    list_select_related = ['proyecto']
+    search_fields = [
+        'proyecto__name',
+        'proyecto__code',
+    ]
+
+    # Se mantiene automáticamente; ver comando reconstruir_resumen_financiero
+    def has_add_permission(self, request):
+        return False
+
+    def has_change_permission(self, request, obj=None):
+        return False
@@ -0,0 +1,216 @@
+# finanzas/exportacion.py
+"""
+Exportación en streaming de ingresos a CSV y XLSX.
+
+Las filas se leen con values_list().iterator(chunk_size) (sin instancias de
+modelo) y se envían por bloques a medida que llegan de la base de datos: la
+memoria no depende del número de filas y el encabezado sale antes de que la
+consulta termine.
+
+El XLSX se escribe a mano (un zip con la hoja en XML) porque zipfile puede
+escribir sobre un flujo sin seek; así no hace falta armar el libro completo
+en memoria ni depender de openpyxl.
+
+Las columnas usan los mismos nombres que la importación (finanzas.importacion),
+de modo que un archivo exportado se puede volver a importar.
+"""
+import csv
+import io
+import re
+import zipfile
+from datetime import date, datetime
+from decimal import Decimal
+from itertools import islice
+from xml.sax.saxutils import escape
+
+from django.utils import timezone
+
+TAMAÑO_BLOQUE = 2000
+
+# (encabezado, lookup de values_list)
+COLUMNAS_INGRESOS = [
+    ('id', 'id'),
+    ('proyecto', 'proyecto__code'),
+    ('concepto', 'concepto'),
+    ('tipo_ingreso', 'tipo_ingreso'),
+    ('monto_total', 'monto_total'),
+    ('monto_recibido', 'monto_recibido'),
+    ('fecha_esperada', 'fecha_esperada'),
+    ('fecha_recepcion', 'fecha_recepcion'),
+    ('estado', 'estado'),
+    ('metodo_pago', 'metodo_pago'),
+    ('numero_referencia', 'numero_referencia'),
+    ('cuenta_bancaria', 'cuenta_bancaria'),
+    ('relacionado_con_avance', 'relacionado_con_avance'),
+    ('porcentaje_avance', 'porcentaje_avance'),
+    ('descripcion', 'descripcion'),
+    ('notas', 'notas'),
+]
+
+
+def _bloques(queryset, columnas, chunk_size):
+    """Tuplas de valores en listas de hasta chunk_size filas"""
+    filas = queryset.values_list(*[lookup for _, lookup in columnas]).iterator(chunk_size=chunk_size)
+    while True:
+        bloque = list(islice(filas, chunk_size))
+        if not bloque:
+            return
+        yield bloque
+
+
+# --- CSV ---
+
+def generar_csv(queryset, columnas, chunk_size=TAMAÑO_BLOQUE):
+    """Bytes UTF-8 (con BOM, para Excel) del CSV, un bloque por iteración"""
+    buffer = io.StringIO()
+    escritor = csv.writer(buffer)
+
+    def vaciar():
+        texto = buffer.getvalue()
+        buffer.seek(0)
+        buffer.truncate()
+        return texto.encode('utf-8')
+
+    escritor.writerow([encabezado for encabezado, _ in columnas])
+    yield b'\xef\xbb\xbf' + vaciar()
+
+    for bloque in _bloques(queryset, columnas, chunk_size):
+        escritor.writerows(bloque)
+        yield vaciar()
+
+
+# --- XLSX ---
+
+CONTENT_TYPES = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+    '<Types xmlns="http://schemas.openxmlformats.org/package/2006/content-types">'
+    '<Default Extension="rels" ContentType="application/vnd.openxmlformats-package.relationships+xml"/>'
+    '<Default Extension="xml" ContentType="application/xml"/>'
+    '<Override PartName="/xl/workbook.xml" '
+    'ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet.main+xml"/>'
+    '<Override PartName="/xl/worksheets/sheet1.xml" '
+    'ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.worksheet+xml"/>'
+    '<Override PartName="/xl/styles.xml" '
+    'ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.styles+xml"/>'
+    '</Types>'
+)
+
+RELS = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+    '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+    '<Relationship Id="rId1" '
+    'Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/officeDocument" '
+    'Target="xl/workbook.xml"/>'
+    '</Relationships>'
+)
+
+WORKBOOK = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+    '<workbook xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main" '
+    'xmlns:r="http://schemas.openxmlformats.org/officeDocument/2006/relationships">'
+    '<sheets><sheet name="{hoja}" sheetId="1" r:id="rId1"/></sheets>'
+    '</workbook>'
+)
+
+WORKBOOK_RELS = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+    '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+    '<Relationship Id="rId1" '
+    'Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/worksheet" '
+    'Target="worksheets/sheet1.xml"/>'
+    '<Relationship Id="rId2" '
+    'Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/styles" '
+    'Target="styles.xml"/>'
+    '</Relationships>'
+)
+
+# Estilo 0: general; 1: fecha (numFmt 14); 2: fecha y hora (numFmt 22)
+STYLES = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+    '<styleSheet xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main">'
+    '<fonts count="1"><font><sz val="11"/><name val="Calibri"/></font></fonts>'
+    '<fills count="1"><fill><patternFill patternType="none"/></fill></fills>'
+    '<borders count="1"><border/></borders>'
+    '<cellStyleXfs count="1"><xf numFmtId="0" fontId="0" fillId="0" borderId="0"/></cellStyleXfs>'
+    '<cellXfs count="3">'
+    '<xf numFmtId="0" fontId="0" fillId="0" borderId="0" xfId="0"/>'
+    '<xf numFmtId="14" fontId="0" fillId="0" borderId="0" xfId="0" applyNumberFormat="1"/>'
+    '<xf numFmtId="22" fontId="0" fillId="0" borderId="0" xfId="0" applyNumberFormat="1"/>'
+    '</cellXfs>'
+    '</styleSheet>'
+)
+
+INICIO_HOJA = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+    '<worksheet xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main"><sheetData>'
+)
+FIN_HOJA = '</sheetData></worksheet>'
+
+EPOCA_EXCEL = date(1899, 12, 30)
+CARACTERES_INVALIDOS = re.compile('[\x00-\x08\x0b\x0c\x0e-\x1f]')
+
+
+def _celda(valor):
+    if valor is None or valor == '':
+        return '<c/>'
+    if isinstance(valor, bool):
+        return f'<c t="b"><v>{int(valor)}</v></c>'
+    if isinstance(valor, (int, float, Decimal)):
+        return f'<c><v>{valor}</v></c>'
+    if isinstance(valor, datetime):
+        if timezone.is_aware(valor):
+            valor = timezone.make_naive(valor)
+        dias = (valor - datetime(1899, 12, 30)).total_seconds() / 86400
+        return f'<c s="2"><v>{dias}</v></c>'
+    if isinstance(valor, date):
+        return f'<c s="1"><v>{(valor - EPOCA_EXCEL).days}</v></c>'
+    texto = escape(CARACTERES_INVALIDOS.sub('', str(valor)))
+    return f'<c t="inlineStr"><is><t xml:space="preserve">{texto}</t></is></c>'
+
+
+def _fila(valores):
+    return '<row>' + ''.join(_celda(valor) for valor in valores) + '</row>'
+
+
+class _Salida(io.RawIOBase):
+    """Destino sin seek para zipfile; acumula lo escrito hasta que se vacía"""
+
+    def __init__(self):
+        self.partes = []
+
+    def writable(self):
+        return True
+
+    def write(self, datos):
+        self.partes.append(bytes(datos))
+        return len(datos)
+
+    def vaciar(self):
+        datos = b''.join(self.partes)
+        self.partes = []
+        return datos
+
+
+def generar_xlsx(queryset, columnas, hoja='Datos', chunk_size=TAMAÑO_BLOQUE):
+    """Bytes del libro XLSX, un bloque por iteración"""
+    salida = _Salida()
+    with zipfile.ZipFile(salida, 'w', compression=zipfile.ZIP_DEFLATED) as libro:
+        libro.writestr('[Content_Types].xml', CONTENT_TYPES)
+        libro.writestr('_rels/.rels', RELS)
+        libro.writestr('xl/workbook.xml', WORKBOOK.format(hoja=escape(hoja)))
+        libro.writestr('xl/_rels/workbook.xml.rels', WORKBOOK_RELS)
+        libro.writestr('xl/styles.xml', STYLES)
+
+        with libro.open('xl/worksheets/sheet1.xml', 'w', force_zip64=True) as hoja_xml:
+            hoja_xml.write((INICIO_HOJA + _fila(encabezado for encabezado, _ in columnas)).encode())
+            yield salida.vaciar()
+
+            for bloque in _bloques(queryset, columnas, chunk_size):
+                hoja_xml.write(''.join(_fila(valores) for valores in bloque).encode())
+                # El compresor retiene datos; solo se envía lo que ya salió
+                datos = salida.vaciar()
+                if datos:
+                    yield datos
+
+            hoja_xml.write(FIN_HOJA.encode())
+    yield salida.vaciar()
@@ -1,9 +1,14 @@
 # finanzas/forms.py
 from django import forms
 from django.core.exceptions import ValidationError
+from django.db import transaction
 from django.utils import timezone
+from datetime import date
 from decimal import Decimal
-from .models import Ingreso
+from proyectos.acceso import proyectos_accesibles
+from proyectos.models import Project
+from .models import Ingreso, Egreso, Presupuesto
+from .pagos import registrar_abonos_de_apertura, registrar_recepcion, registrar_pago
 
 
 class IngresoForm(forms.ModelForm):
@@ -133,6 +138,9 @@ class IngresoForm(forms.ModelForm):
             'documento_soporte': 'Formatos permitidos: PDF, JPG, PNG, DOC, DOCX',
         }
     
+    # Solo editables al crear; luego cambian con pagos.registrar_*
+    campos_de_pago = ('monto_recibido', 'fecha_recepcion')
+    
     def __init__(self, *args, **kwargs):
         self.user = kwargs.pop('user', None)
         super().__init__(*args, **kwargs)
@@ -141,13 +149,17 @@ class IngresoForm(forms.ModelForm):
         if not self.instance.pk:
             self.fields['monto_recibido'].initial = 0
             self.fields['estado'].initial = 'pendiente'
+        else:
+            # Los pagos posteriores van por 'Registrar recepción' (un abono cada uno)
+            for campo in self.campos_de_pago:
+                self.fields[campo].disabled = True
+                self.fields[campo].help_text = 'Se actualiza al registrar un pago'
         
         # Si el usuario tiene proyectos específicos, filtrar
-        if self.user and hasattr(self.user, 'project_assignments'):
+        if self.user and self.user.is_authenticated:
             self.fields['proyecto'].queryset = self.fields['proyecto'].queryset.filter(
-                team_members__user=self.user,
-                team_members__is_active=True
-            ).distinct()
+                pk__in=proyectos_accesibles(self.user)
+            )
     
     def clean_monto_total(self):
         """Validar que el monto total sea positivo"""
@@ -257,11 +269,324 @@ class IngresoForm(forms.ModelForm):
             ingreso.creado_por = self.user
         
         if commit:
-            ingreso.save()
+            with transaction.atomic():
+                if ingreso._state.adding:
+                    ingreso.save()
+                    # Lo que ya trae recibido queda en el historial de abonos
+                    registrar_abonos_de_apertura([ingreso])
+                else:
+                    # Sin los campos de pago: no pisar abonos registrados mientras se editaba
+                    ingreso.save(update_fields=[
+                        campo for campo in self.fields if campo not in self.campos_de_pago
+                    ] + ['actualizado_en'])
         
         return ingreso
 
 
+class EgresoForm(forms.ModelForm):
+    """
+    Formulario para crear y editar egresos
+    """
+    
+    class Meta:
+        model = Egreso
+        fields = [
+            'proyecto',
+            'presupuesto',
+            'concepto',
+            'descripcion',
+            'tipo_egreso',
+            'proveedor',
+            'nit_proveedor',
+            'monto_total',
+            'monto_pagado',
+            'fecha_emision',
+            'fecha_vencimiento',
+            'fecha_pago',
+            'estado',
+            'metodo_pago',
+            'numero_factura',
+            'numero_orden_compra',
+            'cuenta_bancaria',
+            'documento_soporte',
+            'retencion_iva',
+            'retencion_fuente',
+            'notas',
+        ]
+        
+        widgets = {
+            'proyecto': forms.Select(attrs={
+                'class': 'form-control',
+                'required': True,
+            }),
+            'presupuesto': forms.Select(attrs={
+                'class': 'form-control',
+            }),
+            'concepto': forms.TextInput(attrs={
+                'class': 'form-control',
+                'placeholder': 'Ej: Compra de cemento - Bodega norte',
+                'maxlength': 200,
+            }),
+            'descripcion': forms.Textarea(attrs={
+                'class': 'form-control',
+                'placeholder': 'Descripción detallada del egreso...',
+                'rows': 3,
+            }),
+            'tipo_egreso': forms.Select(attrs={
+                'class': 'form-control',
+            }),
+            'proveedor': forms.TextInput(attrs={
+                'class': 'form-control',
+                'placeholder': 'Nombre del proveedor o beneficiario',
+                'maxlength': 200,
+            }),
+            'nit_proveedor': forms.TextInput(attrs={
+                'class': 'form-control',
+                'placeholder': 'Ej: 900.123.456-7',
+                'maxlength': 50,
+            }),
+            'monto_total': forms.NumberInput(attrs={
+                'class': 'form-control',
+                'placeholder': '0.00',
+                'step': '0.01',
+                'min': '0',
+            }),
+            'monto_pagado': forms.NumberInput(attrs={
+                'class': 'form-control',
+                'placeholder': '0.00',
+                'step': '0.01',
+                'min': '0',
+            }),
+            'fecha_emision': forms.DateInput(attrs={
+                'class': 'form-control',
+                'type': 'date',
+            }),
+            'fecha_vencimiento': forms.DateInput(attrs={
+                'class': 'form-control',
+                'type': 'date',
+            }),
+            'fecha_pago': forms.DateInput(attrs={
+                'class': 'form-control',
+                'type': 'date',
+            }),
+            'estado': forms.Select(attrs={
+                'class': 'form-control',
+            }),
+            'metodo_pago': forms.Select(attrs={
+                'class': 'form-control',
+            }),
+            'numero_factura': forms.TextInput(attrs={
+                'class': 'form-control',
+                'placeholder': 'Ej: FV-2024-001',
+                'maxlength': 100,
+            }),
+            'numero_orden_compra': forms.TextInput(attrs={
+                'class': 'form-control',
+                'placeholder': 'Ej: OC-2024-001',
+                'maxlength': 100,
+            }),
+            'cuenta_bancaria': forms.TextInput(attrs={
+                'class': 'form-control',
+                'placeholder': 'Cuenta del proveedor',
+                'maxlength': 100,
+            }),
+            'documento_soporte': forms.FileInput(attrs={
+                'class': 'form-control',
+                'accept': '.pdf,.jpg,.jpeg,.png,.doc,.docx',
+            }),
+            'retencion_iva': forms.NumberInput(attrs={
+                'class': 'form-control',
+                'placeholder': '0.00',
+                'step': '0.01',
+                'min': '0',
+            }),
+            'retencion_fuente': forms.NumberInput(attrs={
+                'class': 'form-control',
+                'placeholder': '0.00',
+                'step': '0.01',
+                'min': '0',
+            }),
+            'notas': forms.Textarea(attrs={
+                'class': 'form-control',
+                'placeholder': 'Notas adicionales u observaciones...',
+                'rows': 3,
+            }),
+        }
+        
+        labels = {
+            'proyecto': 'Proyecto *',
+            'presupuesto': 'Presupuesto',
+            'concepto': 'Concepto *',
+            'descripcion': 'Descripción',
+            'tipo_egreso': 'Tipo de Egreso *',
+            'proveedor': 'Proveedor/Beneficiario *',
+            'nit_proveedor': 'NIT/RUT',
+            'monto_total': 'Monto Total ($) *',
+            'monto_pagado': 'Monto Pagado ($)',
+            'fecha_emision': 'Fecha de Emisión *',
+            'fecha_vencimiento': 'Fecha de Vencimiento *',
+            'fecha_pago': 'Fecha de Pago',
+            'estado': 'Estado *',
+            'metodo_pago': 'Método de Pago',
+            'numero_factura': 'Número de Factura',
+            'numero_orden_compra': 'Orden de Compra',
+            'cuenta_bancaria': 'Cuenta Bancaria',
+            'documento_soporte': 'Documento de Soporte',
+            'retencion_iva': 'Retención IVA ($)',
+            'retencion_fuente': 'Retención en la Fuente ($)',
+            'notas': 'Notas Adicionales',
+        }
+        
+        help_texts = {
+            'monto_pagado': 'Dejar en 0 si aún no se ha pagado',
+            'fecha_pago': 'Solo llenar cuando se realice el pago',
+            'documento_soporte': 'Formatos permitidos: PDF, JPG, PNG, DOC, DOCX',
+        }
+    
+    # Solo editables al crear; luego cambian con pagos.registrar_*
+    campos_de_pago = ('monto_pagado', 'fecha_pago')
+    
+    def __init__(self, *args, **kwargs):
+        self.user = kwargs.pop('user', None)
+        super().__init__(*args, **kwargs)
+        
+        if not self.instance.pk:
+            self.fields['monto_pagado'].initial = 0
+            self.fields['estado'].initial = 'pendiente'
+        else:
+            # Los pagos posteriores van por 'Registrar pago' (un abono cada uno)
+            for campo in self.campos_de_pago:
+                self.fields[campo].disabled = True
+                self.fields[campo].help_text = 'Se actualiza al registrar un pago'
+        
+        # Solo proyectos (y sus presupuestos) donde el usuario es miembro
+        if self.user and self.user.is_authenticated:
+            accesibles = proyectos_accesibles(self.user)
+            self.fields['proyecto'].queryset = self.fields['proyecto'].queryset.filter(
+                pk__in=accesibles
+            )
+            self.fields['presupuesto'].queryset = Presupuesto.objects.filter(
+                proyecto_id__in=accesibles
+            ).select_related('proyecto')
+    
+    def clean_monto_total(self):
+        """Validar que el monto total sea positivo"""
+        monto = self.cleaned_data.get('monto_total')
+        if monto is not None and monto <= 0:
+            raise ValidationError('El monto total debe ser mayor a 0')
+        return monto
+    
+    def clean_monto_pagado(self):
+        """Validar que el monto pagado no sea mayor al total"""
+        monto_pagado = self.cleaned_data.get('monto_pagado')
+        monto_total = self.cleaned_data.get('monto_total')
+        
+        if monto_pagado is not None and monto_pagado < 0:
+            raise ValidationError('El monto pagado no puede ser negativo')
+        
+        if monto_total and monto_pagado and monto_pagado > monto_total:
+            raise ValidationError(
+                f'El monto pagado (${monto_pagado}) no puede ser mayor '
+                f'al monto total (${monto_total})'
+            )
+        
+        return monto_pagado
+    
+    def clean_fecha_vencimiento(self):
+        """La fecha de vencimiento no puede ser anterior a la emisión"""
+        fecha_vencimiento = self.cleaned_data.get('fecha_vencimiento')
+        fecha_emision = self.cleaned_data.get('fecha_emision')
+        
+        if fecha_vencimiento and fecha_emision and fecha_vencimiento < fecha_emision:
+            raise ValidationError(
+                'La fecha de vencimiento no puede ser anterior a la fecha de emisión'
+            )
+        
+        return fecha_vencimiento
+    
+    def clean_fecha_pago(self):
+        """Validar fecha de pago"""
+        fecha_pago = self.cleaned_data.get('fecha_pago')
+        estado = self.cleaned_data.get('estado')
+        
+        if estado in ['pagado', 'parcial'] and not fecha_pago:
+            raise ValidationError(
+                'Debe especificar la fecha de pago cuando el estado es "Pagado" o "Parcial"'
+            )
+        
+        return fecha_pago
+    
+    def clean_metodo_pago(self):
+        """Validar método de pago"""
+        metodo = self.cleaned_data.get('metodo_pago')
+        estado = self.cleaned_data.get('estado')
+        
+        if estado == 'pagado' and not metodo:
+            raise ValidationError(
+                'Debe especificar el método de pago cuando el estado es "Pagado"'
+            )
+        
+        return metodo
+    
+    def clean(self):
+        """Validaciones generales del formulario"""
+        cleaned_data = super().clean()
+        estado = cleaned_data.get('estado')
+        monto_pagado = cleaned_data.get('monto_pagado') or 0
+        monto_total = cleaned_data.get('monto_total') or 0
+        proyecto = cleaned_data.get('proyecto')
+        presupuesto = cleaned_data.get('presupuesto')
+        
+        if presupuesto and proyecto and presupuesto.proyecto_id != proyecto.pk:
+            self.add_error('presupuesto', 'El presupuesto no pertenece al proyecto seleccionado')
+        
+        retenciones = (cleaned_data.get('retencion_iva') or 0) + (cleaned_data.get('retencion_fuente') or 0)
+        if monto_total and retenciones > monto_total:
+            raise ValidationError('Las retenciones no pueden superar el monto total.')
+        
+        # Validar consistencia entre estado y montos
+        if estado == 'pagado' and monto_pagado < monto_total:
+            raise ValidationError(
+                'El estado no puede ser "Pagado" si el monto pagado es menor al total. '
+                'Use "Parcial" en su lugar.'
+            )
+        
+        if estado == 'parcial' and (monto_pagado == 0 or monto_pagado >= monto_total):
+            raise ValidationError(
+                'El estado "Parcial" requiere que el monto pagado sea mayor a 0 '
+                'y menor al monto total.'
+            )
+        
+        if estado == 'pendiente' and monto_pagado > 0:
+            raise ValidationError(
+                'El estado no puede ser "Pendiente" si ya se pagó algún monto. '
+                'Use "Parcial" en su lugar.'
+            )
+        
+        return cleaned_data
+    
+    def save(self, commit=True):
+        """Guardar el egreso y asignar el usuario que lo creó"""
+        egreso = super().save(commit=False)
+        
+        if not egreso.pk and self.user:
+            egreso.creado_por = self.user
+        
+        if commit:
+            with transaction.atomic():
+                if egreso._state.adding:
+                    egreso.save()
+                    # Lo que ya trae pagado queda en el historial de abonos
+                    registrar_abonos_de_apertura([egreso])
+                else:
+                    # Sin los campos de pago: no pisar abonos registrados mientras se editaba
+                    egreso.save(update_fields=[
+                        campo for campo in self.fields if campo not in self.campos_de_pago
+                    ] + ['actualizado_en'])
+        
+        return egreso
+
+
 class IngresoRecepcionForm(forms.ModelForm):
     """
     Formulario simplificado para marcar un ingreso como recibido
@@ -359,28 +684,42 @@ class IngresoRecepcionForm(forms.ModelForm):
         return monto_nuevo
     
     def save(self, commit=True):
-        """Guardar y actualizar el estado automáticamente"""
+        """
+        Registrar el pago con un UPDATE atómico (monto_recibido = monto_recibido + X)
+        en lugar de sumar en Python y reescribir la fila completa
+        """
         ingreso = super().save(commit=False)
+        monto_nuevo = self.cleaned_data.get('monto_recibido')
         
-        # Actualizar el monto recibido acumulado
-        if self.instance.pk:
-            monto_nuevo = self.cleaned_data.get('monto_recibido')
-            ingreso.monto_recibido = self.instance.monto_recibido + monto_nuevo
-        
-        # Actualizar el estado basado en el monto
-        if ingreso.esta_completamente_recibido:
-            ingreso.estado = 'recibido'
-        elif ingreso.monto_recibido > 0:
-            ingreso.estado = 'parcial'
-        
-        # Asignar quien aprobó
-        if self.user:
-            ingreso.aprobado_por = self.user
+        if not commit:
+            # Solo en memoria: reflejar el acumulado esperado
+            ingreso.monto_recibido = (ingreso.valor_original('monto_recibido') or 0) + monto_nuevo
+            if ingreso.esta_completamente_recibido:
+                ingreso.estado = 'recibido'
+            elif ingreso.monto_recibido > 0:
+                ingreso.estado = 'parcial'
+            if self.user:
+                ingreso.aprobado_por = self.user
+            return ingreso
         
-        if commit:
-            ingreso.save()
+        # Datos del comprobante en el mismo UPDATE del pago
+        campos = {
+            campo: self.cleaned_data.get(campo)
+            for campo in ('numero_referencia', 'cuenta_bancaria', 'notas')
+        }
+        if 'documento_soporte' in self.changed_data:
+            # Guarda el archivo en el storage igual que lo haría save()
+            campo_documento = Ingreso._meta.get_field('documento_soporte')
+            campos['documento_soporte'] = campo_documento.pre_save(ingreso, add=False)
         
-        return ingreso
+        return registrar_recepcion(
+            ingreso,
+            monto_nuevo,
+            fecha=self.cleaned_data.get('fecha_recepcion'),
+            metodo_pago=self.cleaned_data.get('metodo_pago'),
+            aprobado_por=self.user,
+            **campos
+        )
 
 
 class IngresoFilterForm(forms.Form):
@@ -437,11 +776,350 @@ class IngresoFilterForm(forms.Form):
         super().__init__(*args, **kwargs)
         
         # Configurar queryset de proyectos
-        from proyectos.models import Project
-        if user and hasattr(user, 'project_assignments'):
+        if user and user.is_authenticated:
             self.fields['proyecto'].queryset = Project.objects.filter(
-                team_members__user=user,
-                team_members__is_active=True
-            ).distinct()
+                pk__in=proyectos_accesibles(user)
+            )
         else:
-            self.fields['proyecto'].queryset = Project.objects.all()
\ No newline at end of file
+            self.fields['proyecto'].queryset = Project.objects.all()
+    
+    def filtrar(self, queryset):
+        """Aplica los filtros válidos al queryset de ingresos"""
+        if not self.is_valid():
+            return queryset
+        
+        datos = self.cleaned_data
+        if datos.get('proyecto'):
+            queryset = queryset.filter(proyecto=datos['proyecto'])
+        if datos.get('tipo_ingreso'):
+            queryset = queryset.filter(tipo_ingreso=datos['tipo_ingreso'])
+        if datos.get('estado'):
+            queryset = queryset.filter(estado=datos['estado'])
+        if datos.get('fecha_desde'):
+            queryset = queryset.filter(fecha_esperada__gte=datos['fecha_desde'])
+        if datos.get('fecha_hasta'):
+            queryset = queryset.filter(fecha_esperada__lte=datos['fecha_hasta'])
+        if datos.get('solo_vencidos'):
+            queryset = queryset.vencidos()
+        return queryset
+
+
+class EgresoPagoForm(forms.ModelForm):
+    """
+    Formulario simplificado para registrar el pago de un egreso
+    """
+    
+    class Meta:
+        model = Egreso
+        fields = [
+            'monto_pagado',
+            'fecha_pago',
+            'metodo_pago',
+            'cuenta_bancaria',
+            'documento_soporte',
+            'notas',
+        ]
+        
+        widgets = {
+            'monto_pagado': forms.NumberInput(attrs={
+                'class': 'form-control',
+                'step': '0.01',
+                'min': '0',
+                'required': True,
+            }),
+            'fecha_pago': forms.DateInput(attrs={
+                'class': 'form-control',
+                'type': 'date',
+                'required': True,
+            }),
+            'metodo_pago': forms.Select(attrs={
+                'class': 'form-control',
+                'required': True,
+            }),
+            'cuenta_bancaria': forms.TextInput(attrs={
+                'class': 'form-control',
+                'placeholder': 'Cuenta del proveedor',
+            }),
+            'documento_soporte': forms.FileInput(attrs={
+                'class': 'form-control',
+            }),
+            'notas': forms.Textarea(attrs={
+                'class': 'form-control',
+                'rows': 3,
+                'placeholder': 'Observaciones sobre el pago realizado...',
+            }),
+        }
+        
+        labels = {
+            'monto_pagado': 'Monto Pagado ($) *',
+            'fecha_pago': 'Fecha de Pago *',
+            'metodo_pago': 'Método de Pago *',
+            'cuenta_bancaria': 'Cuenta Bancaria',
+            'documento_soporte': 'Comprobante de Pago',
+            'notas': 'Notas',
+        }
+    
+    def __init__(self, *args, **kwargs):
+        self.user = kwargs.pop('user', None)
+        super().__init__(*args, **kwargs)
+        
+        if not self.instance.fecha_pago:
+            self.fields['fecha_pago'].initial = timezone.now().date()
+        
+        if self.instance.pk:
+            self.fields['monto_pagado'].help_text = (
+                f'Monto pendiente: ${self.instance.monto_pendiente:,.2f}'
+            )
+    
+    def clean_monto_pagado(self):
+        """Validar que el monto no exceda el pendiente"""
+        monto_nuevo = self.cleaned_data.get('monto_pagado')
+        if not monto_nuevo:
+            raise ValidationError('Debe ingresar el monto pagado')
+        
+        if self.instance.pk and self.instance.monto_pagado + monto_nuevo > self.instance.monto_total:
+            raise ValidationError(
+                f'El monto ingresado (${monto_nuevo:,.2f}) excede el monto pendiente '
+                f'(${self.instance.monto_pendiente:,.2f}).'
+            )
+        
+        return monto_nuevo
+    
+    def save(self, commit=True):
+        """
+        Registrar el pago con UPDATEs atómicos sobre el egreso y su
+        presupuesto (ver finanzas.pagos.registrar_pago)
+        """
+        egreso = super().save(commit=False)
+        monto_nuevo = self.cleaned_data.get('monto_pagado')
+        
+        if not commit:
+            egreso.monto_pagado = (egreso.valor_original('monto_pagado') or 0) + monto_nuevo
+            if egreso.esta_completamente_pagado:
+                egreso.estado = 'pagado'
+            elif egreso.monto_pagado > 0:
+                egreso.estado = 'parcial'
+            if self.user:
+                egreso.aprobado_por = self.user
+            return egreso
+        
+        campos = {
+            campo: self.cleaned_data.get(campo)
+            for campo in ('cuenta_bancaria', 'notas')
+        }
+        if 'documento_soporte' in self.changed_data:
+            campo_documento = Egreso._meta.get_field('documento_soporte')
+            campos['documento_soporte'] = campo_documento.pre_save(egreso, add=False)
+        
+        return registrar_pago(
+            egreso,
+            monto_nuevo,
+            fecha=self.cleaned_data.get('fecha_pago'),
+            metodo_pago=self.cleaned_data.get('metodo_pago'),
+            aprobado_por=self.user,
+            **campos
+        )
+
+
+class EgresoFilterForm(forms.Form):
+    """
+    Formulario para filtrar egresos. Cada filtro usa una columna indexada
+    (tipo_egreso, proveedor, estado + fecha_vencimiento)
+    """
+    proyecto = forms.ModelChoiceField(
+        queryset=None,
+        required=False,
+        empty_label="Todos los proyectos",
+        widget=forms.Select(attrs={'class': 'form-control'})
+    )
+    
+    tipo_egreso = forms.ChoiceField(
+        choices=[('', 'Todos los tipos')] + Egreso.TIPO_EGRESO,
+        required=False,
+        widget=forms.Select(attrs={'class': 'form-control'})
+    )
+    
+    estado = forms.ChoiceField(
+        choices=[('', 'Todos los estados')] + Egreso.ESTADO_PAGO,
+        required=False,
+        widget=forms.Select(attrs={'class': 'form-control'})
+    )
+    
+    proveedor = forms.CharField(
+        required=False,
+        widget=forms.TextInput(attrs={
+            'class': 'form-control',
+            'placeholder': 'Proveedor (nombre exacto)'
+        })
+    )
+    
+    fecha_desde = forms.DateField(
+        required=False,
+        widget=forms.DateInput(attrs={
+            'class': 'form-control',
+            'type': 'date',
+            'placeholder': 'Desde'
+        }),
+        label='Vence desde'
+    )
+    
+    fecha_hasta = forms.DateField(
+        required=False,
+        widget=forms.DateInput(attrs={
+            'class': 'form-control',
+            'type': 'date',
+            'placeholder': 'Hasta'
+        }),
+        label='Vence hasta'
+    )
+    
+    solo_vencidos = forms.BooleanField(
+        required=False,
+        widget=forms.CheckboxInput(attrs={'class': 'form-check-input'}),
+        label='Solo mostrar vencidos'
+    )
+    
+    def __init__(self, *args, **kwargs):
+        user = kwargs.pop('user', None)
+        super().__init__(*args, **kwargs)
+        
+        if user and user.is_authenticated:
+            self.fields['proyecto'].queryset = Project.objects.filter(
+                pk__in=proyectos_accesibles(user)
+            )
+        else:
+            self.fields['proyecto'].queryset = Project.objects.all()
+    
+    def filtrar(self, queryset):
+        """Aplica los filtros válidos al queryset de egresos"""
+        if not self.is_valid():
+            return queryset
+        
+        datos = self.cleaned_data
+        if datos.get('proyecto'):
+            queryset = queryset.filter(proyecto=datos['proyecto'])
+        if datos.get('tipo_egreso'):
+            queryset = queryset.filter(tipo_egreso=datos['tipo_egreso'])
+        if datos.get('estado'):
+            queryset = queryset.filter(estado=datos['estado'])
+        if datos.get('proveedor'):
+            # Igualdad (no icontains) para aprovechar el índice de proveedor
+            queryset = queryset.filter(proveedor=datos['proveedor'].strip())
+        if datos.get('fecha_desde'):
+            queryset = queryset.filter(fecha_vencimiento__gte=datos['fecha_desde'])
+        if datos.get('fecha_hasta'):
+            queryset = queryset.filter(fecha_vencimiento__lte=datos['fecha_hasta'])
+        if datos.get('solo_vencidos'):
+            queryset = queryset.vencidos()
+        return queryset
+
+
+# === Importación masiva ===
+
+class ImportacionMixin:
+    """
+    Valida las filas de un archivo de importación con las mismas reglas del
+    formulario base. Se crea un formulario por archivo y se vuelve a vincular
+    a cada fila (vincular): construir uno por fila copia todos los campos y
+    widgets, y eso dominaba el costo de validar miles de filas.
+
+    El proyecto llega por código y se resuelve contra un diccionario
+    precargado {code: Project}, sin consultas por fila. No está en
+    Meta.fields, así que el modelo no vuelve a validar la clave foránea.
+    """
+    valores_por_defecto = {}
+    valores_falsos = ('', '0', 'no', 'n', 'false', 'f')
+
+    def __init__(self, proyectos, user=None):
+        # Sin `user`: el formulario base filtraría el queryset del proyecto
+        super().__init__(data={})
+        self.user = user
+        self.proyectos = proyectos
+
+    def vincular(self, data):
+        """Deja el formulario listo para validar otra fila"""
+        self.data = self.preparar(data)
+        self.is_bound = True
+        self._errors = None
+        self._bound_fields_cache = {}
+        self.instance = self._meta.model()
+        return self
+
+    def preparar(self, data):
+        datos = {**self.valores_por_defecto, **data}
+        for nombre, campo in self.fields.items():
+            valor = datos.get(nombre)
+            if not isinstance(valor, str):
+                continue
+            if isinstance(campo, forms.BooleanField):
+                datos[nombre] = valor.strip().lower() not in self.valores_falsos
+            elif isinstance(campo, forms.DateField):
+                # AAAA-MM-DD es el último de DATE_INPUT_FORMATS en es-co;
+                # se convierte aquí para no probar cada formato con strptime
+                try:
+                    datos[nombre] = date.fromisoformat(valor)
+                except ValueError:
+                    pass
+        return datos
+
+    def clean_proyecto(self):
+        codigo = self.cleaned_data['proyecto'].strip()
+        proyecto = self.proyectos.get(codigo)
+        if proyecto is None:
+            raise ValidationError(f'El proyecto "{codigo}" no existe o no tiene acceso a él')
+        # Fuera de Meta.fields: construct_instance no lo asigna
+        self.instance.proyecto = proyecto
+        return proyecto
+
+
+class IngresoImportacionForm(ImportacionMixin, IngresoForm):
+    proyecto = forms.CharField(max_length=50)
+    valores_por_defecto = {'estado': 'pendiente', 'monto_recibido': '0'}
+
+    class Meta(IngresoForm.Meta):
+        fields = [
+            campo for campo in IngresoForm.Meta.fields
+            if campo not in ('proyecto', 'documento_soporte')
+        ]
+
+
+class EgresoImportacionForm(ImportacionMixin, EgresoForm):
+    proyecto = forms.CharField(max_length=50)
+    valores_por_defecto = {
+        'estado': 'pendiente',
+        'monto_pagado': '0',
+        'retencion_iva': '0',
+        'retencion_fuente': '0',
+    }
+
+    class Meta(EgresoForm.Meta):
+        fields = [
+            campo for campo in EgresoForm.Meta.fields
+            if campo not in ('proyecto', 'documento_soporte', 'presupuesto')
+        ]
+
+
+class ImportacionArchivoForm(forms.Form):
+    """
+    Carga de un archivo CSV o XLSX de ingresos/egresos
+    """
+    tipo = forms.ChoiceField(
+        choices=[('ingresos', 'Ingresos'), ('egresos', 'Egresos')],
+        widget=forms.Select(attrs={'class': 'form-control'}),
+        label='Tipo de movimiento'
+    )
+    
+    archivo = forms.FileField(
+        widget=forms.FileInput(attrs={
+            'class': 'form-control',
+            'accept': '.csv,.xlsx',
+        }),
+        label='Archivo',
+        help_text='CSV (UTF-8) o Excel (.xlsx) con una fila de encabezados'
+    )
+    
+    def clean_archivo(self):
+        archivo = self.cleaned_data.get('archivo')
+        if archivo and not archivo.name.lower().endswith(('.csv', '.xlsx')):
+            raise ValidationError('Solo se aceptan archivos .csv o .xlsx')
+        return archivo
@@ -0,0 +1,193 @@
+# finanzas/importacion.py
+"""
+Importación masiva de ingresos y egresos desde CSV o XLSX.
+
+El archivo se recorre fila por fila (nunca se carga completo): cada fila se
+valida con el formulario de importación, que aplica las mismas reglas que
+IngresoForm/EgresoForm, y las filas válidas se insertan con bulk_create en
+lotes, cada uno en su propia transacción. bulk_create no dispara señales,
+así que después de cada lote se actualizan el resumen financiero, los meses
+pendientes de proyección, los abonos de apertura (lo que la fila ya trae
+recibido/pagado) y, para egresos, el consumo de los presupuestos.
+
+Encabezados: los nombres de campo del modelo (concepto, monto_total, ...);
+la columna `proyecto` lleva el código del proyecto. XLSX requiere openpyxl.
+"""
+import csv
+import io
+
+from django.db import transaction
+
+from proyectos.acceso import proyectos_accesibles
+from proyectos.models import Project
+from .forms import IngresoImportacionForm, EgresoImportacionForm
+from .models import Ingreso, Egreso
+from .pagos import registrar_abonos_de_apertura
+from .presupuestos import aplicar_deltas, deltas_nuevos
+from .proyecciones import marcar_meses_pendientes, meses_afectados
+from .resumen import aplicar_deltas_resumen, deltas_resumen
+
+try:
+    import openpyxl
+except ImportError:  # dependencia opcional, solo para XLSX
+    openpyxl = None
+
+
+TIPOS = {
+    'ingresos': (Ingreso, IngresoImportacionForm),
+    'egresos': (Egreso, EgresoImportacionForm),
+}
+
+TAMAÑO_LOTE = 2000
+
+
+class ImportacionError(Exception):
+    """El archivo no se puede leer (formato, encabezados, dependencia)"""
+
+
+class ResultadoImportacion:
+    """
+    Totales de una importación. Guarda hasta `max_errores` errores para
+    mostrarlos; el resto solo se cuenta (ver `al_error` en importar_movimientos).
+    """
+
+    def __init__(self, max_errores=100):
+        self.creados = 0
+        self.filas = 0
+        self.total_errores = 0
+        self.errores = []
+        self.max_errores = max_errores
+
+    def agregar_error(self, fila, errores):
+        self.total_errores += 1
+        if self.max_errores is None or len(self.errores) < self.max_errores:
+            self.errores.append((fila, errores))
+
+    @property
+    def errores_omitidos(self):
+        return self.total_errores - len(self.errores)
+
+
+# --- Lectura ---
+
+def _texto(valor):
+    return '' if valor is None else str(valor).strip()
+
+
+def leer_csv(archivo):
+    """Filas (numero, dict) de un CSV UTF-8 binario o de texto"""
+    if isinstance(archivo, (io.TextIOBase, io.StringIO)):
+        texto = archivo
+    else:
+        texto = io.TextIOWrapper(archivo, encoding='utf-8-sig', newline='')
+    lector = csv.DictReader(texto)
+    numero = 1
+    try:
+        if not lector.fieldnames:
+            raise ImportacionError('El archivo está vacío o no tiene encabezados')
+        lector.fieldnames = [_texto(nombre) for nombre in lector.fieldnames]
+        for numero, fila in enumerate(lector, start=2):
+            yield numero, {
+                nombre: valor.strip() if isinstance(valor, str) else valor
+                for nombre, valor in fila.items()
+                if nombre and valor not in (None, '')
+            }
+    except (UnicodeDecodeError, csv.Error) as error:
+        raise ImportacionError(f'No se pudo leer el archivo después de la fila {numero}: {error}')
+
+
+def leer_xlsx(archivo):
+    """Filas (numero, dict) de la primera hoja en modo de solo lectura"""
+    if openpyxl is None:
+        raise ImportacionError('Para importar archivos XLSX instale openpyxl')
+    libro = openpyxl.load_workbook(archivo, read_only=True, data_only=True)
+    try:
+        filas = libro.worksheets[0].iter_rows(values_only=True)
+        encabezados = [_texto(nombre) for nombre in next(filas, ())]
+        if not any(encabezados):
+            raise ImportacionError('El archivo está vacío o no tiene encabezados')
+        for numero, valores in enumerate(filas, start=2):
+            fila = {
+                nombre: valor.strip() if isinstance(valor, str) else valor
+                for nombre, valor in zip(encabezados, valores)
+                if nombre and valor not in (None, '')
+            }
+            if fila:
+                yield numero, fila
+    finally:
+        libro.close()
+
+
+def leer_filas(archivo, nombre):
+    """Elige el lector según la extensión del nombre del archivo"""
+    if nombre.lower().endswith('.xlsx'):
+        return leer_xlsx(archivo)
+    if nombre.lower().endswith('.csv'):
+        return leer_csv(archivo)
+    raise ImportacionError(f'Formato no soportado: {nombre}')
+
+
+# --- Importación ---
+
+def _proyectos_por_codigo(usuario):
+    """Diccionario {code: Project} con los proyectos donde se puede importar"""
+    proyectos = Project.objects.only('pk', 'code', 'name')
+    if usuario is not None:
+        proyectos = proyectos.filter(pk__in=proyectos_accesibles(usuario))
+    return {proyecto.code: proyecto for proyecto in proyectos}
+
+
+def _guardar_lote(modelo, objetos):
+    with transaction.atomic():
+        modelo.objects.bulk_create(objetos)
+        registrar_abonos_de_apertura(objetos)
+        if modelo is Egreso:
+            aplicar_deltas(deltas_nuevos(objetos))
+        aplicar_deltas_resumen(deltas_resumen(objetos))
+        meses = set()
+        for objeto in objetos:
+            meses |= meses_afectados(objeto)
+        marcar_meses_pendientes(meses)
+
+
+def importar_movimientos(filas, tipo, usuario=None, lote=TAMAÑO_LOTE, al_error=None, max_errores=100):
+    """
+    Valida e inserta las filas [(numero, dict), ...] de un tipo ('ingresos'
+    o 'egresos'). Las filas inválidas no detienen la importación: se
+    reportan a `al_error(numero, errores)` y en el resultado.
+    Los lotes ya confirmados se conservan si un lote posterior falla.
+    """
+    modelo, form_class = TIPOS[tipo]
+    proyectos = _proyectos_por_codigo(usuario)
+    resultado = ResultadoImportacion(max_errores=max_errores)
+    pendientes = []
+    form = form_class(proyectos=proyectos, user=usuario)
+
+    for numero, datos in filas:
+        resultado.filas += 1
+        if not form.vincular(datos).is_valid():
+            errores = form.errors.get_json_data()
+            resultado.agregar_error(numero, errores)
+            if al_error:
+                al_error(numero, errores)
+            continue
+
+        pendientes.append(form.save(commit=False))
+        if len(pendientes) >= lote:
+            _guardar_lote(modelo, pendientes)
+            resultado.creados += len(pendientes)
+            pendientes = []
+
+    if pendientes:
+        _guardar_lote(modelo, pendientes)
+        resultado.creados += len(pendientes)
+    return resultado
+
+
+def mensajes_de_error(errores):
+    """Aplana errors.get_json_data() en [(campo, mensaje), ...]"""
+    return [
+        ('general' if campo == '__all__' else campo, error['message'])
+        for campo, lista in errores.items()
+        for error in lista
+    ]
@@ -0,0 +1,48 @@
+# finanzas/management/commands/generar_proyecciones.py
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+
+from finanzas.proyecciones import generar_proyecciones
+
+
+def periodo(valor):
+    """Convierte 'AAAA-MM' en (año, mes)"""
+    try:
+        año, mes = (int(parte) for parte in valor.split('-'))
+    except ValueError:
+        raise CommandError(f'Período inválido "{valor}", use AAAA-MM')
+    if not 1 <= mes <= 12:
+        raise CommandError(f'Mes inválido en "{valor}"')
+    return (año, mes)
+
+
+class Command(BaseCommand):
+    help = (
+        "Genera las proyecciones de flujo de caja mensuales de todos los proyectos "
+        "a partir de los ingresos y egresos registrados."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--proyecto',
+            type=int,
+            action='append',
+            dest='proyectos',
+            help='ID de proyecto a procesar (se puede repetir). Por defecto, todos.',
+        )
+        parser.add_argument('--desde', type=periodo, help='Primer mes a escribir (AAAA-MM)')
+        parser.add_argument('--hasta', type=periodo, help='Último mes a escribir (AAAA-MM)')
+
+    def handle(self, *args, **options):
+        inicio = time.perf_counter()
+        with transaction.atomic():
+            total = generar_proyecciones(
+                options['proyectos'],
+                desde=options['desde'],
+                hasta=options['hasta'],
+            )
+        self.stdout.write(self.style.SUCCESS(
+            f'Proyecciones escritas: {total} en {time.perf_counter() - inicio:.2f}s'
+        ))
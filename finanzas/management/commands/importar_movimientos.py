@@ -0,0 +1,83 @@
+# finanzas/management/commands/importar_movimientos.py
+import csv
+import time
+
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand, CommandError
+
+from finanzas.importacion import (
+    TAMAÑO_LOTE, TIPOS, ImportacionError, importar_movimientos, leer_filas, mensajes_de_error,
+)
+
+
+class Command(BaseCommand):
+    help = (
+        "Importa ingresos o egresos desde un archivo CSV o XLSX. La columna "
+        "`proyecto` lleva el código del proyecto; las filas inválidas se "
+        "omiten y se reportan."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('tipo', choices=sorted(TIPOS), help='Tipo de movimiento')
+        parser.add_argument('archivo', help='Ruta del archivo .csv o .xlsx')
+        parser.add_argument(
+            '--usuario',
+            help='Username que queda como creador; limita la importación a sus proyectos',
+        )
+        parser.add_argument(
+            '--lote',
+            type=int,
+            default=TAMAÑO_LOTE,
+            help=f'Filas por transacción (por defecto {TAMAÑO_LOTE})',
+        )
+        parser.add_argument(
+            '--reporte',
+            help='Archivo CSV donde escribir los errores (fila, campo, mensaje)',
+        )
+
+    def handle(self, *args, **options):
+        usuario = None
+        if options['usuario']:
+            try:
+                usuario = get_user_model().objects.get(username=options['usuario'])
+            except get_user_model().DoesNotExist:
+                raise CommandError(f'El usuario "{options["usuario"]}" no existe')
+
+        reporte = open(options['reporte'], 'w', newline='', encoding='utf-8') if options['reporte'] else None
+        escritor = None
+        if reporte:
+            escritor = csv.writer(reporte)
+            escritor.writerow(['fila', 'campo', 'mensaje'])
+
+        def al_error(numero, errores):
+            if escritor:
+                for campo, mensaje in mensajes_de_error(errores):
+                    escritor.writerow([numero, campo, mensaje])
+
+        inicio = time.perf_counter()
+        try:
+            with open(options['archivo'], 'rb') as archivo:
+                resultado = importar_movimientos(
+                    leer_filas(archivo, options['archivo']),
+                    options['tipo'],
+                    usuario=usuario,
+                    lote=options['lote'],
+                    al_error=al_error,
+                    max_errores=10,
+                )
+        except (ImportacionError, OSError) as error:
+            raise CommandError(str(error))
+        finally:
+            if reporte:
+                reporte.close()
+
+        for numero, errores in resultado.errores:
+            for campo, mensaje in mensajes_de_error(errores):
+                self.stderr.write(f'Fila {numero} [{campo}]: {mensaje}')
+        if resultado.errores_omitidos:
+            self.stderr.write(f'... y {resultado.errores_omitidos} filas con errores más')
+
+        self.stdout.write(self.style.SUCCESS(
+            f'{resultado.creados} de {resultado.filas} filas importadas, '
+            f'{resultado.total_errores} con errores, en {time.perf_counter() - inicio:.2f}s'
+        ))
@@ -0,0 +1,79 @@
+# finanzas/management/commands/procesar_proyecciones.py
+import time
+
+from django.core.management.base import BaseCommand
+from django.db import close_old_connections, transaction
+from django.utils import timezone
+
+from finanzas.proyecciones import marcar_meses_cerrados, procesar_meses_pendientes
+
+
+class Command(BaseCommand):
+    help = (
+        "Recalcula las proyecciones de flujo de caja de los meses marcados por "
+        "cambios en ingresos y egresos y los meses que cerraron desde su último "
+        "cálculo. Con --continuo queda procesando en bucle y repite la revisión "
+        "de meses cerrados al cambiar el mes; sin él, debe correr al menos una "
+        "vez al inicio de cada mes (p. ej. en cron)."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--continuo',
+            action='store_true',
+            help='Procesa indefinidamente, esperando --intervalo cuando no hay trabajo.',
+        )
+        parser.add_argument(
+            '--intervalo',
+            type=float,
+            default=1.0,
+            help='Segundos de espera entre pasadas sin trabajo (por defecto 1).',
+        )
+        parser.add_argument(
+            '--lote',
+            type=int,
+            default=500,
+            help='Meses pendientes procesados por transacción (por defecto 500).',
+        )
+
+    def procesar(self, lote):
+        total = 0
+        while True:
+            with transaction.atomic():
+                procesados = procesar_meses_pendientes(limite=lote)
+            total += procesados
+            if procesados < lote:
+                return total
+
+    def cerrar_meses(self):
+        """Marca los meses cerrados; devuelve el mes en curso revisado"""
+        hoy = timezone.now().date()
+        marcados = marcar_meses_cerrados((hoy.year, hoy.month))
+        if marcados:
+            self.stdout.write(f'Meses cerrados por recalcular: {marcados}')
+        return (hoy.year, hoy.month)
+
+    def handle(self, *args, **options):
+        mes_revisado = self.cerrar_meses()
+        if not options['continuo']:
+            total = self.procesar(options['lote'])
+            self.stdout.write(self.style.SUCCESS(f'Meses recalculados: {total}'))
+            return
+
+        self.stdout.write('Procesando proyecciones pendientes (Ctrl+C para salir)...')
+        try:
+            while True:
+                close_old_connections()
+                hoy = timezone.now().date()
+                if (hoy.year, hoy.month) != mes_revisado:
+                    mes_revisado = self.cerrar_meses()
+                inicio = time.perf_counter()
+                total = self.procesar(options['lote'])
+                if total:
+                    self.stdout.write(
+                        f'Meses recalculados: {total} en {time.perf_counter() - inicio:.2f}s'
+                    )
+                else:
+                    time.sleep(options['intervalo'])
+        except KeyboardInterrupt:
+            self.stdout.write('Detenido.')
@@ -0,0 +1,47 @@
+# finanzas/management/commands/reconciliar_presupuestos.py
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+
+from finanzas.presupuestos import reconciliar_presupuestos, verificar_presupuestos
+
+
+class Command(BaseCommand):
+    help = (
+        "Recalcula el monto comprometido y gastado de los presupuestos desde "
+        "sus egresos con un único UPDATE y verifica que no queden diferencias."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--presupuesto',
+            type=int,
+            action='append',
+            dest='presupuestos',
+            help='ID de presupuesto a procesar (se puede repetir). Por defecto, todos.',
+        )
+        parser.add_argument(
+            '--solo-verificar',
+            action='store_true',
+            help='No escribe nada; solo reporta diferencias.',
+        )
+
+    def handle(self, *args, **options):
+        presupuestos = options['presupuestos']
+
+        if options['solo_verificar']:
+            diferencias = verificar_presupuestos(presupuestos)
+            for presupuesto_id, campo, guardado, esperado in diferencias:
+                self.stdout.write(
+                    f'Presupuesto {presupuesto_id}: {campo} = {guardado} (esperado {esperado})'
+                )
+            if diferencias:
+                raise CommandError(f'{len(diferencias)} diferencias encontradas')
+            self.stdout.write(self.style.SUCCESS('Presupuestos verificados sin diferencias'))
+            return
+
+        with transaction.atomic():
+            desviados = len({pk for pk, *_ in verificar_presupuestos(presupuestos)})
+            total = reconciliar_presupuestos(presupuestos)
+        self.stdout.write(self.style.SUCCESS(
+            f'Presupuestos reconciliados: {total} ({desviados} con diferencias)'
+        ))
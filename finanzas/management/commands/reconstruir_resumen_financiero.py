@@ -0,0 +1,46 @@
+# finanzas/management/commands/reconstruir_resumen_financiero.py
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+
+from finanzas.resumen import recalcular_resumenes, verificar_resumenes
+
+
+class Command(BaseCommand):
+    help = (
+        "Reconstruye desde cero la tabla de resúmenes financieros por proyecto "
+        "y verifica que coincida con el libro de ingresos y egresos. "
+        "Programarlo a diario: las columnas de vencidos cambian con la fecha "
+        "y las escrituras solo aplican deltas."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--proyecto',
+            type=int,
+            action='append',
+            dest='proyectos',
+            help='ID de proyecto a procesar (se puede repetir). Por defecto, todos.',
+        )
+        parser.add_argument(
+            '--solo-verificar',
+            action='store_true',
+            help='No escribe nada; solo reporta diferencias.',
+        )
+
+    def handle(self, *args, **options):
+        proyectos = options['proyectos']
+
+        if not options['solo_verificar']:
+            with transaction.atomic():
+                total = recalcular_resumenes(proyectos)
+            self.stdout.write(f'Resúmenes reconstruidos: {total}')
+
+        diferencias = verificar_resumenes(proyectos)
+        for proyecto_id, campo, guardado, esperado in diferencias:
+            self.stdout.write(
+                f'Proyecto {proyecto_id}: {campo} = {guardado} (esperado {esperado})'
+            )
+        if diferencias:
+            raise CommandError(f'{len(diferencias)} diferencias encontradas')
+
+        self.stdout.write(self.style.SUCCESS('Resúmenes verificados sin diferencias'))
@@ -0,0 +1,48 @@
+# finanzas/management/commands/verificar_abonos.py
+from django.core.management.base import BaseCommand, CommandError
+
+from finanzas.models import Ingreso, Egreso
+from finanzas.pagos import completar_abonos, verificar_abonos
+
+MODELOS = {'ingresos': Ingreso, 'egresos': Egreso}
+
+
+class Command(BaseCommand):
+    help = (
+        "Verifica que lo recibido/pagado de cada ingreso y egreso sea igual a "
+        "la suma de sus abonos."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--tipo',
+            choices=sorted(MODELOS),
+            action='append',
+            dest='tipos',
+            help='ingresos o egresos (se puede repetir). Por defecto, ambos.',
+        )
+        parser.add_argument(
+            '--completar',
+            action='store_true',
+            help=(
+                'Agrega un abono de apertura por la diferencia cuando el acumulado '
+                'supera la suma de abonos (movimientos anteriores al historial).'
+            ),
+        )
+
+    def handle(self, *args, **options):
+        tipos = options['tipos'] or sorted(MODELOS)
+
+        if options['completar']:
+            for tipo in tipos:
+                creados = completar_abonos(MODELOS[tipo])
+                self.stdout.write(f'{tipo}: {creados} abonos de apertura creados')
+
+        total = 0
+        for tipo in tipos:
+            for pk, acumulado, suma in verificar_abonos(MODELOS[tipo]):
+                self.stdout.write(f'{tipo} {pk}: acumulado {acumulado}, abonos {suma}')
+                total += 1
+        if total:
+            raise CommandError(f'{total} diferencias encontradas')
+        self.stdout.write(self.style.SUCCESS('Abonos verificados sin diferencias'))
@@ -0,0 +1,35 @@
+# Generated by Django 5.2.7 on 2026-10-17 02:34
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('finanzas', '0002_egreso'),
+        ('proyectos', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ResumenFinancieroProyecto',
+            fields=[
+                ('proyecto', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='resumen_financiero', serialize=False, to='proyectos.project', verbose_name='Proyecto')),
+                ('ingresos_total', models.DecimalField(decimal_places=2, default=0, max_digits=17, verbose_name='Total ingresos')),
+                ('ingresos_recibido', models.DecimalField(decimal_places=2, default=0, max_digits=17, verbose_name='Ingresos recibidos')),
+                ('ingresos_pendiente', models.DecimalField(decimal_places=2, default=0, max_digits=17, verbose_name='Ingresos pendientes')),
+                ('ingresos_vencido', models.DecimalField(decimal_places=2, default=0, max_digits=17, verbose_name='Ingresos vencidos')),
+                ('egresos_total', models.DecimalField(decimal_places=2, default=0, max_digits=17, verbose_name='Total egresos')),
+                ('egresos_pagado', models.DecimalField(decimal_places=2, default=0, max_digits=17, verbose_name='Egresos pagados')),
+                ('egresos_pendiente', models.DecimalField(decimal_places=2, default=0, max_digits=17, verbose_name='Egresos pendientes')),
+                ('egresos_vencido', models.DecimalField(decimal_places=2, default=0, max_digits=17, verbose_name='Egresos vencidos')),
+                ('actualizado_en', models.DateTimeField(auto_now=True)),
+            ],
+            options={
+                'verbose_name': 'Resumen financiero del proyecto',
+                'verbose_name_plural': 'Resúmenes financieros de proyectos',
+                'db_table': 'finanzas_resumen_proyecto',
+            },
+        ),
+    ]
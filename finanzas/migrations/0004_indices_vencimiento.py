@@ -0,0 +1,24 @@
+# Generated by Django 5.2.7 on 2026-10-17 02:35
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('finanzas', '0003_resumen_financiero_proyecto'),
+        ('proyectos', '0001_initial'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='egreso',
+            index=models.Index(fields=['estado', 'fecha_vencimiento'], name='finanzas_eg_estado_2a4cb1_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='ingreso',
+            index=models.Index(fields=['estado', 'fecha_esperada'], name='finanzas_in_estado_44be99_idx'),
+        ),
+    ]
@@ -0,0 +1,20 @@
+# Generated by Django 5.2.7 on 2026-10-17 02:36
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('finanzas', '0004_indices_vencimiento'),
+        ('proyectos', '0001_initial'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='ingreso',
+            index=models.Index(fields=['-fecha_esperada', '-creado_en', 'id'], name='finanzas_in_listado_idx'),
+        ),
+    ]
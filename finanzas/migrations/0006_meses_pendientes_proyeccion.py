@@ -0,0 +1,32 @@
+# Generated by Django 5.2.7 on 2026-10-17 02:41
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('finanzas', '0005_indice_listado_ingresos'),
+        ('proyectos', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='MesPendienteProyeccion',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('año', models.IntegerField(verbose_name='Año')),
+                ('mes', models.IntegerField(verbose_name='Mes')),
+                ('marcado_en', models.DateTimeField(verbose_name='Marcado en')),
+                ('proyecto', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='meses_pendientes_proyeccion', to='proyectos.project', verbose_name='Proyecto')),
+            ],
+            options={
+                'verbose_name': 'Mes pendiente de proyección',
+                'verbose_name_plural': 'Meses pendientes de proyección',
+                'db_table': 'finanzas_meses_pendientes_proyeccion',
+                'indexes': [models.Index(fields=['marcado_en'], name='finanzas_me_marcado_329f78_idx')],
+                'unique_together': {('proyecto', 'año', 'mes')},
+            },
+        ),
+    ]
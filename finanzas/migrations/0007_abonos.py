@@ -0,0 +1,59 @@
+# Generated by Django 5.2.7 on 2026-10-17 02:44
+
+import django.core.validators
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('finanzas', '0006_meses_pendientes_proyeccion'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='AbonoEgreso',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('monto', models.DecimalField(decimal_places=2, max_digits=15, validators=[django.core.validators.MinValueValidator(0)], verbose_name='Monto')),
+                ('fecha', models.DateField(verbose_name='Fecha')),
+                ('metodo_pago', models.CharField(blank=True, max_length=20, null=True, verbose_name='Método de pago')),
+                ('numero_referencia', models.CharField(blank=True, max_length=100, verbose_name='Número de referencia')),
+                ('creado_en', models.DateTimeField(auto_now_add=True)),
+                ('documento_soporte', models.FileField(blank=True, null=True, upload_to='finanzas/abonos/egresos/%Y/%m/', verbose_name='Comprobante')),
+                ('egreso', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='abonos', to='finanzas.egreso', verbose_name='Egreso')),
+                ('registrado_por', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='+', to=settings.AUTH_USER_MODEL, verbose_name='Registrado por')),
+            ],
+            options={
+                'verbose_name': 'Abono de egreso',
+                'verbose_name_plural': 'Abonos de egresos',
+                'db_table': 'finanzas_abonos_egreso',
+                'ordering': ['fecha', 'id'],
+                'indexes': [models.Index(fields=['egreso', 'fecha'], name='finanzas_ab_egreso__56e975_idx')],
+            },
+        ),
+        migrations.CreateModel(
+            name='AbonoIngreso',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('monto', models.DecimalField(decimal_places=2, max_digits=15, validators=[django.core.validators.MinValueValidator(0)], verbose_name='Monto')),
+                ('fecha', models.DateField(verbose_name='Fecha')),
+                ('metodo_pago', models.CharField(blank=True, max_length=20, null=True, verbose_name='Método de pago')),
+                ('numero_referencia', models.CharField(blank=True, max_length=100, verbose_name='Número de referencia')),
+                ('creado_en', models.DateTimeField(auto_now_add=True)),
+                ('documento_soporte', models.FileField(blank=True, null=True, upload_to='finanzas/abonos/ingresos/%Y/%m/', verbose_name='Comprobante')),
+                ('ingreso', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='abonos', to='finanzas.ingreso', verbose_name='Ingreso')),
+                ('registrado_por', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='+', to=settings.AUTH_USER_MODEL, verbose_name='Registrado por')),
+            ],
+            options={
+                'verbose_name': 'Abono de ingreso',
+                'verbose_name_plural': 'Abonos de ingresos',
+                'db_table': 'finanzas_abonos_ingreso',
+                'ordering': ['fecha', 'id'],
+                'indexes': [models.Index(fields=['ingreso', 'fecha'], name='finanzas_ab_ingreso_4e6dec_idx')],
+            },
+        ),
+    ]
@@ -0,0 +1,20 @@
+# Generated by Django 5.2.7 on 2026-10-17 03:02
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('finanzas', '0007_abonos'),
+        ('proyectos', '0001_initial'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='egreso',
+            index=models.Index(fields=['-fecha_vencimiento', '-creado_en', 'id'], name='finanzas_eg_listado_idx'),
+        ),
+    ]
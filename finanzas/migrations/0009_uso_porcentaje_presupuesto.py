@@ -0,0 +1,27 @@
+# Generated by Django 5.2.7 on 2026-10-17 03:09
+
+import django.db.models.expressions
+import django.db.models.functions.comparison
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('finanzas', '0008_indice_listado_egresos'),
+        ('proyectos', '0001_initial'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='presupuesto',
+            name='uso_porcentaje',
+            field=models.GeneratedField(db_persist=True, expression=django.db.models.functions.comparison.Coalesce(django.db.models.expressions.CombinedExpression(django.db.models.expressions.CombinedExpression(models.F('monto_gastado'), '*', models.Value(100.0)), '/', django.db.models.functions.comparison.NullIf(models.F('monto_planeado'), models.Value(0))), models.Value(0.0)), output_field=models.DecimalField(decimal_places=2, max_digits=20), verbose_name='Uso (%)'),
+        ),
+        migrations.AddIndex(
+            model_name='presupuesto',
+            index=models.Index(fields=['uso_porcentaje', 'id'], name='finanzas_pr_uso_idx'),
+        ),
+    ]
@@ -2,15 +2,138 @@ from django.db import models
 
 # Create your models here.
 # finanzas/models.py
-from django.db import models
+from django.db import models, transaction
+from django.db.models import Case, DecimalField, DurationField, ExpressionWrapper, F, Q, Value, When
+from django.db.models.functions import Coalesce, NullIf
 from django.conf import settings
+from django.core.exceptions import ValidationError
 from django.core.validators import MinValueValidator
 from django.utils import timezone
+from datetime import timedelta
 from decimal import Decimal
+from proyectos.etiquetas import proyecto_de
 from proyectos.models import Project
 
 
-class Ingreso(models.Model):
+class ValoresOriginalesMixin:
+    """
+    Conserva los valores cargados desde la base de datos para que las señales
+    puedan calcular qué cambió (proyecto, montos, fechas) sin consultas extra.
+    """
+
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        instance._valores_originales = dict(zip(field_names, values))
+        return instance
+
+    def capturar_valores_originales(self):
+        """Toma como nueva referencia los valores actualmente cargados"""
+        self._valores_originales = {
+            field.attname: self.__dict__[field.attname]
+            for field in self._meta.concrete_fields
+            if field.attname in self.__dict__
+        }
+
+    def valor_original(self, attname):
+        return getattr(self, '_valores_originales', {}).get(attname)
+
+    def save(self, *args, **kwargs):
+        # Las señales actualizan tablas derivadas: todo en la misma transacción
+        with transaction.atomic(using=kwargs.get('using')):
+            super().save(*args, **kwargs)
+
+    def delete(self, *args, **kwargs):
+        with transaction.atomic(using=kwargs.get('using')):
+            return super().delete(*args, **kwargs)
+
+
+class MovimientoQuerySet(models.QuerySet):
+    """
+    Consultas de vencimiento expresadas en SQL.
+    Cada subclase define los estados abiertos y el campo de fecha límite.
+    """
+    estados_abiertos = ('pendiente', 'parcial')
+    campo_fecha_limite = None
+
+    def q_vencido(self, hoy=None):
+        """Condición de vencimiento reutilizable en filtros y agregaciones"""
+        hoy = hoy or timezone.now().date()
+        return Q(
+            estado__in=self.estados_abiertos,
+            **{f'{self.campo_fecha_limite}__lt': hoy}
+        )
+
+    def pendientes(self):
+        """Movimientos con saldo abierto (pendientes o parciales)"""
+        return self.filter(estado__in=self.estados_abiertos)
+
+    def vencidos(self, hoy=None):
+        """Movimientos abiertos cuya fecha límite ya pasó"""
+        return self.filter(self.q_vencido(hoy))
+
+    def no_vencidos(self, hoy=None):
+        return self.exclude(self.q_vencido(hoy))
+
+    def with_dias_vencidos(self, hoy=None):
+        """
+        Anota `retraso` (duración) calculado en la base de datos;
+        cero si el movimiento no está vencido.
+        """
+        hoy = hoy or timezone.now().date()
+        return self.annotate(
+            retraso=Case(
+                When(
+                    self.q_vencido(hoy),
+                    then=Value(hoy) - F(self.campo_fecha_limite),
+                ),
+                default=Value(timedelta(0)),
+                output_field=DurationField(),
+            )
+        )
+
+
+class IngresoQuerySet(MovimientoQuerySet):
+    campo_fecha_limite = 'fecha_esperada'
+
+
+class EgresoQuerySet(MovimientoQuerySet):
+    campo_fecha_limite = 'fecha_vencimiento'
+
+
+class PresupuestoQuerySet(models.QuerySet):
+    """
+    Versión SQL de las propiedades de Presupuesto. El porcentaje de uso es
+    una columna generada (Presupuesto.uso_porcentaje); el resto se anota.
+    Los nombres difieren de las propiedades (porcentaje_uso,
+    monto_disponible, esta_sobrepresupuestado) porque Django no puede
+    asignar sobre ellas.
+    """
+
+    def q_sobrepresupuestado(self):
+        return Q(monto_gastado__gt=F('monto_planeado'))
+
+    def con_uso(self):
+        """Anota `disponible` y `sobrepresupuestado`"""
+        return self.annotate(
+            disponible=ExpressionWrapper(
+                F('monto_planeado') - F('monto_comprometido') - F('monto_gastado'),
+                output_field=DecimalField(max_digits=15, decimal_places=2),
+            ),
+            sobrepresupuestado=ExpressionWrapper(
+                self.q_sobrepresupuestado(),
+                output_field=models.BooleanField(),
+            ),
+        )
+
+    def sobrepresupuestados(self):
+        return self.filter(self.q_sobrepresupuestado())
+
+    def dentro_del_presupuesto(self):
+        return self.exclude(self.q_sobrepresupuestado())
+
+
+class Ingreso(ValoresOriginalesMixin, models.Model):
     """
     Ingresos del proyecto (anticipos, pagos del contratante, otros ingresos)
     """
@@ -158,6 +281,8 @@ class Ingreso(models.Model):
     creado_en = models.DateTimeField(auto_now_add=True)
     actualizado_en = models.DateTimeField(auto_now=True)
     
+    objects = IngresoQuerySet.as_manager()
+    
     class Meta:
         verbose_name = "Ingreso"
         verbose_name_plural = "Ingresos"
@@ -167,10 +292,12 @@ class Ingreso(models.Model):
             models.Index(fields=['proyecto', 'estado']),
             models.Index(fields=['fecha_esperada']),
             models.Index(fields=['fecha_recepcion']),
+            models.Index(fields=['estado', 'fecha_esperada']),
+            models.Index(fields=['-fecha_esperada', '-creado_en', 'id'], name='finanzas_in_listado_idx'),
         ]
     
     def __str__(self):
-        return f"{self.proyecto.code} - {self.concepto} - ${self.monto_total}"
+        return f"{proyecto_de(self).code} - {self.concepto} - ${self.monto_total}"
     
     @property
     def monto_pendiente(self):
@@ -184,8 +311,8 @@ class Ingreso(models.Model):
     
     @property
     def esta_vencido(self):
-        """Verifica si el ingreso está vencido"""
-        if self.estado == 'recibido':
+        """Verifica si el ingreso está vencido (mismo criterio que IngresoQuerySet.vencidos)"""
+        if self.estado not in IngresoQuerySet.estados_abiertos:
             return False
         if self.fecha_esperada is None:
             return False  # o None, pero False es más seguro para el admin
@@ -194,24 +321,36 @@ class Ingreso(models.Model):
     @property
     def dias_vencidos(self):
         """Días de retraso"""
+        if 'retraso' in self.__dict__:
+            return self.retraso.days  # anotado por with_dias_vencidos()
         if not self.esta_vencido:
             return 0
         return (timezone.now().date() - self.fecha_esperada).days
     
-    def marcar_como_recibido(self, monto=None, fecha=None, metodo_pago=None):
-        """Marca el ingreso como recibido"""
-        self.monto_recibido = monto or self.monto_total
-        self.fecha_recepcion = fecha or timezone.now().date()
-        
-        if metodo_pago:
-            self.metodo_pago = metodo_pago
-        
-        if self.esta_completamente_recibido:
-            self.estado = 'recibido'
-        elif self.monto_recibido > 0:
-            self.estado = 'parcial'
-        
-        self.save()
+    def marcar_como_recibido(self, monto=None, fecha=None, metodo_pago=None, abono=None):
+        """
+        Registra un abono con un UPDATE atómico; ver finanzas.pagos.registrar_recepcion.
+
+        `monto` es el nuevo total recibido (por defecto, el monto total): se
+        abona la diferencia con lo ya recibido, leído con SELECT ... FOR UPDATE.
+        Si ya se alcanzó (p. ej. el ingreso está recibido por completo) no hace
+        nada. `abono` suma directamente un pago adicional.
+        """
+        from .pagos import registrar_recepcion
+        with transaction.atomic():
+            if abono is None:
+                actual = (
+                    Ingreso.objects.select_for_update()
+                    .values_list('monto_recibido', flat=True).get(pk=self.pk)
+                )
+                abono = (monto or self.monto_total) - actual
+                if abono < 0:
+                    raise ValidationError(
+                        f'Ya se registraron ${actual:,.2f}; lo recibido no se reduce con un nuevo total'
+                    )
+                if abono == 0:
+                    return self
+            return registrar_recepcion(self, abono, fecha=fecha, metodo_pago=metodo_pago)
 
 
 class Presupuesto(models.Model):
@@ -273,6 +412,19 @@ class Presupuesto(models.Model):
         verbose_name="Monto gastado"
     )
     
+    # Calculado por la base de datos al escribir la fila: se puede ordenar y
+    # filtrar con índice sin cargar los registros (ver porcentaje_uso)
+    uso_porcentaje = models.GeneratedField(
+        expression=Coalesce(
+            # 100.0 evita la división entera de SQLite con montos sin decimales
+            F('monto_gastado') * Value(100.0) / NullIf(F('monto_planeado'), Value(0)),
+            Value(0.0),
+        ),
+        output_field=models.DecimalField(max_digits=20, decimal_places=2),
+        db_persist=True,
+        verbose_name="Uso (%)"
+    )
+    
     # Período
     periodo_inicio = models.DateField(verbose_name="Inicio del período")
     periodo_fin = models.DateField(verbose_name="Fin del período")
@@ -286,6 +438,8 @@ class Presupuesto(models.Model):
     )
     creado_en = models.DateTimeField(auto_now_add=True)
     actualizado_en = models.DateTimeField(auto_now=True)
+
+    objects = PresupuestoQuerySet.as_manager()
     
     class Meta:
         verbose_name = "Presupuesto"
@@ -294,10 +448,11 @@ class Presupuesto(models.Model):
         ordering = ['categoria', 'periodo_inicio']
         indexes = [
             models.Index(fields=['proyecto', 'categoria']),
+            models.Index(fields=['uso_porcentaje', 'id'], name='finanzas_pr_uso_idx'),
         ]
     
     def __str__(self):
-        return f"{self.proyecto.code} - {self.get_categoria_display()}"
+        return f"{proyecto_de(self).code} - {self.get_categoria_display()}"
     
     @property
     def monto_disponible(self):
@@ -393,7 +548,7 @@ class ProyeccionFlujoCaja(models.Model):
         ordering = ['año', 'mes']
     
     def __str__(self):
-        return f"{self.proyecto.code} - {self.mes}/{self.año}"
+        return f"{proyecto_de(self).code} - {self.mes}/{self.año}"
     
     @property
     def flujo_neto_proyectado(self):
@@ -411,7 +566,35 @@ class ProyeccionFlujoCaja(models.Model):
         return self.flujo_neto_real - self.flujo_neto_proyectado
 
 
-class Egreso(models.Model):
+class MesPendienteProyeccion(models.Model):
+    """
+    Mes de un proyecto cuya proyección quedó desactualizada por un cambio
+    en el libro. Lo consume el comando procesar_proyecciones.
+    """
+    proyecto = models.ForeignKey(
+        'proyectos.Project',
+        on_delete=models.CASCADE,
+        related_name='meses_pendientes_proyeccion',
+        verbose_name="Proyecto"
+    )
+    año = models.IntegerField(verbose_name="Año")
+    mes = models.IntegerField(verbose_name="Mes")
+    marcado_en = models.DateTimeField(verbose_name="Marcado en")
+
+    class Meta:
+        verbose_name = "Mes pendiente de proyección"
+        verbose_name_plural = "Meses pendientes de proyección"
+        db_table = 'finanzas_meses_pendientes_proyeccion'
+        unique_together = ['proyecto', 'año', 'mes']
+        indexes = [
+            models.Index(fields=['marcado_en']),
+        ]
+
+    def __str__(self):
+        return f"{proyecto_de(self).code} - {self.mes}/{self.año}"
+
+
+class Egreso(ValoresOriginalesMixin, models.Model):
     """
     Egresos del proyecto (materiales, mano de obra, subcontratos, gastos administrativos)
     """
@@ -593,6 +776,8 @@ class Egreso(models.Model):
     creado_en = models.DateTimeField(auto_now_add=True)
     actualizado_en = models.DateTimeField(auto_now=True)
     
+    objects = EgresoQuerySet.as_manager()
+    
     class Meta:
         verbose_name = "Egreso"
         verbose_name_plural = "Egresos"
@@ -604,10 +789,12 @@ class Egreso(models.Model):
             models.Index(fields=['fecha_pago']),
             models.Index(fields=['tipo_egreso']),
             models.Index(fields=['proveedor']),
+            models.Index(fields=['estado', 'fecha_vencimiento']),
+            models.Index(fields=['-fecha_vencimiento', '-creado_en', 'id'], name='finanzas_eg_listado_idx'),
         ]
     
     def __str__(self):
-        return f"{self.proyecto.code} - {self.concepto} - ${self.monto_total}"
+        return f"{proyecto_de(self).code} - {self.concepto} - ${self.monto_total}"
     
     @property
     def monto_pendiente(self):
@@ -626,8 +813,8 @@ class Egreso(models.Model):
     
     @property
     def esta_vencido(self):
-        """Verifica si el egreso está vencido"""
-        if self.estado == 'pagado':
+        """Verifica si el egreso está vencido (mismo criterio que EgresoQuerySet.vencidos)"""
+        if self.estado not in EgresoQuerySet.estados_abiertos:
             return False
         if self.fecha_vencimiento is None:
             return False
@@ -636,26 +823,220 @@ class Egreso(models.Model):
     @property
     def dias_vencidos(self):
         """Días de retraso en el pago"""
+        if 'retraso' in self.__dict__:
+            return self.retraso.days  # anotado por with_dias_vencidos()
         if not self.esta_vencido:
             return 0
         return (timezone.now().date() - self.fecha_vencimiento).days
     
-    def marcar_como_pagado(self, monto=None, fecha=None, metodo_pago=None):
-        """Marca el egreso como pagado"""
-        self.monto_pagado = monto or self.monto_total
-        self.fecha_pago = fecha or timezone.now().date()
-        
-        if metodo_pago:
-            self.metodo_pago = metodo_pago
-        
-        if self.esta_completamente_pagado:
-            self.estado = 'pagado'
-        elif self.monto_pagado > 0:
-            self.estado = 'parcial'
-        
-        # Actualizar presupuesto si está asociado
-        if self.presupuesto:
-            self.presupuesto.monto_gastado += (monto or self.monto_total) - (self.monto_pagado - (monto or self.monto_total))
-            self.presupuesto.save()
-        
-        self.save()
\ No newline at end of file
+    def marcar_como_pagado(self, monto=None, fecha=None, metodo_pago=None, abono=None):
+        """
+        Registra un abono con un UPDATE atómico; ver finanzas.pagos.registrar_pago.
+
+        `monto` es el nuevo total pagado (por defecto, el monto total): se
+        abona la diferencia con lo ya pagado, leído con SELECT ... FOR UPDATE.
+        Si ya se alcanzó (p. ej. el egreso está pagado por completo) no hace
+        nada. `abono` suma directamente un pago adicional.
+        """
+        from .pagos import registrar_pago
+        with transaction.atomic():
+            if abono is None:
+                actual = (
+                    Egreso.objects.select_for_update()
+                    .values_list('monto_pagado', flat=True).get(pk=self.pk)
+                )
+                abono = (monto or self.monto_total) - actual
+                if abono < 0:
+                    raise ValidationError(
+                        f'Ya se registraron ${actual:,.2f}; lo pagado no se reduce con un nuevo total'
+                    )
+                if abono == 0:
+                    return self
+            return registrar_pago(self, abono, fecha=fecha, metodo_pago=metodo_pago)
+
+
+class AbonoBase(models.Model):
+    """
+    Pago individual registrado contra un movimiento. Solo se insertan filas:
+    el acumulado del movimiento (monto_recibido / monto_pagado) se actualiza
+    con un UPDATE incremental desde finanzas.pagos.
+    """
+    monto = models.DecimalField(
+        max_digits=15,
+        decimal_places=2,
+        validators=[MinValueValidator(0)],
+        verbose_name="Monto"
+    )
+    fecha = models.DateField(verbose_name="Fecha")
+    metodo_pago = models.CharField(
+        max_length=20,
+        null=True,
+        blank=True,
+        verbose_name="Método de pago"
+    )
+    numero_referencia = models.CharField(
+        max_length=100,
+        blank=True,
+        verbose_name="Número de referencia"
+    )
+    registrado_por = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        related_name='+',
+        verbose_name="Registrado por"
+    )
+    creado_en = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        abstract = True
+
+    def save(self, *args, **kwargs):
+        if not self._state.adding:
+            raise ValueError("Los abonos no se modifican; registre un nuevo abono.")
+        super().save(*args, **kwargs)
+
+    def delete(self, *args, **kwargs):
+        raise ValueError("Los abonos no se eliminan; el historial de pagos es de solo inserción.")
+
+
+class AbonoIngreso(AbonoBase):
+    """
+    Recepción parcial o total de un ingreso
+    """
+    ingreso = models.ForeignKey(
+        'Ingreso',
+        on_delete=models.CASCADE,
+        related_name='abonos',
+        verbose_name="Ingreso"
+    )
+    documento_soporte = models.FileField(
+        upload_to='finanzas/abonos/ingresos/%Y/%m/',
+        null=True,
+        blank=True,
+        verbose_name="Comprobante"
+    )
+
+    class Meta:
+        verbose_name = "Abono de ingreso"
+        verbose_name_plural = "Abonos de ingresos"
+        db_table = 'finanzas_abonos_ingreso'
+        ordering = ['fecha', 'id']
+        indexes = [
+            models.Index(fields=['ingreso', 'fecha']),
+        ]
+
+    def __str__(self):
+        return f"Abono {self.ingreso_id} - ${self.monto} ({self.fecha})"
+
+
+class AbonoEgreso(AbonoBase):
+    """
+    Pago parcial o total de un egreso
+    """
+    egreso = models.ForeignKey(
+        'Egreso',
+        on_delete=models.CASCADE,
+        related_name='abonos',
+        verbose_name="Egreso"
+    )
+    documento_soporte = models.FileField(
+        upload_to='finanzas/abonos/egresos/%Y/%m/',
+        null=True,
+        blank=True,
+        verbose_name="Comprobante"
+    )
+
+    class Meta:
+        verbose_name = "Abono de egreso"
+        verbose_name_plural = "Abonos de egresos"
+        db_table = 'finanzas_abonos_egreso'
+        ordering = ['fecha', 'id']
+        indexes = [
+            models.Index(fields=['egreso', 'fecha']),
+        ]
+
+    def __str__(self):
+        return f"Pago {self.egreso_id} - ${self.monto} ({self.fecha})"
+
+
+class ResumenFinancieroProyecto(models.Model):
+    """
+    Totales acumulados de ingresos y egresos por proyecto.
+    Se mantiene desde las escrituras de Ingreso/Egreso (ver finanzas.resumen).
+    """
+    proyecto = models.OneToOneField(
+        'proyectos.Project',
+        on_delete=models.CASCADE,
+        primary_key=True,
+        related_name='resumen_financiero',
+        verbose_name="Proyecto"
+    )
+
+    # Cuentas por cobrar
+    ingresos_total = models.DecimalField(
+        max_digits=17,
+        decimal_places=2,
+        default=0,
+        verbose_name="Total ingresos"
+    )
+    ingresos_recibido = models.DecimalField(
+        max_digits=17,
+        decimal_places=2,
+        default=0,
+        verbose_name="Ingresos recibidos"
+    )
+    ingresos_pendiente = models.DecimalField(
+        max_digits=17,
+        decimal_places=2,
+        default=0,
+        verbose_name="Ingresos pendientes"
+    )
+    ingresos_vencido = models.DecimalField(
+        max_digits=17,
+        decimal_places=2,
+        default=0,
+        verbose_name="Ingresos vencidos"
+    )
+
+    # Cuentas por pagar
+    egresos_total = models.DecimalField(
+        max_digits=17,
+        decimal_places=2,
+        default=0,
+        verbose_name="Total egresos"
+    )
+    egresos_pagado = models.DecimalField(
+        max_digits=17,
+        decimal_places=2,
+        default=0,
+        verbose_name="Egresos pagados"
+    )
+    egresos_pendiente = models.DecimalField(
+        max_digits=17,
+        decimal_places=2,
+        default=0,
+        verbose_name="Egresos pendientes"
+    )
+    egresos_vencido = models.DecimalField(
+        max_digits=17,
+        decimal_places=2,
+        default=0,
+        verbose_name="Egresos vencidos"
+    )
+
+    actualizado_en = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        verbose_name = "Resumen financiero del proyecto"
+        verbose_name_plural = "Resúmenes financieros de proyectos"
+        db_table = 'finanzas_resumen_proyecto'
+
+    def __str__(self):
+        return f"Resumen {proyecto_de(self).code}"
+
+    @property
+    def saldo(self):
+        """Diferencia entre lo recibido y lo pagado"""
+        return self.ingresos_recibido - self.egresos_pagado
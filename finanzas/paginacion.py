@@ -0,0 +1,163 @@
+# finanzas/paginacion.py
+"""
+Paginación por clave (keyset/seek) para listados grandes.
+
+En lugar de OFFSET, cada página se pide relativa a la última fila vista:
+WHERE (fecha, creado, id) < (cursor) ORDER BY ... LIMIT n. El costo de la
+página 500 es el mismo que el de la página 1.
+"""
+import base64
+import binascii
+import json
+from datetime import date, datetime
+
+from django.db import connections
+from django.db.models import Q
+
+
+class PaginaKeyset:
+    def __init__(self, object_list, cursor_siguiente=None, cursor_anterior=None):
+        self.object_list = object_list
+        self.cursor_siguiente = cursor_siguiente
+        self.cursor_anterior = cursor_anterior
+
+    def __iter__(self):
+        return iter(self.object_list)
+
+    def __len__(self):
+        return len(self.object_list)
+
+    @property
+    def has_next(self):
+        return self.cursor_siguiente is not None
+
+    @property
+    def has_previous(self):
+        return self.cursor_anterior is not None
+
+
+class KeysetPaginator:
+    """
+    Paginador por clave sobre un orden total.
+    `ordering` es una lista tipo order_by ('-fecha_esperada', '-creado_en', 'id');
+    el último campo debe ser único para que el orden no tenga empates.
+    """
+
+    def __init__(self, queryset, per_page, ordering):
+        self.queryset = queryset
+        self.per_page = per_page
+        self.ordering = list(ordering)
+        self.campos = [campo.lstrip('-') for campo in self.ordering]
+        self.descendente = [campo.startswith('-') for campo in self.ordering]
+
+    # --- Cursores ---
+
+    def codificar(self, obj):
+        valores = []
+        for campo in self.campos:
+            valor = getattr(obj, campo)
+            if isinstance(valor, (date, datetime)):
+                valor = valor.isoformat()
+            valores.append(valor)
+        texto = json.dumps(valores, separators=(',', ':'))
+        return base64.urlsafe_b64encode(texto.encode()).decode().rstrip('=')
+
+    def decodificar(self, cursor):
+        """Devuelve los valores del cursor o None si es inválido"""
+        if not cursor:
+            return None
+        try:
+            relleno = '=' * (-len(cursor) % 4)
+            valores = json.loads(base64.urlsafe_b64decode(cursor + relleno))
+        except (binascii.Error, ValueError, TypeError):
+            return None
+        if not isinstance(valores, list) or len(valores) != len(self.campos):
+            return None
+
+        modelo = self.queryset.model
+        try:
+            return [
+                modelo._meta.get_field(campo).to_python(valor)
+                for campo, valor in zip(self.campos, valores)
+            ]
+        except Exception:
+            return None
+
+    def _condicion(self, valores, hacia_adelante):
+        """
+        Expande (a, b, c) > (x, y, z) respetando la dirección de cada campo:
+        a > x OR (a = x AND b > y) OR (a = x AND b = y AND c > z)
+        """
+        condicion = Q()
+        iguales = {}
+        for campo, valor, desc in zip(self.campos, valores, self.descendente):
+            menor = desc if hacia_adelante else not desc
+            lookup = 'lt' if menor else 'gt'
+            condicion |= Q(**iguales, **{f'{campo}__{lookup}': valor})
+            iguales[campo] = valor
+        return condicion
+
+    # --- Páginas ---
+
+    def page(self, despues=None, antes=None):
+        valores_despues = self.decodificar(despues)
+        valores_antes = self.decodificar(antes) if valores_despues is None else None
+
+        if valores_antes is not None:
+            invertido = [
+                campo[1:] if campo.startswith('-') else f'-{campo}'
+                for campo in self.ordering
+            ]
+            filas = list(
+                self.queryset
+                .filter(self._condicion(valores_antes, hacia_adelante=False))
+                .order_by(*invertido)[:self.per_page + 1]
+            )
+            hay_mas = len(filas) > self.per_page
+            filas = filas[:self.per_page][::-1]
+            return PaginaKeyset(
+                filas,
+                cursor_siguiente=self.codificar(filas[-1]) if filas else None,
+                cursor_anterior=self.codificar(filas[0]) if hay_mas else None,
+            )
+
+        queryset = self.queryset.order_by(*self.ordering)
+        if valores_despues is not None:
+            queryset = queryset.filter(self._condicion(valores_despues, hacia_adelante=True))
+        filas = list(queryset[:self.per_page + 1])
+        hay_mas = len(filas) > self.per_page
+        filas = filas[:self.per_page]
+        return PaginaKeyset(
+            filas,
+            cursor_siguiente=self.codificar(filas[-1]) if hay_mas else None,
+            cursor_anterior=self.codificar(filas[0]) if valores_despues is not None and filas else None,
+        )
+
+
+def estimar_filas(queryset):
+    """
+    Estimación del planificador de PostgreSQL para el queryset (sin ejecutarlo).
+    Devuelve None en otros motores.
+    """
+    connection = connections[queryset.db]
+    if connection.vendor != 'postgresql':
+        return None
+    sql, params = queryset.order_by().query.sql_with_params()
+    with connection.cursor() as cursor:
+        cursor.execute(f'EXPLAIN (FORMAT JSON) {sql}', params)
+        plan = cursor.fetchone()[0]
+    if isinstance(plan, str):
+        plan = json.loads(plan)
+    return int(plan[0]['Plan']['Plan Rows'])
+
+
+def contar_resultados(queryset, limite):
+    """
+    Cuenta exacta hasta `limite` filas; por encima de eso devuelve una
+    estimación. Retorna (cantidad, es_estimado).
+    """
+    cantidad = queryset.order_by()[:limite + 1].count()
+    if cantidad <= limite:
+        return cantidad, False
+    estimado = estimar_filas(queryset)
+    return max(estimado or 0, cantidad), True
@@ -0,0 +1,401 @@
+# finanzas/pagos.py
+"""
+Registro de pagos parciales sin condiciones de carrera.
+
+Cada pago inserta un abono (historial de solo inserción) y suma su monto al
+movimiento con un único UPDATE condicional:
+
+    UPDATE ... SET monto_recibido = monto_recibido + %s, estado = CASE ...
+    WHERE id = %s AND estado IN ('pendiente', 'parcial')
+      AND monto_recibido + %s <= monto_total
+
+Dos pagos concurrentes sobre la misma fila se serializan en el motor y
+ninguno se pierde; si el pago excede el saldo no se escribe nada.
+
+Lo recibido/pagado de un movimiento siempre es la suma de sus abonos: los
+formularios de edición no lo exponen, y lo que un movimiento trae al crearse
+(formulario, admin, importación) queda como abono de apertura. Ver
+verificar_abonos y el comando verificar_abonos.
+"""
+from collections import defaultdict
+from decimal import Decimal
+
+from django.core.exceptions import ValidationError
+from django.db import transaction
+from django.db.models import Case, F, OuterRef, Subquery, Sum, Value, When
+from django.db.models.functions import Coalesce, Greatest
+from django.utils import timezone
+
+from .models import Ingreso, Egreso, AbonoIngreso, AbonoEgreso
+from .presupuestos import aplicar_deltas
+from .proyecciones import marcar_meses_pendientes
+from .resumen import aplicar_deltas_resumen, deltas_abonos
+from .signals import sincronizar_movimiento
+
+
+def _validar_monto(monto):
+    monto = Decimal(monto)
+    if monto <= 0:
+        raise ValidationError('El monto del pago debe ser mayor a 0')
+    return monto
+
+
+def _fecha_que_avanza(modelo, campo_fecha, fecha):
+    """
+    GREATEST(COALESCE(campo, fecha), fecha): la fecha del último pago solo
+    avanza; un abono con fecha anterior no reemplaza una posterior ya registrada
+    """
+    campo = modelo._meta.get_field(campo_fecha)
+    return Greatest(
+        Coalesce(F(campo_fecha), Value(fecha, output_field=campo)),
+        Value(fecha, output_field=campo),
+    )
+
+
+def _aplicar(instance, campo_monto, campo_fecha, estado_completo, monto, campos):
+    """UPDATE condicional; devuelve True si se aplicó"""
+    modelo = type(instance)
+    campos = {**campos, campo_fecha: _fecha_que_avanza(modelo, campo_fecha, campos[campo_fecha])}
+    acumulado = F(campo_monto) + monto
+    actualizadas = (
+        modelo.objects.pendientes()
+        .filter(pk=instance.pk, monto_total__gte=acumulado)
+        .update(
+            **{campo_monto: acumulado},
+            estado=Case(
+                When(monto_total__lte=acumulado, then=Value(estado_completo)),
+                default=Value('parcial'),
+            ),
+            actualizado_en=timezone.now(),
+            **campos
+        )
+    )
+    return actualizadas == 1
+
+
+def _datos_abono(campos, aprobado_por):
+    return {
+        'metodo_pago': campos.get('metodo_pago'),
+        'numero_referencia': campos.get('numero_referencia') or '',
+        'documento_soporte': campos.get('documento_soporte'),
+        'registrado_por': aprobado_por,
+    }
+
+
+def registrar_recepcion(ingreso, monto, fecha=None, metodo_pago=None, aprobado_por=None, **campos):
+    """
+    Registra un abono del ingreso y suma `monto` a lo recibido de forma atómica.
+    `campos` permite escribir en el mismo UPDATE datos del comprobante
+    (numero_referencia, cuenta_bancaria, notas, ...).
+    """
+    monto = _validar_monto(monto)
+    campos['fecha_recepcion'] = fecha or timezone.now().date()
+    if metodo_pago:
+        campos['metodo_pago'] = metodo_pago
+    if aprobado_por is not None:
+        campos['aprobado_por'] = aprobado_por
+
+    with transaction.atomic():
+        if not _aplicar(ingreso, 'monto_recibido', 'fecha_recepcion', 'recibido', monto, campos):
+            raise ValidationError(
+                f'No se pudo registrar el pago de ${monto:,.2f}: el ingreso ya está '
+                f'cerrado o el monto excede el saldo pendiente.'
+            )
+        AbonoIngreso.objects.create(
+            ingreso=ingreso,
+            monto=monto,
+            fecha=campos['fecha_recepcion'],
+            **_datos_abono(campos, aprobado_por)
+        )
+        ingreso.refresh_from_db(fields=['monto_recibido', 'estado', 'actualizado_en', *campos])
+        sincronizar_movimiento(ingreso, deltas=deltas_abonos(
+            Ingreso, [(ingreso.proyecto_id, monto, ingreso.fecha_esperada)]
+        ))
+    return ingreso
+
+
+def registrar_pago(egreso, monto, fecha=None, metodo_pago=None, aprobado_por=None, **campos):
+    """
+    Registra un abono del egreso, suma `monto` a lo pagado de forma atómica
+    y lo pasa de comprometido a gastado en el presupuesto asociado con el
+    mismo tipo de UPDATE (ver finanzas.presupuestos).
+    """
+    monto = _validar_monto(monto)
+    campos['fecha_pago'] = fecha or timezone.now().date()
+    if metodo_pago:
+        campos['metodo_pago'] = metodo_pago
+    if aprobado_por is not None:
+        campos['aprobado_por'] = aprobado_por
+
+    with transaction.atomic():
+        if not _aplicar(egreso, 'monto_pagado', 'fecha_pago', 'pagado', monto, campos):
+            raise ValidationError(
+                f'No se pudo registrar el pago de ${monto:,.2f}: el egreso ya está '
+                f'cerrado o el monto excede el saldo pendiente.'
+            )
+        AbonoEgreso.objects.create(
+            egreso=egreso,
+            monto=monto,
+            fecha=campos['fecha_pago'],
+            **_datos_abono(campos, aprobado_por)
+        )
+        egreso.refresh_from_db(fields=['monto_pagado', 'estado', 'presupuesto', 'actualizado_en', *campos])
+        # El UPDATE no dispara post_save: el delta se aplica aquí. Sea parcial
+        # o total, el saldo comprometido baja exactamente lo que se pagó.
+        if egreso.presupuesto_id:
+            aplicar_deltas({egreso.presupuesto_id: (-monto, monto)})
+        sincronizar_movimiento(egreso, deltas=deltas_abonos(
+            Egreso, [(egreso.proyecto_id, monto, egreso.fecha_vencimiento)]
+        ))
+    return egreso
+
+
+# --- Importación masiva de abonos ---
+
+# modelo de abono -> (modelo padre, FK, campo acumulado, campo de fecha,
+#                     campo de fecha límite, estado completo)
+DESTINOS_ABONO = {
+    AbonoIngreso: (Ingreso, 'ingreso', 'monto_recibido', 'fecha_recepcion', 'fecha_esperada', 'recibido'),
+    AbonoEgreso: (Egreso, 'egreso', 'monto_pagado', 'fecha_pago', 'fecha_vencimiento', 'pagado'),
+}
+
+
+def importar_abonos(abonos, batch_size=1000, **campos):
+    """
+    Inserta en bloque abonos de un mismo tipo (AbonoIngreso o AbonoEgreso, sin
+    guardar) y aplica los acumulados con un solo UPDATE agrupado por movimiento.
+    `campos` se escriben en ese mismo UPDATE en todos los movimientos
+    (metodo_pago, aprobado_por, ...).
+    Si algún movimiento no existe, está cerrado o quedaría sobrepagado, no se
+    escribe nada y se lanza ValidationError. Devuelve la cantidad importada.
+
+    Los movimientos se leen con SELECT ... FOR UPDATE: nadie puede cerrarlos,
+    cancelarlos ni cambiarles el presupuesto hasta que termina la
+    transacción. El UPDATE además repite el filtro de estados abiertos y se
+    compara la cantidad de filas escritas (SQLite no bloquea filas).
+    """
+    abonos = list(abonos)
+    if not abonos:
+        return 0
+    modelo_abono = type(abonos[0])
+    modelo, fk, campo_monto, campo_fecha, campo_limite, estado_completo = DESTINOS_ABONO[modelo_abono]
+    fk_id = f'{fk}_id'
+
+    sumas = defaultdict(Decimal)
+    ultima_fecha = {}
+    for abono in abonos:
+        if type(abono) is not modelo_abono:
+            raise ValueError('Todos los abonos de un lote deben ser del mismo tipo')
+        _validar_monto(abono.monto)
+        padre_id = getattr(abono, fk_id)
+        sumas[padre_id] += abono.monto
+        ultima_fecha[padre_id] = max(abono.fecha, ultima_fecha.get(padre_id, abono.fecha))
+
+    columnas = ['pk', 'proyecto_id', campo_fecha, campo_limite]
+    if modelo is Egreso:
+        columnas.append('presupuesto_id')
+
+    with transaction.atomic():
+        padres = {
+            fila['pk']: fila
+            for fila in (
+                modelo.objects.pendientes()
+                .filter(pk__in=list(sumas))
+                .select_for_update()
+                .order_by('pk')
+                .values(*columnas)
+            )
+        }
+        faltantes = set(sumas) - set(padres)
+        if faltantes:
+            raise ValidationError(
+                f'Movimientos inexistentes o cerrados: {", ".join(map(str, sorted(faltantes)))}'
+            )
+
+        modelo_abono.objects.bulk_create(abonos, batch_size=batch_size)
+
+        delta = Case(
+            *[When(pk=pk, then=Value(suma)) for pk, suma in sumas.items()],
+            output_field=modelo._meta.get_field(campo_monto),
+        )
+        acumulado = F(campo_monto) + delta
+        fecha_pago = Case(
+            *[
+                When(pk=pk, then=_fecha_que_avanza(modelo, campo_fecha, fecha))
+                for pk, fecha in ultima_fecha.items()
+            ],
+            output_field=modelo._meta.get_field(campo_fecha),
+        )
+        actualizados = modelo.objects.pendientes().filter(pk__in=list(sumas)).update(**{
+            campo_monto: acumulado,
+            'estado': Case(
+                When(monto_total__lte=acumulado, then=Value(estado_completo)),
+                default=Value('parcial'),
+            ),
+            campo_fecha: fecha_pago,
+            'actualizado_en': timezone.now(),
+            **campos,
+        })
+        if actualizados != len(sumas):
+            raise ValidationError('Otro proceso cerró o canceló alguno de los movimientos; no se importó nada')
+
+        sobrepagados = list(modelo.objects.filter(
+            pk__in=list(sumas), **{f'{campo_monto}__gt': F('monto_total')}
+        ).values_list('pk', flat=True))
+        if sobrepagados:
+            raise ValidationError(
+                f'Los abonos exceden el saldo de: {", ".join(map(str, sorted(sobrepagados)))}'
+            )
+
+        if modelo is Egreso:
+            deltas = defaultdict(lambda: [Decimal('0.00'), Decimal('0.00')])
+            for pk, suma in sumas.items():
+                if padres[pk]['presupuesto_id']:
+                    delta = deltas[padres[pk]['presupuesto_id']]
+                    delta[0] -= suma
+                    delta[1] += suma
+            aplicar_deltas(deltas)
+
+        aplicar_deltas_resumen(deltas_abonos(modelo, [
+            (padres[pk]['proyecto_id'], suma, padres[pk][campo_limite])
+            for pk, suma in sumas.items()
+        ]))
+        meses = set()
+        for pk, fila in padres.items():
+            for fecha in (fila[campo_fecha], ultima_fecha[pk]):
+                if fecha is not None:
+                    meses.add((fila['proyecto_id'], fecha.year, fecha.month))
+        marcar_meses_pendientes(meses)
+
+    return len(abonos)
+
+
+# --- Corrida de pagos ---
+
+def pagar_egresos(egresos, fecha=None, metodo_pago=None, aprobado_por=None,
+                  numero_referencia='', batch_size=1000):
+    """
+    Paga el saldo completo de varios egresos a la vez (p. ej. la corrida
+    semanal a proveedores). `egresos` es un queryset o una lista de IDs; los
+    que ya estén pagados o cancelados se ignoran.
+
+    Los saldos se leen con SELECT ... FOR UPDATE, así que no cambian hasta
+    que termina la transacción; el resto es el mismo camino en bloque de
+    importar_abonos (un INSERT de abonos, un UPDATE de egresos, un UPDATE de
+    presupuestos). Devuelve (egresos pagados, monto total).
+    """
+    fecha = fecha or timezone.now().date()
+    campos = {}
+    if metodo_pago:
+        campos['metodo_pago'] = metodo_pago
+    if aprobado_por is not None:
+        campos['aprobado_por'] = aprobado_por
+
+    with transaction.atomic():
+        saldos = list(
+            Egreso.objects.pendientes()
+            .filter(pk__in=egresos, monto_total__gt=F('monto_pagado'))
+            .select_for_update()
+            .order_by('pk')
+            .values_list('pk', F('monto_total') - F('monto_pagado'))
+        )
+        abonos = [
+            AbonoEgreso(
+                egreso_id=pk,
+                monto=saldo,
+                fecha=fecha,
+                metodo_pago=metodo_pago,
+                numero_referencia=numero_referencia,
+                registrado_por=aprobado_por,
+            )
+            for pk, saldo in saldos
+        ]
+        importar_abonos(abonos, batch_size=batch_size, **campos)
+    return len(abonos), sum((saldo for _, saldo in saldos), Decimal('0.00'))
+
+
+# --- Abonos de apertura y conciliación ---
+
+# modelo -> (modelo de abono, FK, campo acumulado, campo de fecha)
+ABONOS_DE = {
+    modelo: (modelo_abono, fk, campo_monto, campo_fecha)
+    for modelo_abono, (modelo, fk, campo_monto, campo_fecha, *_) in DESTINOS_ABONO.items()
+}
+
+
+def _abono_de_apertura(movimiento, monto, hoy):
+    modelo_abono, fk, _, campo_fecha = ABONOS_DE[type(movimiento)]
+    return modelo_abono(
+        **{f'{fk}_id': movimiento.pk},
+        monto=monto,
+        fecha=getattr(movimiento, campo_fecha) or hoy,
+        metodo_pago=movimiento.metodo_pago,
+        numero_referencia=getattr(movimiento, 'numero_referencia', '') or '',
+        registrado_por_id=movimiento.creado_por_id,
+    )
+
+
+def registrar_abonos_de_apertura(movimientos, batch_size=1000):
+    """
+    Inserta un abono por lo que ya traen recibido/pagado movimientos recién
+    creados (de un mismo modelo), para que el historial cuadre con el
+    acumulado. No toca el movimiento: su columna ya incluye ese monto.
+    Devuelve la cantidad de abonos creados.
+    """
+    movimientos = list(movimientos)
+    if not movimientos:
+        return 0
+    modelo_abono, _, campo_monto, _ = ABONOS_DE[type(movimientos[0])]
+    hoy = timezone.now().date()
+    abonos = [
+        _abono_de_apertura(movimiento, getattr(movimiento, campo_monto), hoy)
+        for movimiento in movimientos
+        if getattr(movimiento, campo_monto)
+    ]
+    modelo_abono.objects.bulk_create(abonos, batch_size=batch_size)
+    return len(abonos)
+
+
+def verificar_abonos(modelo, movimientos=None):
+    """
+    Movimientos (Ingreso o Egreso) cuyo acumulado no coincide con la suma de
+    sus abonos: [(pk, acumulado, suma de abonos), ...] ordenados por pk.
+    Una sola consulta con subconsulta correlacionada.
+    """
+    modelo_abono, fk, campo_monto, _ = ABONOS_DE[modelo]
+    sumas = (
+        modelo_abono.objects.filter(**{fk: OuterRef('pk')})
+        .order_by().values(fk)
+        .annotate(total=Sum('monto'))
+        .values('total')
+    )
+    campo = modelo._meta.get_field(campo_monto)
+    consulta = modelo.objects.annotate(
+        suma_abonos=Coalesce(Subquery(sumas, output_field=campo), Value(Decimal('0.00'), output_field=campo))
+    ).exclude(**{campo_monto: F('suma_abonos')})
+    if movimientos is not None:
+        consulta = consulta.filter(pk__in=movimientos)
+    return list(consulta.order_by('pk').values_list('pk', campo_monto, 'suma_abonos'))
+
+
+def completar_abonos(modelo, movimientos=None, batch_size=1000):
+    """
+    Agrega un abono de apertura por la diferencia en los movimientos cuyo
+    acumulado supera la suma de sus abonos (datos anteriores al historial).
+    Los que tienen más abonos que acumulado no se tocan: siguen apareciendo
+    en verificar_abonos. Devuelve la cantidad de abonos creados.
+    """
+    modelo_abono = ABONOS_DE[modelo][0]
+    with transaction.atomic():
+        faltantes = {
+            pk: acumulado - suma
+            for pk, acumulado, suma in verificar_abonos(modelo, movimientos)
+            if acumulado > suma
+        }
+        hoy = timezone.now().date()
+        abonos = [
+            _abono_de_apertura(movimiento, faltantes[movimiento.pk], hoy)
+            for movimiento in modelo.objects.filter(pk__in=list(faltantes)).order_by('pk')
+        ]
+        modelo_abono.objects.bulk_create(abonos, batch_size=batch_size)
+    return len(abonos)
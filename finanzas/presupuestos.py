@@ -0,0 +1,168 @@
+# finanzas/presupuestos.py
+"""
+Consumo de presupuesto derivado de los egresos asociados.
+
+Cada egreso no cancelado con presupuesto aporta:
+
+    monto_gastado       lo pagado (monto_pagado)
+    monto_comprometido  el saldo por pagar mientras está pendiente o parcial
+
+Las escrituras mantienen los acumulados con deltas: se compara el aporte
+original del egreso (ver ValoresOriginalesMixin) con el actual y las
+diferencias de todos los presupuestos tocados se aplican en un único UPDATE
+con F() + CASE, sin leer los presupuestos. reconciliar_presupuestos
+recalcula desde cero con subconsultas correlacionadas para corregir
+cualquier desviación (datos cargados antes, escrituras por fuera del ORM).
+"""
+from collections import defaultdict
+from decimal import Decimal
+
+from django.db.models import Case, F, OuterRef, Q, Subquery, Sum, Value, When
+from django.db.models.functions import Coalesce
+from django.utils import timezone
+
+from .models import Egreso, EgresoQuerySet, Presupuesto
+from .tablero import invalidar_tableros
+
+CERO = Decimal('0.00')
+
+
+def aporte(presupuesto_id, estado, monto_total, monto_pagado):
+    """(comprometido, gastado) que un egreso suma a su presupuesto, o None"""
+    if presupuesto_id is None or estado in (None, 'cancelado'):
+        return None
+    gastado = monto_pagado or CERO
+    if estado in EgresoQuerySet.estados_abiertos:
+        return (monto_total or CERO) - gastado, gastado
+    return CERO, gastado
+
+
+def _aporte_original(egreso):
+    return aporte(*[
+        egreso.valor_original(attname)
+        for attname in ('presupuesto_id', 'estado', 'monto_total', 'monto_pagado')
+    ])
+
+
+def _aporte_actual(egreso):
+    return aporte(egreso.presupuesto_id, egreso.estado, egreso.monto_total, egreso.monto_pagado)
+
+
+def _sumar(deltas, presupuesto_id, comprometido, gastado):
+    acumulado = deltas[presupuesto_id]
+    acumulado[0] += comprometido
+    acumulado[1] += gastado
+
+
+def deltas_egreso(egreso, eliminado=False):
+    """
+    {presupuesto_id: [comprometido, gastado]} entre lo que el egreso aportaba
+    al cargarse y lo que aporta ahora (nada si se eliminó). Cubre cambios de
+    monto, de estado y de presupuesto.
+    """
+    deltas = defaultdict(lambda: [CERO, CERO])
+    anterior = _aporte_original(egreso)
+    if anterior:
+        _sumar(deltas, egreso.valor_original('presupuesto_id'), -anterior[0], -anterior[1])
+    actual = None if eliminado else _aporte_actual(egreso)
+    if actual:
+        _sumar(deltas, egreso.presupuesto_id, *actual)
+    return deltas
+
+
+def deltas_nuevos(egresos):
+    """Deltas de egresos recién insertados (p. ej. con bulk_create)"""
+    deltas = defaultdict(lambda: [CERO, CERO])
+    for egreso in egresos:
+        actual = _aporte_actual(egreso)
+        if actual:
+            _sumar(deltas, egreso.presupuesto_id, *actual)
+    return deltas
+
+
+def aplicar_deltas(deltas):
+    """Suma los deltas a los presupuestos con un solo UPDATE"""
+    deltas = {
+        pk: (comprometido, gastado)
+        for pk, (comprometido, gastado) in deltas.items()
+        if comprometido or gastado
+    }
+    if not deltas:
+        return 0
+
+    def caso(posicion, campo):
+        return Case(
+            *[When(pk=pk, then=Value(valores[posicion])) for pk, valores in deltas.items()],
+            default=Value(CERO),
+            output_field=Presupuesto._meta.get_field(campo),
+        )
+
+    return Presupuesto.objects.filter(pk__in=list(deltas)).update(
+        monto_comprometido=F('monto_comprometido') + caso(0, 'monto_comprometido'),
+        monto_gastado=F('monto_gastado') + caso(1, 'monto_gastado'),
+        actualizado_en=timezone.now(),
+    )
+
+
+# --- Reconciliación ---
+
+def _subconsulta(queryset, expresion):
+    valores = (
+        queryset
+        .filter(presupuesto=OuterRef('pk'))
+        .order_by()
+        .values('presupuesto')
+        .annotate(total=Sum(expresion))
+        .values('total')
+    )
+    return Coalesce(Subquery(valores), Value(CERO), output_field=Presupuesto._meta.get_field('monto_gastado'))
+
+
+def _esperados():
+    vigentes = Egreso.objects.exclude(estado='cancelado')
+    return {
+        'monto_comprometido': _subconsulta(vigentes.pendientes(), F('monto_total') - F('monto_pagado')),
+        'monto_gastado': _subconsulta(vigentes, F('monto_pagado')),
+    }
+
+
+def verificar_presupuestos(presupuesto_ids=None):
+    """
+    Presupuestos cuyos acumulados no coinciden con sus egresos, en una
+    consulta. Devuelve [(presupuesto_id, campo, guardado, esperado), ...].
+    """
+    esperados = _esperados()
+    presupuestos = Presupuesto.objects.all()
+    if presupuesto_ids is not None:
+        presupuestos = presupuestos.filter(pk__in=list(presupuesto_ids))
+    filas = (
+        presupuestos
+        .annotate(**{f'esperado_{campo}': expresion for campo, expresion in esperados.items()})
+        .filter(
+            ~Q(monto_comprometido=F('esperado_monto_comprometido'))
+            | ~Q(monto_gastado=F('esperado_monto_gastado'))
+        )
+        .order_by('pk')
+        .values('pk', *esperados, *[f'esperado_{campo}' for campo in esperados])
+    )
+    return [
+        (fila['pk'], campo, fila[campo], fila[f'esperado_{campo}'])
+        for fila in filas
+        for campo in esperados
+        if fila[campo] != fila[f'esperado_{campo}']
+    ]
+
+
+def reconciliar_presupuestos(presupuesto_ids=None):
+    """
+    Recalcula monto_comprometido y monto_gastado desde los egresos con un
+    único UPDATE de subconsultas correlacionadas. Devuelve las filas escritas.
+    """
+    presupuestos = Presupuesto.objects.all()
+    proyecto_ids = None
+    if presupuesto_ids is not None:
+        presupuestos = presupuestos.filter(pk__in=list(presupuesto_ids))
+        proyecto_ids = set(presupuestos.values_list('proyecto_id', flat=True))
+    escritas = presupuestos.update(**_esperados(), actualizado_en=timezone.now())
+    invalidar_tableros(proyecto_ids)
+    return escritas
@@ -0,0 +1,362 @@
+# finanzas/proyecciones.py
+"""
+Motor de proyección de flujo de caja.
+
+Deriva ProyeccionFlujoCaja desde el libro de ingresos y egresos:
+
+- ingresos_reales:      monto_recibido agrupado por fecha_recepcion
+- ingresos_proyectados: monto_total agrupado por fecha_esperada
+- egresos_reales:       monto_pagado agrupado por fecha_pago
+- egresos_proyectados:  monto_total agrupado por fecha_vencimiento
+
+Cada flujo es una sola consulta GROUP BY proyecto, año, mes para todos los
+proyectos. Los saldos se encadenan mes a mes: los meses cerrados usan el flujo
+real y el mes en curso y los futuros usan el proyectado. Las filas se escriben
+con bulk_create(update_conflicts=True) sobre (proyecto, mes, año).
+"""
+from collections import defaultdict
+from datetime import date
+from decimal import Decimal
+from functools import reduce
+from operator import or_
+
+from django.db.models import F, Q, Sum
+from django.db.models.functions import ExtractMonth, ExtractYear
+from django.utils import timezone
+
+from .models import Ingreso, Egreso, MesPendienteProyeccion, ProyeccionFlujoCaja
+
+
+CERO = Decimal('0.00')
+
+# (modelo, campo de fecha, campo de monto, campo de ProyeccionFlujoCaja)
+FLUJOS = [
+    (Ingreso, 'fecha_recepcion', 'monto_recibido', 'ingresos_reales'),
+    (Ingreso, 'fecha_esperada', 'monto_total', 'ingresos_proyectados'),
+    (Egreso, 'fecha_pago', 'monto_pagado', 'egresos_reales'),
+    (Egreso, 'fecha_vencimiento', 'monto_total', 'egresos_proyectados'),
+]
+
+CAMPOS_FLUJO = [campo for _, _, _, campo in FLUJOS]
+
+CAMPOS_ACTUALIZADOS = CAMPOS_FLUJO + ['saldo_inicial', 'saldo_final', 'actualizado_en']
+
+
+def siguiente_mes(periodo):
+    año, mes = periodo
+    return (año + 1, 1) if mes == 12 else (año, mes + 1)
+
+
+def mes_anterior(periodo):
+    año, mes = periodo
+    return (año - 1, 12) if mes == 1 else (año, mes - 1)
+
+
+def rango_meses(desde, hasta):
+    periodo = desde
+    while periodo <= hasta:
+        yield periodo
+        periodo = siguiente_mes(periodo)
+
+
+def _flujos_vacios():
+    return {campo: CERO for campo in CAMPOS_FLUJO}
+
+
+def agregar_flujos(proyecto_ids=None, filtros=None):
+    """
+    Agrega los cuatro flujos por (proyecto, año, mes).
+    `filtros` opcional: {campo_fecha: Q} para acotar cada consulta.
+    Devuelve {proyecto_id: {(año, mes): {campo: valor}}}.
+    """
+    flujos = defaultdict(lambda: defaultdict(_flujos_vacios))
+
+    for modelo, campo_fecha, campo_monto, campo_destino in FLUJOS:
+        queryset = modelo.objects.exclude(estado='cancelado').filter(
+            **{f'{campo_fecha}__isnull': False}
+        )
+        if proyecto_ids is not None:
+            queryset = queryset.filter(proyecto_id__in=list(proyecto_ids))
+        if filtros and campo_fecha in filtros:
+            queryset = queryset.filter(filtros[campo_fecha])
+
+        filas = (
+            queryset
+            .annotate(anio=ExtractYear(campo_fecha), mes=ExtractMonth(campo_fecha))
+            .order_by()
+            .values('proyecto_id', 'anio', 'mes')
+            .annotate(total=Sum(campo_monto))
+        )
+        for fila in filas:
+            periodo = (fila['anio'], fila['mes'])
+            flujos[fila['proyecto_id']][periodo][campo_destino] = fila['total'] or CERO
+
+    return flujos
+
+
+def flujo_neto(flujos_mes, periodo, mes_actual):
+    """Real para meses cerrados; proyectado para el mes en curso y futuros"""
+    if periodo < mes_actual:
+        return flujos_mes['ingresos_reales'] - flujos_mes['egresos_reales']
+    return flujos_mes['ingresos_proyectados'] - flujos_mes['egresos_proyectados']
+
+
+def encadenar_saldos(proyecto_id, flujos_por_mes, meses, saldo_inicial=CERO, mes_actual=None):
+    """
+    Construye las filas de ProyeccionFlujoCaja para los meses dados (en orden),
+    arrastrando el saldo final de cada mes como saldo inicial del siguiente.
+    """
+    mes_actual = mes_actual or _periodo(timezone.now().date())
+    filas = []
+    saldo = saldo_inicial
+    for periodo in meses:
+        valores = flujos_por_mes.get(periodo) or _flujos_vacios()
+        saldo_final = saldo + flujo_neto(valores, periodo, mes_actual)
+        filas.append(ProyeccionFlujoCaja(
+            proyecto_id=proyecto_id,
+            año=periodo[0],
+            mes=periodo[1],
+            saldo_inicial=saldo,
+            saldo_final=saldo_final,
+            **valores
+        ))
+        saldo = saldo_final
+    return filas
+
+
+def guardar_proyecciones(filas, batch_size=1000):
+    """Upsert masivo sobre la clave única (proyecto, mes, año); conserva las notas"""
+    ProyeccionFlujoCaja.objects.bulk_create(
+        filas,
+        batch_size=batch_size,
+        update_conflicts=True,
+        unique_fields=['proyecto', 'mes', 'año'],
+        update_fields=CAMPOS_ACTUALIZADOS,
+    )
+    return len(filas)
+
+
+def _periodo(fecha):
+    return (fecha.year, fecha.month)
+
+
+def generar_proyecciones(proyecto_ids=None, desde=None, hasta=None, batch_size=1000):
+    """
+    Recalcula las proyecciones de los proyectos indicados (todos si es None).
+
+    `desde` / `hasta` (date o (año, mes)) limitan los meses escritos; los
+    saldos siempre se encadenan desde el primer movimiento del proyecto.
+    Devuelve la cantidad de filas escritas.
+    """
+    if isinstance(desde, date):
+        desde = _periodo(desde)
+    if isinstance(hasta, date):
+        hasta = _periodo(hasta)
+    mes_actual = _periodo(timezone.now().date())
+
+    flujos = agregar_flujos(proyecto_ids)
+    filas = []
+    for proyecto_id, flujos_por_mes in flujos.items():
+        primero = min(flujos_por_mes)
+        ultimo = max(max(flujos_por_mes), hasta or primero)
+        proyectadas = encadenar_saldos(
+            proyecto_id,
+            flujos_por_mes,
+            rango_meses(primero, ultimo),
+            mes_actual=mes_actual,
+        )
+        filas.extend(
+            fila for fila in proyectadas
+            if (desde is None or (fila.año, fila.mes) >= desde)
+            and (hasta is None or (fila.año, fila.mes) <= hasta)
+        )
+
+    return guardar_proyecciones(filas, batch_size=batch_size)
+
+
+# --- Recalculo incremental ---
+#
+# Las escrituras del libro marcan los meses (proyecto, año, mes) que tocan en
+# MesPendienteProyeccion. procesar_meses_pendientes re-agrega solo esos meses
+# y re-encadena los saldos desde el primer mes marcado de cada proyecto.
+# El cambio de mes no escribe en el libro pero cambia el flujo del mes que
+# cierra (de proyectado a real): lo marca marcar_meses_cerrados.
+
+def _campos_relevantes(modelo):
+    campos = {'proyecto_id', 'estado'}
+    for modelo_flujo, campo_fecha, campo_monto, _ in FLUJOS:
+        if modelo_flujo is modelo:
+            campos.update((campo_fecha, campo_monto))
+    return campos
+
+
+def _fechas_del_modelo(modelo):
+    return [campo_fecha for modelo_flujo, campo_fecha, _, _ in FLUJOS if modelo_flujo is modelo]
+
+
+def meses_afectados(instance, eliminado=False):
+    """
+    Meses (proyecto_id, año, mes) cuya proyección cambia por la escritura de
+    un Ingreso/Egreso, considerando sus valores antes y después.
+    """
+    modelo = type(instance)
+    originales = getattr(instance, '_valores_originales', None) or {}
+    actuales = {
+        campo: instance.__dict__.get(campo) for campo in _campos_relevantes(modelo)
+    }
+    if not eliminado and originales and all(
+        originales.get(campo) == valor for campo, valor in actuales.items()
+    ):
+        return set()
+
+    meses = set()
+    for valores in (originales, actuales):
+        proyecto_id = valores.get('proyecto_id')
+        if proyecto_id is None:
+            continue
+        for campo_fecha in _fechas_del_modelo(modelo):
+            fecha = valores.get(campo_fecha)
+            if fecha is not None:
+                meses.add((proyecto_id, fecha.year, fecha.month))
+    return meses
+
+
+def marcar_meses_pendientes(meses):
+    """Registra meses a recalcular; si ya estaban marcados, renueva la marca"""
+    if not meses:
+        return
+    ahora = timezone.now()
+    MesPendienteProyeccion.objects.bulk_create(
+        [
+            MesPendienteProyeccion(proyecto_id=proyecto_id, año=año, mes=mes, marcado_en=ahora)
+            for proyecto_id, año, mes in meses
+        ],
+        update_conflicts=True,
+        unique_fields=['proyecto', 'año', 'mes'],
+        update_fields=['marcado_en'],
+    )
+
+
+def marcar_meses_cerrados(mes_actual=None):
+    """
+    Marca los meses ya cerrados cuya fila se calculó cuando aún estaban en
+    curso o eran futuros (actualizado_en dentro o antes del propio mes): su
+    saldo sigue usando el flujo proyectado. Normalmente es el mes anterior
+    de cada proyecto, una vez por mes. Devuelve la cantidad de meses marcados.
+    """
+    año, mes = mes_actual or _periodo(timezone.now().date())
+    meses = set(
+        ProyeccionFlujoCaja.objects
+        .filter(Q(año__lt=año) | Q(año=año, mes__lt=mes))
+        .annotate(
+            anio_calculo=ExtractYear('actualizado_en'),
+            mes_calculo=ExtractMonth('actualizado_en'),
+        )
+        .filter(Q(anio_calculo__lt=F('año')) | Q(anio_calculo=F('año'), mes_calculo__lte=F('mes')))
+        .values_list('proyecto_id', 'año', 'mes')
+    )
+    marcar_meses_pendientes(meses)
+    return len(meses)
+
+
+def _inicio_mes(periodo):
+    return date(periodo[0], periodo[1], 1)
+
+
+def _filtros_por_meses(meses_por_proyecto):
+    """Un Q por campo de fecha que cubre exactamente los meses marcados"""
+    filtros = {}
+    for _, campo_fecha, _, _ in FLUJOS:
+        condiciones = [
+            Q(
+                proyecto_id=proyecto_id,
+                **{
+                    f'{campo_fecha}__gte': _inicio_mes(periodo),
+                    f'{campo_fecha}__lt': _inicio_mes(siguiente_mes(periodo)),
+                }
+            )
+            for proyecto_id, periodos in meses_por_proyecto.items()
+            for periodo in periodos
+        ]
+        filtros[campo_fecha] = reduce(or_, condiciones)
+    return filtros
+
+
+def recalcular_meses(meses_por_proyecto):
+    """
+    Recalcula los meses marcados {proyecto_id: {(año, mes), ...}}.
+    Solo re-agrega esos meses; los demás flujos se toman de las filas guardadas
+    y los saldos se re-encadenan desde el primer mes marcado de cada proyecto.
+    """
+    if not meses_por_proyecto:
+        return 0
+    mes_actual = _periodo(timezone.now().date())
+    nuevos_flujos = agregar_flujos(meses_por_proyecto, _filtros_por_meses(meses_por_proyecto))
+
+    # Filas guardadas desde el mes anterior al primero marcado de cada proyecto
+    condiciones = []
+    for proyecto_id, periodos in meses_por_proyecto.items():
+        año, mes = mes_anterior(min(periodos))
+        condiciones.append(
+            Q(proyecto_id=proyecto_id) & (Q(año__gt=año) | Q(año=año, mes__gte=mes))
+        )
+    guardadas = defaultdict(dict)
+    for fila in ProyeccionFlujoCaja.objects.filter(reduce(or_, condiciones)).values(
+        'proyecto_id', 'año', 'mes', 'saldo_final', *CAMPOS_FLUJO
+    ):
+        guardadas[fila['proyecto_id']][(fila['año'], fila['mes'])] = fila
+
+    filas = []
+    for proyecto_id, periodos in meses_por_proyecto.items():
+        primero = min(periodos)
+        existentes = guardadas.get(proyecto_id, {})
+        anterior = existentes.get(mes_anterior(primero))
+
+        if not existentes:
+            # Sin historia guardada: generación completa de este proyecto
+            generar_proyecciones([proyecto_id])
+            continue
+
+        flujos_por_mes = {
+            periodo: {campo: fila[campo] for campo in CAMPOS_FLUJO}
+            for periodo, fila in existentes.items()
+        }
+        for periodo in periodos:
+            flujos_por_mes[periodo] = nuevos_flujos.get(proyecto_id, {}).get(periodo) or _flujos_vacios()
+
+        ultimo = max(max(flujos_por_mes), max(periodos))
+        filas.extend(encadenar_saldos(
+            proyecto_id,
+            flujos_por_mes,
+            rango_meses(primero, ultimo),
+            saldo_inicial=anterior['saldo_final'] if anterior else CERO,
+            mes_actual=mes_actual,
+        ))
+
+    return guardar_proyecciones(filas)
+
+
+def procesar_meses_pendientes(limite=500):
+    """
+    Consume hasta `limite` meses marcados. Una marca renovada mientras se
+    procesaba (marcado_en distinto) no se borra y se procesa en la siguiente
+    pasada. Devuelve la cantidad de meses procesados.
+    """
+    pendientes = list(
+        MesPendienteProyeccion.objects.order_by('marcado_en')
+        .values('id', 'proyecto_id', 'año', 'mes', 'marcado_en')[:limite]
+    )
+    if not pendientes:
+        return 0
+
+    meses_por_proyecto = defaultdict(set)
+    for pendiente in pendientes:
+        meses_por_proyecto[pendiente['proyecto_id']].add((pendiente['año'], pendiente['mes']))
+
+    recalcular_meses(meses_por_proyecto)
+
+    MesPendienteProyeccion.objects.filter(reduce(or_, (
+        Q(id=pendiente['id'], marcado_en=pendiente['marcado_en'])
+        for pendiente in pendientes
+    ))).delete()
+    return len(pendientes)
@@ -0,0 +1,293 @@
+# finanzas/resumen.py
+"""
+Mantenimiento de ResumenFinancieroProyecto.
+
+Cada escritura de Ingreso/Egreso aplica deltas: se compara el aporte
+original del movimiento (ver ValoresOriginalesMixin) con el actual y las
+diferencias de todos los proyectos tocados se suman en un único UPDATE con
+F() + CASE, como finanzas.presupuestos con los presupuestos. El costo no
+crece con el libro y dos escrituras concurrentes sobre el mismo proyecto se
+serializan en la fila del resumen sin pisarse.
+
+Si un proyecto todavía no tiene resumen, o la instancia no trae sus valores
+originales (cargada con only()), se recalcula desde el libro.
+
+Los *_vencido dependen de la fecha: un movimiento abierto pasa a vencido sin
+que nadie lo escriba. Los deltas usan la fecha del día de la escritura y el
+comando reconstruir_resumen_financiero (diario) pone los vencidos al día.
+
+Como todas las escrituras de montos pasan por aquí, también se invalida el
+tablero (finanzas.tablero) de los miembros de esos proyectos.
+"""
+from collections import defaultdict
+from decimal import Decimal
+
+from django.db.models import Case, F, Sum, Value, When
+from django.utils import timezone
+
+from proyectos.models import Project
+from .models import Ingreso, IngresoQuerySet, Egreso, EgresoQuerySet, ResumenFinancieroProyecto
+from .tablero import invalidar_tableros
+
+
+CAMPOS_RESUMEN = [
+    'ingresos_total',
+    'ingresos_recibido',
+    'ingresos_pendiente',
+    'ingresos_vencido',
+    'egresos_total',
+    'egresos_pagado',
+    'egresos_pendiente',
+    'egresos_vencido',
+]
+
+CERO = Decimal('0.00')
+
+
+def _resumen_vacio():
+    return {campo: CERO for campo in CAMPOS_RESUMEN}
+
+
+def calcular_resumenes(proyecto_ids=None, hoy=None):
+    """
+    Calcula los totales por proyecto directamente desde el libro.
+    Devuelve {proyecto_id: {campo: valor}}; los proyectos sin movimientos
+    quedan en cero. Los registros cancelados no suman.
+    """
+    hoy = hoy or timezone.now().date()
+
+    if proyecto_ids is None:
+        proyecto_ids = Project.objects.values_list('pk', flat=True)
+    resumenes = {pk: _resumen_vacio() for pk in proyecto_ids}
+    if not resumenes:
+        return resumenes
+
+    ingresos = (
+        Ingreso.objects
+        .filter(proyecto_id__in=list(resumenes))
+        .exclude(estado='cancelado')
+        .order_by()
+        .values('proyecto_id')
+        .annotate(
+            total=Sum('monto_total'),
+            recibido=Sum('monto_recibido'),
+            vencido=Sum(
+                F('monto_total') - F('monto_recibido'),
+                filter=Ingreso.objects.q_vencido(hoy),
+            ),
+        )
+    )
+    for fila in ingresos:
+        resumen = resumenes[fila['proyecto_id']]
+        resumen['ingresos_total'] = fila['total'] or CERO
+        resumen['ingresos_recibido'] = fila['recibido'] or CERO
+        resumen['ingresos_pendiente'] = resumen['ingresos_total'] - resumen['ingresos_recibido']
+        resumen['ingresos_vencido'] = fila['vencido'] or CERO
+
+    egresos = (
+        Egreso.objects
+        .filter(proyecto_id__in=list(resumenes))
+        .exclude(estado='cancelado')
+        .order_by()
+        .values('proyecto_id')
+        .annotate(
+            total=Sum('monto_total'),
+            pagado=Sum('monto_pagado'),
+            vencido=Sum(
+                F('monto_total') - F('monto_pagado'),
+                filter=Egreso.objects.q_vencido(hoy),
+            ),
+        )
+    )
+    for fila in egresos:
+        resumen = resumenes[fila['proyecto_id']]
+        resumen['egresos_total'] = fila['total'] or CERO
+        resumen['egresos_pagado'] = fila['pagado'] or CERO
+        resumen['egresos_pendiente'] = resumen['egresos_total'] - resumen['egresos_pagado']
+        resumen['egresos_vencido'] = fila['vencido'] or CERO
+
+    return resumenes
+
+
+def recalcular_resumenes(proyecto_ids=None, batch_size=1000):
+    """
+    Recalcula y guarda los resúmenes de los proyectos indicados
+    (todos si proyecto_ids es None). Devuelve la cantidad de filas escritas.
+    """
+    if proyecto_ids is not None:
+        proyecto_ids = {pk for pk in proyecto_ids if pk is not None}
+        if not proyecto_ids:
+            return 0
+        # Solo proyectos que siguen existiendo
+        proyecto_ids = list(Project.objects.filter(pk__in=proyecto_ids).values_list('pk', flat=True))
+
+    resumenes = calcular_resumenes(proyecto_ids)
+    filas = [
+        ResumenFinancieroProyecto(proyecto_id=pk, **valores)
+        for pk, valores in resumenes.items()
+    ]
+    ResumenFinancieroProyecto.objects.bulk_create(
+        filas,
+        batch_size=batch_size,
+        update_conflicts=True,
+        unique_fields=['proyecto'],
+        update_fields=CAMPOS_RESUMEN + ['actualizado_en'],
+    )
+    invalidar_tableros(proyecto_ids)
+    return len(filas)
+
+
+# --- Deltas ---
+
+# modelo -> (prefijo en el resumen, campo acumulado, sufijo en el resumen, queryset)
+COLUMNAS_MOVIMIENTO = {
+    Ingreso: ('ingresos', 'monto_recibido', 'recibido', IngresoQuerySet),
+    Egreso: ('egresos', 'monto_pagado', 'pagado', EgresoQuerySet),
+}
+
+
+def _atributos(modelo):
+    _, campo_acumulado, _, queryset = COLUMNAS_MOVIMIENTO[modelo]
+    return ('proyecto_id', 'estado', 'monto_total', campo_acumulado, queryset.campo_fecha_limite)
+
+
+def aporte(modelo, estado, monto_total, monto_acumulado, fecha_limite, hoy):
+    """{campo: valor} que un movimiento suma al resumen de su proyecto, o None"""
+    if estado in (None, 'cancelado'):
+        return None
+    prefijo, _, sufijo, queryset = COLUMNAS_MOVIMIENTO[modelo]
+    total = monto_total or CERO
+    acumulado = monto_acumulado or CERO
+    vencido = (
+        estado in queryset.estados_abiertos
+        and fecha_limite is not None
+        and fecha_limite < hoy
+    )
+    return {
+        f'{prefijo}_total': total,
+        f'{prefijo}_{sufijo}': acumulado,
+        f'{prefijo}_pendiente': total - acumulado,
+        f'{prefijo}_vencido': total - acumulado if vencido else CERO,
+    }
+
+
+def _sumar(deltas, proyecto_id, valores, signo):
+    for campo, valor in valores.items():
+        deltas[proyecto_id][campo] += signo * valor
+
+
+def deltas_resumen(instancias, eliminado=False, hoy=None):
+    """
+    {proyecto_id: {campo: delta}} entre lo que los movimientos aportaban al
+    cargarse y lo que aportan ahora (nada si se eliminaron). Cubre cambios
+    de monto, de estado, de fecha y de proyecto. Devuelve None si alguna
+    instancia guardada no trae sus valores originales completos.
+    """
+    hoy = hoy or timezone.now().date()
+    deltas = defaultdict(lambda: defaultdict(Decimal))
+    for instancia in instancias:
+        modelo = type(instancia)
+        atributos = _atributos(modelo)
+        originales = getattr(instancia, '_valores_originales', None)
+        if originales is not None:
+            if any(atributo not in originales for atributo in atributos):
+                return None
+            proyecto_id, *valores = [originales[atributo] for atributo in atributos]
+            anterior = aporte(modelo, *valores, hoy)
+            if anterior:
+                _sumar(deltas, proyecto_id, anterior, -1)
+        if not eliminado:
+            proyecto_id, *valores = [getattr(instancia, atributo) for atributo in atributos]
+            actual = aporte(modelo, *valores, hoy)
+            if actual:
+                _sumar(deltas, proyecto_id, actual, 1)
+    return deltas
+
+
+def deltas_abonos(modelo, abonos, hoy=None):
+    """
+    Deltas de abonos sumados con UPDATE (finanzas.pagos) a movimientos
+    abiertos. `abonos` son tuplas (proyecto_id, monto, fecha_limite). Se
+    calculan desde el monto y no desde los valores originales, que pueden
+    no incluir otros pagos confirmados entretanto.
+    """
+    hoy = hoy or timezone.now().date()
+    prefijo, _, sufijo, _ = COLUMNAS_MOVIMIENTO[modelo]
+    deltas = defaultdict(lambda: defaultdict(Decimal))
+    for proyecto_id, monto, fecha_limite in abonos:
+        deltas[proyecto_id][f'{prefijo}_{sufijo}'] += monto
+        deltas[proyecto_id][f'{prefijo}_pendiente'] -= monto
+        if fecha_limite is not None and fecha_limite < hoy:
+            deltas[proyecto_id][f'{prefijo}_vencido'] -= monto
+    return deltas
+
+
+def aplicar_deltas_resumen(deltas):
+    """
+    Suma los deltas a los resúmenes con un solo UPDATE; los proyectos sin
+    resumen se recalculan desde el libro. Devuelve la cantidad de proyectos
+    tocados.
+    """
+    deltas = {
+        pk: {campo: valor for campo, valor in campos.items() if valor}
+        for pk, campos in deltas.items()
+        if pk is not None
+    }
+    deltas = {pk: campos for pk, campos in deltas.items() if campos}
+    if not deltas:
+        return 0
+
+    campos = sorted({campo for valores in deltas.values() for campo in valores})
+    actualizados = ResumenFinancieroProyecto.objects.filter(pk__in=list(deltas)).update(
+        **{
+            campo: F(campo) + Case(
+                *[
+                    When(pk=pk, then=Value(valores[campo]))
+                    for pk, valores in deltas.items() if campo in valores
+                ],
+                default=Value(CERO),
+                output_field=ResumenFinancieroProyecto._meta.get_field(campo),
+            )
+            for campo in campos
+        },
+        actualizado_en=timezone.now(),
+    )
+    if actualizados < len(deltas):
+        # Sin resumen todavía: el cálculo desde el libro ya incluye esta escritura
+        existentes = ResumenFinancieroProyecto.objects.filter(
+            pk__in=list(deltas)
+        ).values_list('pk', flat=True)
+        recalcular_resumenes(set(deltas) - set(existentes))
+    invalidar_tableros(list(deltas))
+    return len(deltas)
+
+
+def verificar_resumenes(proyecto_ids=None):
+    """
+    Compara los resúmenes guardados con un cálculo desde cero.
+    Devuelve una lista de (proyecto_id, campo, guardado, esperado).
+    """
+    esperados = calcular_resumenes(proyecto_ids)
+    guardados = {
+        fila['proyecto_id']: fila
+        for fila in ResumenFinancieroProyecto.objects.filter(
+            proyecto_id__in=list(esperados)
+        ).values('proyecto_id', *CAMPOS_RESUMEN)
+    }
+
+    diferencias = []
+    for pk, esperado in esperados.items():
+        guardado = guardados.get(pk)
+        for campo in CAMPOS_RESUMEN:
+            valor = guardado[campo] if guardado else None
+            if valor != esperado[campo]:
+                diferencias.append((pk, campo, valor, esperado[campo]))
+    return diferencias
+
+
+def obtener_resumen(proyecto_id):
+    """Resumen de un proyecto con una sola búsqueda por clave primaria"""
+    try:
+        return ResumenFinancieroProyecto.objects.get(pk=proyecto_id)
+    except ResumenFinancieroProyecto.DoesNotExist:
+        return ResumenFinancieroProyecto(proyecto_id=proyecto_id, **_resumen_vacio())
@@ -0,0 +1,85 @@
+# finanzas/signals.py
+from django.db.models.signals import post_save, post_delete
+from django.dispatch import receiver
+
+from proyectos.models import Project, ProjectTeam
+from .models import Ingreso, Egreso, Presupuesto
+from .presupuestos import aplicar_deltas, deltas_egreso
+from .proyecciones import marcar_meses_pendientes, meses_afectados
+from .resumen import aplicar_deltas_resumen, deltas_resumen, recalcular_resumenes
+from .tablero import invalidar_tableros, invalidar_tableros_de_usuarios
+
+
+def _proyectos_afectados(instance):
+    return {instance.proyecto_id, instance.valor_original('proyecto_id')}
+
+
+def _borrado_por_proyecto(origin):
+    """True si el borrado en cascada viene de eliminar el proyecto"""
+    if isinstance(origin, Project):
+        return True
+    return getattr(origin, 'model', None) is Project
+
+
+def sincronizar_movimiento(instance, eliminado=False, deltas=None):
+    """
+    Actualiza las tablas derivadas tras escribir un Ingreso/Egreso.
+    Las escrituras que no pasan por save() (UPDATE con F()) la llaman
+    directamente después de refrescar la instancia, con los `deltas` del
+    resumen ya calculados (ver finanzas.resumen.deltas_abonos).
+    """
+    if deltas is None:
+        deltas = deltas_resumen([instance], eliminado=eliminado)
+    if deltas is not None:
+        aplicar_deltas_resumen(deltas)
+    else:
+        # Cargada con only(): sin valores originales no hay delta posible
+        recalcular_resumenes(_proyectos_afectados(instance))
+    marcar_meses_pendientes(meses_afectados(instance, eliminado=eliminado))
+    if not eliminado:
+        instance.capturar_valores_originales()
+
+
+@receiver(post_save, sender=Ingreso)
+@receiver(post_save, sender=Egreso)
+def movimiento_guardado(sender, instance, raw=False, **kwargs):
+    if raw:
+        return
+    if sender is Egreso:
+        # Antes de sincronizar: los deltas usan los valores originales
+        aplicar_deltas(deltas_egreso(instance))
+    sincronizar_movimiento(instance)
+
+
+@receiver(post_delete, sender=Ingreso)
+@receiver(post_delete, sender=Egreso)
+def movimiento_eliminado(sender, instance, origin=None, **kwargs):
+    if _borrado_por_proyecto(origin):
+        return
+    if sender is Egreso:
+        aplicar_deltas(deltas_egreso(instance, eliminado=True))
+    sincronizar_movimiento(instance, eliminado=True)
+
+
+# --- Tablero financiero ---
+# Los movimientos lo invalidan a través de finanzas.resumen; estos
+# modelos también entran en el tablero pero no tocan el resumen.
+
+@receiver(post_save, sender=Presupuesto)
+@receiver(post_delete, sender=Presupuesto)
+def presupuesto_modificado(sender, instance, **kwargs):
+    invalidar_tableros([instance.proyecto_id])
+
+
+@receiver(post_save, sender=Project)
+def proyecto_guardado(sender, instance, raw=False, **kwargs):
+    if raw:
+        return
+    invalidar_tableros([instance.pk])
+
+
+@receiver(post_save, sender=ProjectTeam)
+@receiver(post_delete, sender=ProjectTeam)
+def equipo_modificado(sender, instance, **kwargs):
+    # Cambia el conjunto de proyectos del usuario, no los montos
+    invalidar_tableros_de_usuarios([instance.user_id])
@@ -0,0 +1,218 @@
+# finanzas/tablero.py
+"""
+Datos del tablero financiero (core.dashboard_view) por usuario.
+
+Todo sale de cinco consultas agregadas sobre los proyectos accesibles del
+usuario, sin recorrer proyecto por proyecto:
+
+    1. Project: monto contratado
+    2. ResumenFinancieroProyecto: totales, recibido/pagado y pendientes
+    3. Ingreso: vencido y flujo esperado de los próximos 30 días (Sum con filter)
+    4. Egreso: lo mismo para las cuentas por pagar
+    5. Presupuesto: planeado/comprometido/gastado agrupado por categoría
+
+Las cinco no dependen entre sí: acalcular_tablero (vistas asíncronas) las
+lanza en paralelo.
+
+El resultado se guarda en caché por usuario y día. Cualquier escritura que
+refresque el resumen de un proyecto (ver finanzas.resumen) o cambie sus
+presupuestos o su equipo borra la entrada de los miembros del proyecto.
+"""
+from datetime import timedelta
+from decimal import Decimal
+
+from asgiref.sync import sync_to_async
+from django.core.cache import cache
+from django.db import transaction
+from django.db.models import F, Q, Sum
+from django.utils import timezone
+
+from core.asincrono import en_paralelo
+from proyectos.acceso import proyectos_accesibles
+from proyectos.models import Project, ProjectTeam
+from .models import Ingreso, Egreso, Presupuesto, ResumenFinancieroProyecto
+
+CACHE_TIMEOUT = 60 * 10
+DIAS_FLUJO = 30
+DIAS_POR_TRAMO = 7
+CERO = Decimal('0.00')
+
+
+def _cache_key(user_id, hoy):
+    return f'finanzas:tablero:{user_id}:{hoy.isoformat()}'
+
+
+def _tramos(hoy):
+    """Semanas [inicio, fin] que cubren los próximos DIAS_FLUJO días"""
+    tramos = []
+    inicio = hoy
+    limite = hoy + timedelta(days=DIAS_FLUJO - 1)
+    while inicio <= limite:
+        fin = min(inicio + timedelta(days=DIAS_POR_TRAMO - 1), limite)
+        tramos.append((inicio, fin))
+        inicio = fin + timedelta(days=1)
+    return tramos
+
+
+def _vencido_y_flujo(modelo, campo_monto, campo_fecha, ids, hoy, tramos):
+    """Una consulta: saldo vencido y saldo abierto que vence en cada tramo"""
+    saldo = F('monto_total') - F(campo_monto)
+    agregados = {'vencido': Sum(saldo, filter=modelo.objects.q_vencido(hoy))}
+    for numero, (inicio, fin) in enumerate(tramos):
+        agregados[f'tramo_{numero}'] = Sum(
+            saldo, filter=Q(**{f'{campo_fecha}__range': (inicio, fin)})
+        )
+    fila = (
+        modelo.objects
+        .filter(proyecto_id__in=ids)
+        .pendientes()
+        .aggregate(**agregados)
+    )
+    return {clave: valor or CERO for clave, valor in fila.items()}
+
+
+def _contratado(ids):
+    return Project.objects.filter(pk__in=ids).aggregate(
+        total=Sum('contract_amount')
+    )['total'] or CERO
+
+
+def _totales(ids):
+    totales = ResumenFinancieroProyecto.objects.filter(proyecto_id__in=ids).aggregate(
+        ingresos_total=Sum('ingresos_total'),
+        ingresos_recibido=Sum('ingresos_recibido'),
+        ingresos_pendiente=Sum('ingresos_pendiente'),
+        egresos_total=Sum('egresos_total'),
+        egresos_pagado=Sum('egresos_pagado'),
+        egresos_pendiente=Sum('egresos_pendiente'),
+    )
+    return {clave: valor or CERO for clave, valor in totales.items()}
+
+
+def _presupuestos(ids):
+    presupuestos = []
+    categorias = dict(Presupuesto.CATEGORIA_PRESUPUESTO)
+    filas = (
+        Presupuesto.objects
+        .filter(proyecto_id__in=ids)
+        .order_by()
+        .values('categoria')
+        .annotate(
+            planeado=Sum('monto_planeado'),
+            comprometido=Sum('monto_comprometido'),
+            gastado=Sum('monto_gastado'),
+        )
+        .order_by('categoria')
+    )
+    for fila in filas:
+        planeado = fila['planeado'] or CERO
+        gastado = fila['gastado'] or CERO
+        presupuestos.append({
+            'categoria': fila['categoria'],
+            'nombre': categorias.get(fila['categoria'], fila['categoria']),
+            'planeado': planeado,
+            'comprometido': fila['comprometido'] or CERO,
+            'gastado': gastado,
+            'porcentaje': round(gastado / planeado * 100, 1) if planeado else Decimal('0.0'),
+        })
+    return presupuestos
+
+
+def _consultas(ids, hoy, tramos):
+    """Las cinco consultas del tablero; no dependen entre sí"""
+    return [
+        lambda: _contratado(ids),
+        lambda: _totales(ids),
+        lambda: _vencido_y_flujo(Ingreso, 'monto_recibido', 'fecha_esperada', ids, hoy, tramos),
+        lambda: _vencido_y_flujo(Egreso, 'monto_pagado', 'fecha_vencimiento', ids, hoy, tramos),
+        lambda: _presupuestos(ids),
+    ]
+
+
+def _armar_tablero(hoy, ids, tramos, contratado, totales, por_cobrar, por_pagar, presupuestos):
+    flujo = []
+    for numero, (inicio, fin) in enumerate(tramos):
+        entradas = por_cobrar[f'tramo_{numero}']
+        salidas = por_pagar[f'tramo_{numero}']
+        flujo.append({
+            'desde': inicio,
+            'hasta': fin,
+            'entradas': entradas,
+            'salidas': salidas,
+            'neto': entradas - salidas,
+        })
+
+    return {
+        'fecha': hoy,
+        'proyectos': len(ids),
+        'contratado': contratado,
+        **totales,
+        'ingresos_vencido': por_cobrar['vencido'],
+        'egresos_vencido': por_pagar['vencido'],
+        'flujo': flujo,
+        'flujo_entradas': sum((tramo['entradas'] for tramo in flujo), CERO),
+        'flujo_salidas': sum((tramo['salidas'] for tramo in flujo), CERO),
+        'presupuestos': presupuestos,
+    }
+
+
+def calcular_tablero(ids, hoy=None):
+    """Indicadores financieros de los proyectos `ids`"""
+    hoy = hoy or timezone.now().date()
+    ids = list(ids)
+    tramos = _tramos(hoy)
+    resultados = [consulta() for consulta in _consultas(ids, hoy, tramos)]
+    return _armar_tablero(hoy, ids, tramos, *resultados)
+
+
+async def acalcular_tablero(ids, hoy=None):
+    """calcular_tablero con las cinco consultas en paralelo (ver core.asincrono)"""
+    hoy = hoy or timezone.now().date()
+    ids = list(ids)
+    tramos = _tramos(hoy)
+    resultados = await en_paralelo(*_consultas(ids, hoy, tramos))
+    return _armar_tablero(hoy, ids, tramos, *resultados)
+
+
+def obtener_tablero(user, hoy=None):
+    """Tablero del usuario desde la caché; se calcula si no está"""
+    hoy = hoy or timezone.now().date()
+    key = _cache_key(user.pk, hoy)
+    tablero = cache.get(key)
+    if tablero is None:
+        tablero = calcular_tablero(proyectos_accesibles(user), hoy=hoy)
+        cache.set(key, tablero, CACHE_TIMEOUT)
+    return tablero
+
+
+async def aobtener_tablero(user, hoy=None):
+    """obtener_tablero para vistas asíncronas (misma entrada de caché)"""
+    hoy = hoy or timezone.now().date()
+    key = _cache_key(user.pk, hoy)
+    tablero = await cache.aget(key)
+    if tablero is None:
+        ids = await sync_to_async(proyectos_accesibles)(user)
+        tablero = await acalcular_tablero(ids, hoy=hoy)
+        await cache.aset(key, tablero, CACHE_TIMEOUT)
+    return tablero
+
+
+def invalidar_tableros_de_usuarios(user_ids, hoy=None):
+    """Borra el tablero del día de cada usuario al confirmar la transacción"""
+    hoy = hoy or timezone.now().date()
+    keys = [_cache_key(user_id, hoy) for user_id in set(user_ids) if user_id is not None]
+    if keys:
+        # Después del commit: antes, otra petición podría volver a guardar
+        # en caché los datos anteriores a la escritura
+        transaction.on_commit(lambda: cache.delete_many(keys))
+
+
+def invalidar_tableros(proyecto_ids=None):
+    """Borra el tablero de los miembros de los proyectos (de todos si es None)"""
+    miembros = ProjectTeam.objects.all()
+    if proyecto_ids is not None:
+        proyecto_ids = [pk for pk in proyecto_ids if pk is not None]
+        if not proyecto_ids:
+            return
+        miembros = miembros.filter(project_id__in=proyecto_ids)
+    invalidar_tableros_de_usuarios(miembros.values_list('user_id', flat=True))
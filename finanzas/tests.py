@@ -1,3 +1,1382 @@
-from django.test import TestCase
+# finanzas/tests.py
+import csv
+import io
+import tempfile
+import time
+import zipfile
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, datetime, timedelta, timezone as dt_timezone
+from decimal import Decimal
+from io import StringIO
+from unittest import mock
+from xml.etree import ElementTree
 
-# Create your tests here.
+from django.core.cache import cache
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.core.exceptions import ValidationError
+from django.core.management import call_command
+from django.core.management.base import CommandError
+from django.db import OperationalError, connection
+from django.db.models import F
+from django.test.utils import CaptureQueriesContext
+from django.test import TestCase, TransactionTestCase
+from django.urls import reverse
+from django.utils import timezone
+
+from auths.models import Auth
+from proyectos.etiquetas import limpiar_etiquetas
+from proyectos.models import Project, ProjectTeam
+from .models import (
+    Ingreso, Egreso, MesPendienteProyeccion, Presupuesto, ProyeccionFlujoCaja,
+    ResumenFinancieroProyecto, AbonoIngreso, AbonoEgreso,
+)
+from .forms import IngresoImportacionForm
+from .importacion import importar_movimientos, leer_csv
+from .pagos import (
+    registrar_pago, registrar_recepcion, importar_abonos, pagar_egresos, verificar_abonos,
+)
+from .presupuestos import verificar_presupuestos
+from .proyecciones import generar_proyecciones, marcar_meses_cerrados, procesar_meses_pendientes
+from .resumen import obtener_resumen, verificar_resumenes
+from .tablero import calcular_tablero, obtener_tablero
+from .views import IngresoListView, EgresoListView
+
+
+def crear_usuario(username='contador'):
+    return Auth.objects.create_user(
+        nombre='Ana',
+        apellido='Pérez',
+        username=username,
+        email=f'{username}@cortesec.test',
+        password='clave-segura-123',
+    )
+
+
+def crear_proyecto(usuario, code='OB-001'):
+    return Project.objects.create(
+        name=f'Obra {code}',
+        code=code,
+        client_name='Cliente',
+        location='Bogotá',
+        start_date=date(2025, 1, 1),
+        end_date=date(2026, 12, 31),
+        contract_amount=Decimal('1000000.00'),
+        budget=Decimal('800000.00'),
+        created_by=usuario,
+    )
+
+
+def asignar(usuario, proyecto, **kwargs):
+    kwargs.setdefault('role', 'accountant')
+    return ProjectTeam.objects.create(project=proyecto, user=usuario, **kwargs)
+
+
+def crear_ingreso(proyecto, monto_total='1000.00', **kwargs):
+    kwargs.setdefault('fecha_esperada', timezone.now().date())
+    return Ingreso.objects.create(
+        proyecto=proyecto,
+        concepto=kwargs.pop('concepto', 'Pago de avance'),
+        monto_total=Decimal(monto_total),
+        **kwargs
+    )
+
+
+def crear_egreso(proyecto, monto_total='500.00', **kwargs):
+    hoy = timezone.now().date()
+    kwargs.setdefault('fecha_emision', hoy)
+    kwargs.setdefault('fecha_vencimiento', hoy)
+    return Egreso.objects.create(
+        proyecto=proyecto,
+        concepto=kwargs.pop('concepto', 'Compra de cemento'),
+        tipo_egreso=kwargs.pop('tipo_egreso', 'material'),
+        proveedor=kwargs.pop('proveedor', 'Ferretería Central'),
+        monto_total=Decimal(monto_total),
+        **kwargs
+    )
+
+
+class ResumenFinancieroTests(TestCase):
+
+    def setUp(self):
+        self.usuario = crear_usuario()
+        self.proyecto = crear_proyecto(self.usuario)
+
+    def test_resumen_se_actualiza_al_guardar_y_eliminar(self):
+        ayer = timezone.now().date() - timedelta(days=1)
+        ingreso = crear_ingreso(self.proyecto, '1000.00', fecha_esperada=ayer)
+        crear_egreso(self.proyecto, '400.00')
+
+        resumen = ResumenFinancieroProyecto.objects.get(pk=self.proyecto.pk)
+        self.assertEqual(resumen.ingresos_total, Decimal('1000.00'))
+        self.assertEqual(resumen.ingresos_pendiente, Decimal('1000.00'))
+        self.assertEqual(resumen.ingresos_vencido, Decimal('1000.00'))
+        self.assertEqual(resumen.egresos_total, Decimal('400.00'))
+
+        ingreso.marcar_como_recibido(monto=Decimal('600.00'))
+        resumen.refresh_from_db()
+        self.assertEqual(resumen.ingresos_recibido, Decimal('600.00'))
+        self.assertEqual(resumen.ingresos_pendiente, Decimal('400.00'))
+        self.assertEqual(resumen.ingresos_vencido, Decimal('400.00'))
+
+        ingreso.delete()
+        resumen.refresh_from_db()
+        self.assertEqual(resumen.ingresos_total, Decimal('0.00'))
+
+    def test_cambio_de_proyecto_actualiza_ambos_resumenes(self):
+        otro = crear_proyecto(self.usuario, code='OB-002')
+        egreso = crear_egreso(self.proyecto, '300.00')
+
+        egreso = Egreso.objects.get(pk=egreso.pk)
+        egreso.proyecto = otro
+        egreso.save()
+
+        self.assertEqual(obtener_resumen(self.proyecto.pk).egresos_total, Decimal('0.00'))
+        self.assertEqual(obtener_resumen(otro.pk).egresos_total, Decimal('300.00'))
+
+    def test_escrituras_aplican_deltas_sin_reagregar(self):
+        ayer = timezone.now().date() - timedelta(days=1)
+        ingreso = crear_ingreso(self.proyecto, '1000.00', fecha_esperada=ayer)
+        egreso = crear_egreso(self.proyecto, '400.00')
+        # Un desfase previo se conserva: la escritura suma, no recalcula
+        ResumenFinancieroProyecto.objects.update(ingresos_total=F('ingresos_total') + 50)
+
+        with CaptureQueriesContext(connection) as consultas:
+            registrar_recepcion(ingreso, '300.00')
+        sql = ' '.join(consulta['sql'] for consulta in consultas.captured_queries)
+        self.assertNotIn('SUM(', sql.upper())
+        self.assertEqual(obtener_resumen(self.proyecto.pk).ingresos_total, Decimal('1050.00'))
+        ResumenFinancieroProyecto.objects.update(ingresos_total=F('ingresos_total') - 50)
+
+        ingreso = Ingreso.objects.get(pk=ingreso.pk)
+        ingreso.fecha_esperada = timezone.now().date()
+        ingreso.save()
+        egreso.estado = 'cancelado'
+        egreso.save()
+        importar_abonos([AbonoIngreso(ingreso=ingreso, monto=Decimal('200.00'), fecha=ayer)])
+        crear_egreso(self.proyecto, '250.00', fecha_vencimiento=ayer)
+        self.assertEqual(verificar_resumenes(), [])
+
+        resumen = obtener_resumen(self.proyecto.pk)
+        self.assertEqual(resumen.ingresos_recibido, Decimal('500.00'))
+        self.assertEqual(resumen.ingresos_vencido, Decimal('0.00'))
+        self.assertEqual(resumen.egresos_total, Decimal('250.00'))
+        self.assertEqual(resumen.egresos_vencido, Decimal('250.00'))
+
+    def test_instancia_parcial_recalcula_desde_el_libro(self):
+        crear_ingreso(self.proyecto, '1000.00')
+        ingreso = Ingreso.objects.only('pk', 'monto_total').get()
+        ingreso.monto_total = Decimal('700.00')
+        ingreso.save(update_fields=['monto_total'])
+        self.assertEqual(verificar_resumenes(), [])
+        self.assertEqual(obtener_resumen(self.proyecto.pk).ingresos_total, Decimal('700.00'))
+
+    def test_eliminar_proyecto_no_recrea_resumen(self):
+        crear_ingreso(self.proyecto)
+        self.proyecto.delete()
+        self.assertFalse(ResumenFinancieroProyecto.objects.exists())
+
+    def test_comando_reconstruye_y_verifica(self):
+        crear_ingreso(self.proyecto, '1000.00')
+        ResumenFinancieroProyecto.objects.update(ingresos_total=0)
+
+        with self.assertRaises(CommandError):
+            call_command('reconstruir_resumen_financiero', '--solo-verificar', stdout=StringIO())
+
+        salida = StringIO()
+        call_command('reconstruir_resumen_financiero', stdout=salida)
+        self.assertIn('sin diferencias', salida.getvalue())
+        self.assertEqual(obtener_resumen(self.proyecto.pk).ingresos_total, Decimal('1000.00'))
+
+
+class VencimientoQuerySetTests(TestCase):
+
+    def setUp(self):
+        self.usuario = crear_usuario()
+        self.proyecto = crear_proyecto(self.usuario)
+        self.hoy = timezone.now().date()
+
+    def test_vencidos_y_pendientes_en_sql(self):
+        vencido = crear_ingreso(self.proyecto, fecha_esperada=self.hoy - timedelta(days=5))
+        crear_ingreso(self.proyecto, fecha_esperada=self.hoy + timedelta(days=5))
+        crear_ingreso(
+            self.proyecto,
+            fecha_esperada=self.hoy - timedelta(days=5),
+            estado='recibido',
+            monto_recibido=Decimal('1000.00'),
+        )
+        crear_ingreso(self.proyecto, fecha_esperada=self.hoy - timedelta(days=5), estado='cancelado')
+
+        self.assertQuerySetEqual(Ingreso.objects.vencidos(), [vencido])
+        self.assertEqual(Ingreso.objects.pendientes().count(), 2)
+        self.assertEqual(Ingreso.objects.no_vencidos().count(), 3)
+        # La propiedad usa el mismo criterio que el queryset
+        self.assertEqual(
+            [i.pk for i in Ingreso.objects.all() if i.esta_vencido],
+            [vencido.pk],
+        )
+
+    def test_with_dias_vencidos(self):
+        crear_egreso(self.proyecto, fecha_vencimiento=self.hoy - timedelta(days=3))
+        crear_egreso(self.proyecto, fecha_vencimiento=self.hoy + timedelta(days=3))
+
+        dias = [e.dias_vencidos for e in Egreso.objects.with_dias_vencidos().order_by('-retraso')]
+        self.assertEqual(dias, [3, 0])
+
+
+class IngresoListViewTests(TestCase):
+
+    def setUp(self):
+        cache.clear()
+        self.usuario = crear_usuario()
+        self.proyecto = crear_proyecto(self.usuario)
+        asignar(self.usuario, self.proyecto)
+        self.client.force_login(self.usuario)
+        self.url = reverse('finanzas:lista_ingresos')
+        hoy = timezone.now().date()
+        for i in range(45):
+            crear_ingreso(
+                self.proyecto,
+                concepto=f'Ingreso {i}',
+                fecha_esperada=hoy - timedelta(days=i % 7),
+                estado='cancelado' if i % 3 == 0 else 'pendiente',
+            )
+
+    def _recorrer(self, params):
+        vistos, cursor = [], None
+        while True:
+            datos = dict(params, **({'despues': cursor} if cursor else {}))
+            response = self.client.get(self.url, datos)
+            pagina = response.context['pagina']
+            vistos.extend(i.pk for i in pagina)
+            if not pagina.has_next:
+                return response, vistos
+            cursor = pagina.cursor_siguiente
+
+    def test_filtros_se_aplican_antes_de_paginar(self):
+        response, vistos = self._recorrer({'estado': 'pendiente'})
+        esperados = list(
+            Ingreso.objects.filter(estado='pendiente')
+            .order_by('-fecha_esperada', '-creado_en', 'id')
+            .values_list('pk', flat=True)
+        )
+        self.assertEqual(vistos, esperados)
+        self.assertEqual(response.context['total_ingresos'], 30)
+        self.assertFalse(response.context['total_estimado'])
+
+    def test_pagina_anterior(self):
+        primera = self.client.get(self.url).context['pagina']
+        segunda = self.client.get(self.url, {'despues': primera.cursor_siguiente}).context['pagina']
+        de_vuelta = self.client.get(self.url, {'antes': segunda.cursor_anterior}).context['pagina']
+        self.assertEqual([i.pk for i in de_vuelta], [i.pk for i in primera])
+        self.assertFalse(de_vuelta.has_previous)
+
+    def test_solo_vencidos_y_cursor_invalido(self):
+        response = self.client.get(self.url, {'solo_vencidos': 'on', 'despues': 'basura'})
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(all(i.esta_vencido for i in response.context['ingresos']))
+
+    def test_conteo_estimado_por_encima_del_limite(self):
+        with mock.patch.object(IngresoListView, 'conteo_exacto_hasta', 10):
+            response = self.client.get(self.url)
+        self.assertTrue(response.context['total_estimado'])
+        self.assertGreater(response.context['total_ingresos'], 10)
+
+    def test_filas_en_cache_por_version(self):
+        ingreso = self.client.get(self.url).context['ingresos'][0]
+        # Sin tocar actualizado_en la fila sale de la caché
+        Ingreso.objects.filter(pk=ingreso.pk).update(concepto='Concepto nuevo')
+        self.assertNotContains(self.client.get(self.url), 'Concepto nuevo')
+
+        # Al día siguiente se vuelven a renderizar (cambia "vencido")
+        manana = timezone.now() + timedelta(days=1)
+        with mock.patch('django.utils.timezone.now', return_value=manana):
+            self.assertContains(self.client.get(self.url), 'Concepto nuevo')
+
+        Ingreso.objects.filter(pk=ingreso.pk).update(concepto='Otro concepto', actualizado_en=timezone.now())
+        self.assertContains(self.client.get(self.url), 'Otro concepto')
+        # El proyecto que muestra la fila también es parte de la clave
+        Project.objects.filter(pk=self.proyecto.pk).update(name='Obra renombrada')
+        self.assertContains(self.client.get(self.url), '<small>Obra renombrada</small>')
+
+
+class EgresoViewsTests(TestCase):
+
+    def setUp(self):
+        cache.clear()
+        self.usuario = crear_usuario()
+        self.proyecto = crear_proyecto(self.usuario)
+        asignar(self.usuario, self.proyecto)
+        self.presupuesto = Presupuesto.objects.create(
+            proyecto=self.proyecto,
+            categoria='materiales',
+            monto_planeado=Decimal('100000.00'),
+            periodo_inicio=date(2025, 1, 1),
+            periodo_fin=date(2026, 12, 31),
+        )
+        self.client.force_login(self.usuario)
+        self.url = reverse('finanzas:lista_egresos')
+
+    def crear_egresos(self, cantidad):
+        for i in range(cantidad):
+            crear_egreso(
+                self.proyecto,
+                concepto=f'Egreso {i}',
+                proveedor='Ferretería Central' if i % 2 else 'Concretos SAS',
+                presupuesto=self.presupuesto if i % 3 else None,
+            )
+
+    def consultas_del_listado(self, **params):
+        with CaptureQueriesContext(connection) as contexto:
+            response = self.client.get(self.url, params)
+        self.assertEqual(response.status_code, 200)
+        return len(contexto.captured_queries), response
+
+    def test_listado_con_numero_fijo_de_consultas(self):
+        self.crear_egresos(2)
+        self.client.get(self.url)  # calienta la caché de proyectos accesibles
+        pocas, _ = self.consultas_del_listado()
+
+        self.crear_egresos(40)
+        with mock.patch.object(EgresoListView, 'por_pagina', 40):
+            muchas, response = self.consultas_del_listado()
+        self.assertEqual(len(response.context['egresos']), 40)
+        self.assertEqual(pocas, muchas)
+
+    def test_listado_difiere_columnas_no_usadas(self):
+        self.crear_egresos(1)
+        egreso = self.client.get(self.url).context['egresos'][0]
+        self.assertIn('descripcion', egreso.get_deferred_fields())
+        self.assertNotIn('monto_pagado', egreso.get_deferred_fields())
+
+    def test_filtros_y_permisos(self):
+        self.crear_egresos(6)
+        ajeno = crear_proyecto(self.usuario, 'OB-002')
+        crear_egreso(ajeno, proveedor='Concretos SAS')
+
+        _, response = self.consultas_del_listado(proveedor='Concretos SAS')
+        self.assertEqual(response.context['total_egresos'], 3)
+        self.assertTrue(all(e.proyecto_id == self.proyecto.pk for e in response.context['egresos']))
+
+    def test_crear_y_pagar(self):
+        response = self.client.post(reverse('finanzas:crear_egreso'), {
+            'proyecto': self.proyecto.pk,
+            'presupuesto': self.presupuesto.pk,
+            'concepto': 'Varilla',
+            'tipo_egreso': 'material',
+            'proveedor': 'Aceros del Norte',
+            'monto_total': '1200.00',
+            'monto_pagado': '0',
+            'fecha_emision': '2025-05-01',
+            'fecha_vencimiento': '2025-05-31',
+            'estado': 'pendiente',
+            'retencion_iva': '0',
+            'retencion_fuente': '0',
+        })
+        self.assertRedirects(response, self.url)
+        egreso = Egreso.objects.get(concepto='Varilla')
+        self.assertEqual(egreso.creado_por, self.usuario)
+
+        response = self.client.post(reverse('finanzas:registrar_pago_egreso', args=[egreso.pk]), {
+            'monto_pagado': '1200.00',
+            'fecha_pago': '2025-05-20',
+            'metodo_pago': 'transferencia',
+        })
+        self.assertRedirects(response, self.url)
+        egreso.refresh_from_db()
+        self.presupuesto.refresh_from_db()
+        self.assertEqual(egreso.estado, 'pagado')
+        self.assertEqual(egreso.abonos.count(), 1)
+        self.assertEqual(self.presupuesto.monto_gastado, Decimal('1200.00'))
+
+    def test_editar_no_cambia_lo_pagado(self):
+        datos = {
+            'proyecto': self.proyecto.pk,
+            'concepto': 'Varilla',
+            'tipo_egreso': 'material',
+            'proveedor': 'Aceros del Norte',
+            'monto_total': '1200.00',
+            'monto_pagado': '300.00',
+            'fecha_emision': '2025-05-01',
+            'fecha_vencimiento': '2025-05-31',
+            'fecha_pago': '2025-05-02',
+            'metodo_pago': 'transferencia',
+            'estado': 'parcial',
+            'retencion_iva': '0',
+            'retencion_fuente': '0',
+        }
+        self.client.post(reverse('finanzas:crear_egreso'), datos)
+        egreso = Egreso.objects.get(concepto='Varilla')
+        # Lo que trae al crearse queda como abono de apertura
+        self.assertEqual(list(egreso.abonos.values_list('monto', 'fecha')),
+                         [(Decimal('300.00'), date(2025, 5, 2))])
+
+        response = self.client.post(reverse('finanzas:editar_egreso', args=[egreso.pk]), {
+            **datos, 'concepto': 'Varilla corrugada', 'monto_pagado': '900.00', 'fecha_pago': '2025-05-20',
+        })
+        self.assertRedirects(response, self.url)
+        egreso.refresh_from_db()
+        self.assertEqual(egreso.concepto, 'Varilla corrugada')
+        self.assertEqual((egreso.monto_pagado, egreso.fecha_pago), (Decimal('300.00'), date(2025, 5, 2)))
+        self.assertEqual(egreso.abonos.count(), 1)
+        self.assertEqual(verificar_abonos(Egreso), [])
+
+    def test_presupuesto_de_otro_proyecto_es_invalido(self):
+        otro = crear_proyecto(self.usuario, 'OB-002')
+        asignar(self.usuario, otro)
+        cache.clear()
+        response = self.client.post(reverse('finanzas:crear_egreso'), {
+            'proyecto': otro.pk,
+            'presupuesto': self.presupuesto.pk,
+            'concepto': 'Varilla',
+            'tipo_egreso': 'material',
+            'proveedor': 'Aceros del Norte',
+            'monto_total': '1200.00',
+            'monto_pagado': '0',
+            'fecha_emision': '2025-05-01',
+            'fecha_vencimiento': '2025-05-31',
+            'estado': 'pendiente',
+            'retencion_iva': '0',
+            'retencion_fuente': '0',
+        })
+        self.assertEqual(response.status_code, 200)
+        self.assertIn('presupuesto', response.context['form'].errors)
+
+
+class ProyeccionesTests(TestCase):
+
+    def setUp(self):
+        self.usuario = crear_usuario()
+        self.proyecto = crear_proyecto(self.usuario)
+
+    def test_flujos_y_saldos_encadenados(self):
+        # Meses cerrados usan flujos reales
+        crear_ingreso(
+            self.proyecto, '1000.00',
+            fecha_esperada=date(2024, 1, 10),
+            fecha_recepcion=date(2024, 2, 5),
+            monto_recibido=Decimal('1000.00'),
+            estado='recibido',
+        )
+        crear_egreso(
+            self.proyecto, '300.00',
+            fecha_emision=date(2024, 1, 1),
+            fecha_vencimiento=date(2024, 1, 20),
+            fecha_pago=date(2024, 3, 1),
+            monto_pagado=Decimal('300.00'),
+            estado='pagado',
+        )
+        crear_ingreso(self.proyecto, '999.00', fecha_esperada=date(2024, 2, 1), estado='cancelado')
+
+        with self.assertNumQueries(5):
+            generar_proyecciones()
+
+        filas = {
+            (p.año, p.mes): p
+            for p in ProyeccionFlujoCaja.objects.filter(proyecto=self.proyecto)
+        }
+        self.assertEqual(sorted(filas), [(2024, 1), (2024, 2), (2024, 3)])
+        self.assertEqual(filas[(2024, 1)].ingresos_proyectados, Decimal('1000.00'))
+        self.assertEqual(filas[(2024, 1)].egresos_proyectados, Decimal('300.00'))
+        self.assertEqual(filas[(2024, 2)].ingresos_reales, Decimal('1000.00'))
+        self.assertEqual(filas[(2024, 2)].saldo_inicial, Decimal('0.00'))
+        self.assertEqual(filas[(2024, 2)].saldo_final, Decimal('1000.00'))
+        self.assertEqual(filas[(2024, 3)].saldo_inicial, Decimal('1000.00'))
+        self.assertEqual(filas[(2024, 3)].saldo_final, Decimal('700.00'))
+
+    def test_upsert_conserva_notas(self):
+        crear_ingreso(self.proyecto, '500.00', fecha_esperada=date(2024, 5, 1))
+        generar_proyecciones()
+        ProyeccionFlujoCaja.objects.update(notas='Revisado', ingresos_proyectados=0)
+
+        call_command('generar_proyecciones', '--desde', '2024-05', stdout=StringIO())
+
+        fila = ProyeccionFlujoCaja.objects.get()
+        self.assertEqual(fila.notas, 'Revisado')
+        self.assertEqual(fila.ingresos_proyectados, Decimal('500.00'))
+
+
+class ProyeccionIncrementalTests(TestCase):
+
+    def setUp(self):
+        self.usuario = crear_usuario()
+        self.proyecto = crear_proyecto(self.usuario)
+        self.ingreso = crear_ingreso(self.proyecto, '1000.00', fecha_esperada=date(2024, 1, 15))
+        crear_egreso(
+            self.proyecto, '400.00',
+            fecha_emision=date(2024, 1, 1),
+            fecha_vencimiento=date(2024, 3, 10),
+        )
+        generar_proyecciones()
+        MesPendienteProyeccion.objects.all().delete()
+
+    def _snapshot(self):
+        return list(
+            ProyeccionFlujoCaja.objects.order_by('año', 'mes')
+            .values_list('año', 'mes', 'ingresos_reales', 'saldo_inicial', 'saldo_final')
+        )
+
+    def test_pago_marca_solo_meses_afectados_y_cascada(self):
+        self.ingreso.marcar_como_recibido(monto=Decimal('600.00'), fecha=date(2024, 2, 20))
+        self.assertEqual(
+            set(MesPendienteProyeccion.objects.values_list('año', 'mes')),
+            {(2024, 1), (2024, 2)},
+        )
+
+        procesar_meses_pendientes()
+        self.assertFalse(MesPendienteProyeccion.objects.exists())
+        incremental = self._snapshot()
+
+        generar_proyecciones()
+        self.assertEqual(incremental, self._snapshot())
+        # El saldo de marzo arrastra el cobro de febrero
+        self.assertEqual(incremental[-1][3], Decimal('600.00'))
+
+    def test_cambios_no_financieros_no_marcan(self):
+        ingreso = Ingreso.objects.get(pk=self.ingreso.pk)
+        ingreso.concepto = 'Otro concepto'
+        ingreso.save()
+        self.assertFalse(MesPendienteProyeccion.objects.exists())
+
+    def test_eliminar_marca_el_mes_y_recalcula(self):
+        Ingreso.objects.get(pk=self.ingreso.pk).delete()
+        pendiente = MesPendienteProyeccion.objects.get()
+        self.assertEqual((pendiente.año, pendiente.mes), (2024, 1))
+
+        call_command('procesar_proyecciones', stdout=StringIO())
+        enero = ProyeccionFlujoCaja.objects.get(año=2024, mes=1)
+        self.assertEqual(enero.ingresos_proyectados, Decimal('0.00'))
+
+
+    def test_cambio_de_mes_recalcula_el_mes_que_cerro(self):
+        # Calculadas el 20 de enero de 2024: enero aún usa el flujo proyectado
+        enero_2024 = datetime(2024, 1, 20, 12, tzinfo=dt_timezone.utc)
+        with mock.patch('django.utils.timezone.now', return_value=enero_2024):
+            generar_proyecciones()
+        self.assertEqual(ProyeccionFlujoCaja.objects.get(año=2024, mes=1).saldo_final, Decimal('1000.00'))
+
+        salida = StringIO()
+        call_command('procesar_proyecciones', stdout=salida)
+        self.assertIn('Meses cerrados por recalcular: 3', salida.getvalue())
+        # Cerrado sin cobros: el flujo real de enero es 0
+        self.assertEqual(ProyeccionFlujoCaja.objects.get(año=2024, mes=1).saldo_final, Decimal('0.00'))
+        self.assertEqual(marcar_meses_cerrados(), 0)
+        incremental = self._snapshot()
+        generar_proyecciones()
+        self.assertEqual(incremental, self._snapshot())
+
+class PagosAtomicosTests(TestCase):
+
+    def setUp(self):
+        cache.clear()
+        self.usuario = crear_usuario()
+        self.proyecto = crear_proyecto(self.usuario)
+        asignar(self.usuario, self.proyecto)
+
+    def test_recepcion_parcial_y_total(self):
+        ingreso = crear_ingreso(self.proyecto, '1000.00')
+        registrar_recepcion(ingreso, '400.00', metodo_pago='efectivo')
+        self.assertEqual(ingreso.monto_recibido, Decimal('400.00'))
+        self.assertEqual(ingreso.estado, 'parcial')
+
+        registrar_recepcion(ingreso, '600.00')
+        ingreso.refresh_from_db()
+        self.assertEqual(ingreso.estado, 'recibido')
+        self.assertEqual(ingreso.metodo_pago, 'efectivo')
+        self.assertEqual(obtener_resumen(self.proyecto.pk).ingresos_recibido, Decimal('1000.00'))
+
+    def test_pago_que_excede_el_saldo_no_escribe(self):
+        ingreso = crear_ingreso(self.proyecto, '1000.00')
+        registrar_recepcion(ingreso, '900.00')
+        with self.assertRaises(ValidationError):
+            registrar_recepcion(ingreso, '200.00')
+        ingreso.refresh_from_db()
+        self.assertEqual(ingreso.monto_recibido, Decimal('900.00'))
+
+    def test_pago_de_egreso_actualiza_presupuesto(self):
+        presupuesto = Presupuesto.objects.create(
+            proyecto=self.proyecto,
+            categoria='materiales',
+            monto_planeado=Decimal('5000.00'),
+            periodo_inicio=date(2025, 1, 1),
+            periodo_fin=date(2025, 12, 31),
+        )
+        egreso = crear_egreso(self.proyecto, '500.00', presupuesto=presupuesto)
+        egreso.marcar_como_pagado(monto=Decimal('200.00'))
+        egreso.marcar_como_pagado()
+
+        egreso.refresh_from_db()
+        presupuesto.refresh_from_db()
+        self.assertEqual(egreso.estado, 'pagado')
+        self.assertEqual(egreso.monto_pagado, Decimal('500.00'))
+        self.assertEqual(presupuesto.monto_gastado, Decimal('500.00'))
+
+    def test_marcar_como_recibido_con_el_nuevo_total(self):
+        ingreso = crear_ingreso(self.proyecto, '1000.00')
+        ingreso.marcar_como_recibido(monto=Decimal('600.00'))
+        ingreso.marcar_como_recibido(monto=Decimal('800.00'))
+        self.assertEqual(ingreso.monto_recibido, Decimal('800.00'))
+        self.assertEqual(list(ingreso.abonos.values_list('monto', flat=True)),
+                         [Decimal('600.00'), Decimal('200.00')])
+
+        # Mismo total: no hace nada; uno menor no se puede abonar
+        ingreso.marcar_como_recibido(monto=Decimal('800.00'))
+        with self.assertRaises(ValidationError):
+            ingreso.marcar_como_recibido(monto=Decimal('500.00'))
+        ingreso.marcar_como_recibido(abono=Decimal('150.00'))
+        self.assertEqual(ingreso.monto_recibido, Decimal('950.00'))
+
+        ingreso.marcar_como_recibido()
+        ingreso.marcar_como_recibido()  # ya recibido por completo
+        ingreso.refresh_from_db()
+        self.assertEqual((ingreso.monto_recibido, ingreso.estado), (Decimal('1000.00'), 'recibido'))
+        self.assertEqual(ingreso.abonos.count(), 4)
+
+    def test_formulario_de_recepcion_acumula(self):
+        ingreso = crear_ingreso(self.proyecto, '1000.00', monto_recibido=Decimal('250.00'), estado='parcial')
+        self.client.force_login(self.usuario)
+        response = self.client.post(
+            reverse('finanzas:registrar_recepcion', args=[ingreso.pk]),
+            {
+                'monto_recibido': '250.00',
+                'fecha_recepcion': '2025-06-01',
+                'metodo_pago': 'transferencia',
+                'numero_referencia': 'TRX-1',
+            },
+        )
+        self.assertRedirects(response, reverse('finanzas:lista_ingresos'))
+        ingreso.refresh_from_db()
+        self.assertEqual(ingreso.monto_recibido, Decimal('500.00'))
+        self.assertEqual(ingreso.numero_referencia, 'TRX-1')
+        self.assertEqual(ingreso.aprobado_por, self.usuario)
+
+
+class AbonosTests(TestCase):
+
+    def setUp(self):
+        cache.clear()
+        self.usuario = crear_usuario()
+        self.proyecto = crear_proyecto(self.usuario)
+
+    def test_cada_pago_deja_un_abono(self):
+        ingreso = crear_ingreso(self.proyecto, '1000.00')
+        registrar_recepcion(ingreso, '400.00', fecha=date(2025, 3, 1), aprobado_por=self.usuario,
+                            numero_referencia='TRX-1')
+        registrar_recepcion(ingreso, '100.00', fecha=date(2025, 3, 5))
+
+        abonos = list(ingreso.abonos.all())
+        self.assertEqual([a.monto for a in abonos], [Decimal('400.00'), Decimal('100.00')])
+        self.assertEqual(abonos[0].numero_referencia, 'TRX-1')
+        self.assertEqual(abonos[0].registrado_por, self.usuario)
+        self.assertEqual(sum(a.monto for a in abonos), ingreso.monto_recibido)
+
+    def test_pago_rechazado_no_deja_abono(self):
+        ingreso = crear_ingreso(self.proyecto, '100.00')
+        with self.assertRaises(ValidationError):
+            registrar_recepcion(ingreso, '150.00')
+        self.assertFalse(ingreso.abonos.exists())
+
+    def test_verificar_y_completar_abonos(self):
+        # Movimiento con lo recibido escrito sin abonos (datos anteriores al historial)
+        ingreso = crear_ingreso(self.proyecto, '1000.00', monto_recibido=Decimal('400.00'),
+                                estado='parcial', fecha_recepcion=date(2025, 3, 1))
+        self.assertEqual(verificar_abonos(Ingreso), [(ingreso.pk, Decimal('400.00'), Decimal('0.00'))])
+        with self.assertRaises(CommandError):
+            call_command('verificar_abonos', stdout=StringIO())
+
+        call_command('verificar_abonos', completar=True, stdout=StringIO())
+        self.assertEqual(list(ingreso.abonos.values_list('monto', 'fecha')),
+                         [(Decimal('400.00'), date(2025, 3, 1))])
+        registrar_recepcion(ingreso, '100.00')
+        self.assertEqual(verificar_abonos(Ingreso), [])
+
+    def test_abonos_son_de_solo_insercion(self):
+        ingreso = crear_ingreso(self.proyecto, '1000.00')
+        registrar_recepcion(ingreso, '400.00')
+        abono = ingreso.abonos.get()
+        abono.monto = Decimal('1.00')
+        with self.assertRaises(ValueError):
+            abono.save()
+        with self.assertRaises(ValueError):
+            abono.delete()
+
+    def test_importacion_masiva_de_ingresos(self):
+        a = crear_ingreso(self.proyecto, '1000.00')
+        b = crear_ingreso(self.proyecto, '300.00')
+        importados = importar_abonos([
+            AbonoIngreso(ingreso=a, monto=Decimal('200.00'), fecha=date(2025, 4, 1)),
+            AbonoIngreso(ingreso=a, monto=Decimal('300.00'), fecha=date(2025, 4, 9)),
+            AbonoIngreso(ingreso=b, monto=Decimal('300.00'), fecha=date(2025, 4, 2)),
+        ])
+
+        self.assertEqual(importados, 3)
+        a.refresh_from_db()
+        b.refresh_from_db()
+        self.assertEqual((a.monto_recibido, a.estado, a.fecha_recepcion),
+                         (Decimal('500.00'), 'parcial', date(2025, 4, 9)))
+        self.assertEqual((b.monto_recibido, b.estado), (Decimal('300.00'), 'recibido'))
+        self.assertEqual(obtener_resumen(self.proyecto.pk).ingresos_recibido, Decimal('800.00'))
+        self.assertTrue(MesPendienteProyeccion.objects.filter(
+            proyecto=self.proyecto, año=2025, mes=4).exists())
+
+    def test_pago_con_fecha_anterior_no_retrocede_la_fecha(self):
+        ingreso = crear_ingreso(self.proyecto, '1000.00')
+        registrar_recepcion(ingreso, '100.00', fecha=date(2025, 6, 10))
+        registrar_recepcion(ingreso, '100.00', fecha=date(2025, 6, 1))
+        self.assertEqual(ingreso.fecha_recepcion, date(2025, 6, 10))
+        self.assertEqual(
+            list(ingreso.abonos.order_by('pk').values_list('fecha', flat=True)),
+            [date(2025, 6, 10), date(2025, 6, 1)],
+        )
+
+        egreso = crear_egreso(self.proyecto, '500.00')
+        registrar_pago(egreso, '100.00', fecha=date(2025, 6, 10))
+        registrar_pago(egreso, '100.00', fecha=date(2025, 6, 1))
+        egreso.refresh_from_db()
+        self.assertEqual(egreso.fecha_pago, date(2025, 6, 10))
+
+    def test_importacion_masiva_no_retrocede_la_fecha_de_pago(self):
+        a = crear_ingreso(self.proyecto, '1000.00')
+        b = crear_ingreso(self.proyecto, '1000.00')
+        registrar_recepcion(a, '100.00', fecha=date(2025, 6, 10))
+        importar_abonos([
+            AbonoIngreso(ingreso=a, monto=Decimal('100.00'), fecha=date(2025, 6, 1)),
+            AbonoIngreso(ingreso=b, monto=Decimal('100.00'), fecha=date(2025, 6, 1)),
+        ])
+        a.refresh_from_db()
+        b.refresh_from_db()
+        self.assertEqual(a.fecha_recepcion, date(2025, 6, 10))
+        self.assertEqual(b.fecha_recepcion, date(2025, 6, 1))
+
+    def test_importacion_masiva_no_reabre_movimientos_cerrados_entretanto(self):
+        ingreso = crear_ingreso(self.proyecto, '1000.00')
+        bulk_create = AbonoIngreso.objects.bulk_create
+
+        def cancelar_y_crear(*args, **kwargs):
+            # Lo que haría otra transacción entre la lectura y el UPDATE
+            Ingreso.objects.filter(pk=ingreso.pk).update(estado='cancelado')
+            return bulk_create(*args, **kwargs)
+
+        with mock.patch.object(AbonoIngreso.objects, 'bulk_create', side_effect=cancelar_y_crear):
+            with self.assertRaisesMessage(ValidationError, 'Otro proceso cerró o canceló'):
+                importar_abonos([AbonoIngreso(ingreso=ingreso, monto=Decimal('100.00'), fecha=date(2025, 6, 1))])
+        ingreso.refresh_from_db()
+        self.assertEqual((ingreso.estado, ingreso.monto_recibido), ('pendiente', Decimal('0.00')))
+        self.assertFalse(AbonoIngreso.objects.exists())
+
+    def test_importacion_masiva_sobrepagada_se_revierte(self):
+        a = crear_ingreso(self.proyecto, '1000.00')
+        b = crear_ingreso(self.proyecto, '100.00')
+        with self.assertRaises(ValidationError):
+            importar_abonos([
+                AbonoIngreso(ingreso=a, monto=Decimal('200.00'), fecha=date(2025, 4, 1)),
+                AbonoIngreso(ingreso=b, monto=Decimal('150.00'), fecha=date(2025, 4, 1)),
+            ])
+        a.refresh_from_db()
+        self.assertEqual(a.monto_recibido, Decimal('0.00'))
+        self.assertFalse(AbonoIngreso.objects.exists())
+
+    def test_importacion_masiva_de_egresos_suma_al_presupuesto(self):
+        presupuesto = Presupuesto.objects.create(
+            proyecto=self.proyecto,
+            categoria='materiales',
+            monto_planeado=Decimal('5000.00'),
+            periodo_inicio=date(2025, 1, 1),
+            periodo_fin=date(2025, 12, 31),
+        )
+        a = crear_egreso(self.proyecto, '500.00', presupuesto=presupuesto)
+        b = crear_egreso(self.proyecto, '700.00', presupuesto=presupuesto)
+        importar_abonos([
+            AbonoEgreso(egreso=a, monto=Decimal('500.00'), fecha=date(2025, 5, 1)),
+            AbonoEgreso(egreso=b, monto=Decimal('100.00'), fecha=date(2025, 5, 1)),
+        ])
+
+        presupuesto.refresh_from_db()
+        a.refresh_from_db()
+        self.assertEqual(presupuesto.monto_gastado, Decimal('600.00'))
+        self.assertEqual(a.estado, 'pagado')
+
+
+class ImportacionTests(TestCase):
+
+    CSV_INGRESOS = (
+        'proyecto,concepto,tipo_ingreso,monto_total,fecha_esperada,estado,monto_recibido,fecha_recepcion,metodo_pago\n'
+        'OB-001,Anticipo,anticipo,1000.00,2025-02-01,recibido,1000.00,2025-02-03,transferencia\n'
+        'OB-001,Avance 1,pago_avance,2500.50,2025-03-15,,,,\n'
+        'OB-999,Proyecto ajeno,anticipo,10.00,2025-03-15,,,,\n'
+        'OB-001,Sin metodo,anticipo,50.00,2025-03-15,recibido,50.00,2025-03-16,\n'
+        'OB-001,Negativo,anticipo,-5,15/03/2025,,,,\n'
+    )
+
+    def setUp(self):
+        cache.clear()
+        self.usuario = crear_usuario()
+        self.proyecto = crear_proyecto(self.usuario, 'OB-001')
+        asignar(self.usuario, self.proyecto)
+        crear_proyecto(self.usuario, 'OB-999')  # existe pero el usuario no es miembro
+
+    def importar(self, contenido, tipo='ingresos', **kwargs):
+        return importar_movimientos(leer_csv(StringIO(contenido)), tipo, usuario=self.usuario, **kwargs)
+
+    def test_importa_filas_validas_y_reporta_errores(self):
+        reportados = []
+        resultado = self.importar(self.CSV_INGRESOS, lote=1, al_error=lambda fila, errores: reportados.append(fila))
+
+        self.assertEqual((resultado.filas, resultado.creados, resultado.total_errores), (5, 2, 3))
+        self.assertEqual(reportados, [4, 5, 6])
+        errores = dict(resultado.errores)
+        self.assertIn('proyecto', errores[4])
+        self.assertIn('metodo_pago', errores[5])
+        self.assertIn('monto_total', errores[6])
+
+        ingresos = Ingreso.objects.filter(proyecto=self.proyecto)
+        self.assertEqual(ingresos.count(), 2)
+        self.assertTrue(all(ingreso.creado_por == self.usuario for ingreso in ingresos))
+        self.assertEqual(ingresos.get(concepto='Avance 1').estado, 'pendiente')
+
+    def test_un_formulario_por_archivo_se_vincula_a_cada_fila(self):
+        form = IngresoImportacionForm(proyectos={'OB-001': self.proyecto})
+        fila = {'proyecto': 'OB-001', 'concepto': 'Anticipo', 'tipo_ingreso': 'anticipo',
+                'fecha_esperada': '2025-03-01'}
+
+        self.assertFalse(form.vincular(fila).is_valid())
+        self.assertIn('monto_total', form.errors)
+        self.assertTrue(form.vincular({**fila, 'monto_total': '10.00'}).is_valid(), form.errors)
+        primero = form.save(commit=False)
+        self.assertTrue(form.vincular({**fila, 'monto_total': '20.00'}).is_valid(), form.errors)
+        segundo = form.save(commit=False)
+
+        self.assertIsNot(primero, segundo)
+        self.assertEqual((primero.monto_total, primero.proyecto), (Decimal('10.00'), self.proyecto))
+        self.assertEqual(segundo.monto_total, Decimal('20.00'))
+        self.assertIsNot(form.fields['estado'], IngresoImportacionForm.base_fields['estado'])
+
+    def test_lo_ya_recibido_queda_como_abono_de_apertura(self):
+        self.importar(self.CSV_INGRESOS)
+        anticipo = Ingreso.objects.get(concepto='Anticipo')
+        abono = anticipo.abonos.get()
+        self.assertEqual((abono.monto, abono.fecha, abono.metodo_pago, abono.registrado_por),
+                         (Decimal('1000.00'), date(2025, 2, 3), 'transferencia', self.usuario))
+        self.assertFalse(Ingreso.objects.get(concepto='Avance 1').abonos.exists())
+        self.assertEqual(verificar_abonos(Ingreso), [])
+
+    def test_actualiza_resumen_y_meses_pendientes(self):
+        self.importar(self.CSV_INGRESOS)
+        resumen = obtener_resumen(self.proyecto.pk)
+        self.assertEqual(resumen.ingresos_total, Decimal('3500.50'))
+        self.assertEqual(resumen.ingresos_recibido, Decimal('1000.00'))
+        self.assertEqual(
+            set(MesPendienteProyeccion.objects.values_list('año', 'mes')),
+            {(2025, 2), (2025, 3)},
+        )
+
+    def test_importa_egresos(self):
+        resultado = self.importar(
+            'proyecto,concepto,tipo_egreso,proveedor,monto_total,fecha_emision,fecha_vencimiento\n'
+            'OB-001,Cemento,material,Ferretería Central,800.00,2025-04-01,2025-04-30\n'
+            'OB-001,Vencido antes de emitir,material,Ferretería Central,800.00,2025-04-01,2025-03-01\n',
+            tipo='egresos',
+        )
+        self.assertEqual((resultado.creados, resultado.total_errores), (1, 1))
+        self.assertEqual(obtener_resumen(self.proyecto.pk).egresos_total, Decimal('800.00'))
+
+    def test_vista_de_carga(self):
+        self.client.force_login(self.usuario)
+        archivo = SimpleUploadedFile('ingresos.csv', self.CSV_INGRESOS.encode('utf-8-sig'))
+        response = self.client.post(
+            reverse('finanzas:importar_movimientos'),
+            {'tipo': 'ingresos', 'archivo': archivo},
+        )
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.context['resultado'].creados, 2)
+        self.assertContains(response, 'OB-999')
+
+    def test_comando_escribe_reporte_de_errores(self):
+        with tempfile.TemporaryDirectory() as directorio:
+            origen = f'{directorio}/ingresos.csv'
+            reporte = f'{directorio}/errores.csv'
+            with open(origen, 'w', encoding='utf-8') as archivo:
+                archivo.write(self.CSV_INGRESOS)
+            salida = StringIO()
+            call_command(
+                'importar_movimientos', 'ingresos', origen,
+                '--usuario', self.usuario.username, '--reporte', reporte,
+                stdout=salida, stderr=StringIO(),
+            )
+            with open(reporte, encoding='utf-8') as archivo:
+                filas = archivo.read().splitlines()
+
+        self.assertIn('2 de 5 filas importadas', salida.getvalue())
+        self.assertEqual(filas[0], 'fila,campo,mensaje')
+        self.assertEqual({fila.split(',')[0] for fila in filas[1:]}, {'4', '5', '6'})
+
+
+class ExportacionIngresosTests(TestCase):
+
+    def setUp(self):
+        cache.clear()
+        self.usuario = crear_usuario()
+        self.proyecto = crear_proyecto(self.usuario, 'OB-001')
+        asignar(self.usuario, self.proyecto)
+        crear_ingreso(self.proyecto, '1000.00', concepto='Anticipo, "inicial"', fecha_esperada=date(2025, 1, 10),
+                      tipo_ingreso='anticipo')
+        crear_ingreso(self.proyecto, '250.50', concepto='Avance', fecha_esperada=date(2025, 2, 10))
+        ajeno = crear_proyecto(self.usuario, 'OB-002')
+        crear_ingreso(ajeno, '99.00', concepto='No visible')
+        self.client.force_login(self.usuario)
+
+    def descargar(self, **params):
+        response = self.client.get(reverse('finanzas:exportar_ingresos'), params)
+        self.assertTrue(response.streaming)
+        return response, b''.join(response.streaming_content)
+
+    def test_csv_respeta_filtros_y_permisos(self):
+        response, contenido = self.descargar(formato='csv', tipo_ingreso='pago_avance')
+        self.assertEqual(response['Content-Type'], 'text/csv; charset=utf-8')
+        filas = list(csv.reader(StringIO(contenido.decode('utf-8-sig'))))
+        self.assertEqual(filas[0][:3], ['id', 'proyecto', 'concepto'])
+        self.assertEqual([fila[2] for fila in filas[1:]], ['Avance'])
+
+    def test_csv_exportado_se_puede_importar(self):
+        _, contenido = self.descargar(formato='csv')
+        filas = list(leer_csv(StringIO(contenido.decode('utf-8-sig'))))
+        self.assertEqual([datos['concepto'] for _, datos in filas], ['Avance', 'Anticipo, "inicial"'])
+        resultado = importar_movimientos(filas, 'ingresos', usuario=self.usuario)
+        self.assertEqual((resultado.creados, resultado.total_errores), (2, 0))
+
+    def test_xlsx_es_un_libro_valido(self):
+        _, contenido = self.descargar(formato='xlsx')
+        with zipfile.ZipFile(io.BytesIO(contenido)) as libro:
+            self.assertIn('xl/workbook.xml', libro.namelist())
+            hoja = ElementTree.fromstring(libro.read('xl/worksheets/sheet1.xml'))
+
+        ns = {'x': 'http://schemas.openxmlformats.org/spreadsheetml/2006/main'}
+        filas = hoja.findall('.//x:row', ns)
+        self.assertEqual(len(filas), 3)
+        textos = [t.text for t in filas[2].findall('.//x:t', ns)]
+        self.assertIn('Anticipo, "inicial"', textos)
+        # fecha_esperada como número de serie de Excel con estilo de fecha
+        fecha = filas[2].findall('x:c', ns)[6]
+        self.assertEqual(fecha.get('s'), '1')
+        self.assertEqual(int(fecha.find('x:v', ns).text), (date(2025, 1, 10) - date(1899, 12, 30)).days)
+
+
+class TableroTests(TestCase):
+
+    def setUp(self):
+        cache.clear()
+        self.usuario = crear_usuario()
+        self.proyecto = crear_proyecto(self.usuario)
+        asignar(self.usuario, self.proyecto)
+        # Proyecto ajeno: no debe sumar
+        self.ajeno = crear_proyecto(self.usuario, code='OB-999')
+        crear_ingreso(self.ajeno, '99999.00')
+
+        self.hoy = timezone.now().date()
+        crear_ingreso(self.proyecto, '1000.00', fecha_esperada=self.hoy - timedelta(days=3))
+        crear_ingreso(self.proyecto, '2000.00', fecha_esperada=self.hoy + timedelta(days=2))
+        crear_ingreso(self.proyecto, '500.00', fecha_esperada=self.hoy + timedelta(days=10))
+        crear_ingreso(self.proyecto, '700.00', fecha_esperada=self.hoy + timedelta(days=45))
+        crear_ingreso(self.proyecto, '300.00', estado='cancelado')
+        crear_egreso(self.proyecto, '400.00', fecha_vencimiento=self.hoy - timedelta(days=1))
+        crear_egreso(self.proyecto, '600.00', fecha_vencimiento=self.hoy + timedelta(days=9))
+        for categoria, planeado, gastado in [
+            ('materiales', '1000.00', '250.00'),
+            ('materiales', '1000.00', '0.00'),
+            ('mano_obra', '500.00', '600.00'),
+        ]:
+            Presupuesto.objects.create(
+                proyecto=self.proyecto,
+                categoria=categoria,
+                monto_planeado=Decimal(planeado),
+                monto_gastado=Decimal(gastado),
+                periodo_inicio=date(2025, 1, 1),
+                periodo_fin=date(2026, 12, 31),
+            )
+
+    def test_totales_y_flujo(self):
+        with self.assertNumQueries(5):
+            tablero = calcular_tablero([self.proyecto.pk], hoy=self.hoy)
+
+        self.assertEqual(tablero['contratado'], Decimal('1000000.00'))
+        self.assertEqual(tablero['ingresos_total'], Decimal('4200.00'))
+        self.assertEqual(tablero['ingresos_pendiente'], Decimal('4200.00'))
+        self.assertEqual(tablero['ingresos_vencido'], Decimal('1000.00'))
+        self.assertEqual(tablero['egresos_pendiente'], Decimal('1000.00'))
+        self.assertEqual(tablero['egresos_vencido'], Decimal('400.00'))
+
+        self.assertEqual(len(tablero['flujo']), 5)
+        self.assertEqual(tablero['flujo'][0]['entradas'], Decimal('2000.00'))
+        self.assertEqual(tablero['flujo'][1]['entradas'], Decimal('500.00'))
+        self.assertEqual(tablero['flujo'][1]['salidas'], Decimal('600.00'))
+        self.assertEqual(tablero['flujo'][1]['neto'], Decimal('-100.00'))
+        self.assertEqual(tablero['flujo_entradas'], Decimal('2500.00'))
+
+        presupuestos = {p['categoria']: p for p in tablero['presupuestos']}
+        self.assertEqual(presupuestos['materiales']['planeado'], Decimal('2000.00'))
+        self.assertEqual(presupuestos['materiales']['porcentaje'], Decimal('12.5'))
+        self.assertEqual(presupuestos['mano_obra']['porcentaje'], Decimal('120.0'))
+
+    def test_cache_e_invalidacion(self):
+        obtener_tablero(self.usuario)
+        with self.assertNumQueries(0):
+            obtener_tablero(self.usuario)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            ingreso = crear_ingreso(self.proyecto, '100.00')
+        self.assertEqual(obtener_tablero(self.usuario)['ingresos_total'], Decimal('4300.00'))
+
+        with self.captureOnCommitCallbacks(execute=True):
+            registrar_recepcion(ingreso, Decimal('100.00'), fecha=self.hoy)
+        self.assertEqual(obtener_tablero(self.usuario)['ingresos_recibido'], Decimal('100.00'))
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.proyecto.contract_amount = Decimal('5.00')
+            self.proyecto.save()
+        self.assertEqual(obtener_tablero(self.usuario)['contratado'], Decimal('5.00'))
+
+    def test_vista_requiere_sesion_y_muestra_tablero(self):
+        url = reverse('core:dashboard')
+        self.assertEqual(self.client.get(url).status_code, 302)
+
+        self.client.force_login(self.usuario)
+        response = self.client.get(url)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.context['tablero']['proyectos'], 1)
+        self.assertContains(response, 'Ejecución del presupuesto')
+
+
+class PresupuestoUsoTests(TestCase):
+
+    def setUp(self):
+        self.usuario = crear_usuario()
+        self.proyecto = crear_proyecto(self.usuario)
+        self.presupuestos = [
+            Presupuesto.objects.create(
+                proyecto=self.proyecto,
+                categoria='materiales',
+                subcategoria=f'Línea {i}',
+                monto_planeado=Decimal(planeado),
+                monto_gastado=Decimal(gastado),
+                periodo_inicio=date(2025, 1, 1),
+                periodo_fin=date(2026, 12, 31),
+            )
+            for i, (planeado, gastado) in enumerate([
+                ('1000.00', '125.00'), ('3.00', '1.00'), ('0.00', '5.00'), ('100.00', '250.00'),
+            ])
+        ]
+
+    def test_columna_generada_y_anotaciones(self):
+        filas = list(
+            Presupuesto.objects.con_uso().order_by('id')
+            .values_list('uso_porcentaje', 'disponible', 'sobrepresupuestado')
+        )
+        self.assertEqual(filas, [
+            (Decimal('12.50'), Decimal('875.00'), False),
+            (Decimal('33.33'), Decimal('2.00'), False),
+            (Decimal('0.00'), Decimal('-5.00'), True),
+            (Decimal('250.00'), Decimal('-150.00'), True),
+        ])
+        for presupuesto in Presupuesto.objects.con_uso():
+            self.assertEqual(presupuesto.sobrepresupuestado, presupuesto.esta_sobrepresupuestado)
+
+        # La base de datos recalcula la columna en cada UPDATE
+        Presupuesto.objects.filter(pk=self.presupuestos[0].pk).update(monto_gastado=F('monto_gastado') + 875)
+        self.presupuestos[0].refresh_from_db()
+        self.assertEqual(self.presupuestos[0].uso_porcentaje, Decimal('100.00'))
+
+    def test_orden_usa_el_indice(self):
+        sql, params = (
+            Presupuesto.objects.filter(uso_porcentaje__gt=80)
+            .order_by('-uso_porcentaje', '-id').query.sql_with_params()
+        )
+        with connection.cursor() as cursor:
+            cursor.execute('EXPLAIN QUERY PLAN ' + sql, params)
+            plan = ' '.join(str(fila) for fila in cursor.fetchall())
+        if connection.vendor == 'sqlite':
+            self.assertIn('finanzas_pr_uso_idx', plan)
+
+    def test_admin_ordena_y_filtra_en_sql(self):
+        admin = Auth.objects.create_superuser(
+            nombre='Admin', apellido='Root', username='admin',
+            email='admin@cortesec.test', password='clave-segura-123',
+        )
+        self.client.force_login(admin)
+        url = reverse('admin:finanzas_presupuesto_changelist')
+
+        response = self.client.get(url, {'sobrepresupuestado': 'si', 'o': '-7'})
+        self.assertEqual(
+            [p.pk for p in response.context['cl'].result_list],
+            [self.presupuestos[3].pk, self.presupuestos[2].pk],
+        )
+        response = self.client.get(url, {'uso': 'excedido'})
+        self.assertEqual([p.pk for p in response.context['cl'].result_list], [self.presupuestos[3].pk])
+
+
+class ConsumoPresupuestoTests(TestCase):
+
+    def setUp(self):
+        cache.clear()
+        self.usuario = crear_usuario()
+        self.proyecto = crear_proyecto(self.usuario)
+        self.materiales, self.equipo = [
+            Presupuesto.objects.create(
+                proyecto=self.proyecto,
+                categoria=categoria,
+                monto_planeado=Decimal('10000.00'),
+                periodo_inicio=date(2025, 1, 1),
+                periodo_fin=date(2026, 12, 31),
+            )
+            for categoria in ('materiales', 'equipo')
+        ]
+
+    def assertConsumo(self, presupuesto, comprometido, gastado):
+        presupuesto.refresh_from_db()
+        self.assertEqual(
+            (presupuesto.monto_comprometido, presupuesto.monto_gastado),
+            (Decimal(comprometido), Decimal(gastado)),
+        )
+
+    def test_deltas_por_edicion_pago_reasignacion_y_borrado(self):
+        egreso = crear_egreso(self.proyecto, '500.00', presupuesto=self.materiales)
+        self.assertConsumo(self.materiales, '500.00', '0.00')
+
+        egreso.monto_total = Decimal('800.00')
+        egreso.save()
+        self.assertConsumo(self.materiales, '800.00', '0.00')
+
+        registrar_pago(egreso, Decimal('300.00'))
+        self.assertConsumo(self.materiales, '500.00', '300.00')
+
+        egreso.presupuesto = self.equipo
+        egreso.save()
+        self.assertConsumo(self.materiales, '0.00', '0.00')
+        self.assertConsumo(self.equipo, '500.00', '300.00')
+
+        egreso.marcar_como_pagado()
+        self.assertConsumo(self.equipo, '0.00', '800.00')
+
+        Egreso.objects.get(pk=egreso.pk).delete()
+        self.assertConsumo(self.equipo, '0.00', '0.00')
+        self.assertEqual(verificar_presupuestos(), [])
+
+    def test_cancelado_no_consume(self):
+        egreso = crear_egreso(self.proyecto, '500.00', presupuesto=self.materiales)
+        egreso.estado = 'cancelado'
+        egreso.save()
+        self.assertConsumo(self.materiales, '0.00', '0.00')
+
+    def test_abonos_masivos(self):
+        egresos = [crear_egreso(self.proyecto, '400.00', presupuesto=self.materiales) for _ in range(3)]
+        importar_abonos([
+            AbonoEgreso(egreso=egreso, monto=Decimal('100.00'), fecha=timezone.now().date())
+            for egreso in egresos
+        ])
+        self.assertConsumo(self.materiales, '900.00', '300.00')
+        self.assertEqual(verificar_presupuestos(), [])
+
+    def test_corrida_de_pagos(self):
+        parcial = crear_egreso(self.proyecto, '400.00', presupuesto=self.materiales)
+        registrar_pago(parcial, Decimal('100.00'), fecha=date(2025, 8, 1))
+        completo = crear_egreso(self.proyecto, '250.00', presupuesto=self.equipo)
+        sin_presupuesto = crear_egreso(self.proyecto, '50.00')
+        cancelado = crear_egreso(self.proyecto, '70.00', presupuesto=self.materiales, estado='cancelado')
+
+        pagados, total = pagar_egresos(
+            [parcial.pk, completo.pk, sin_presupuesto.pk, cancelado.pk],
+            fecha=date(2025, 8, 15),
+            metodo_pago='transferencia',
+            aprobado_por=self.usuario,
+        )
+
+        self.assertEqual((pagados, total), (3, Decimal('600.00')))
+        parcial.refresh_from_db()
+        self.assertEqual(
+            (parcial.estado, parcial.monto_pagado, parcial.fecha_pago, parcial.aprobado_por),
+            ('pagado', Decimal('400.00'), date(2025, 8, 15), self.usuario),
+        )
+        self.assertEqual(parcial.abonos.order_by('pk').last().monto, Decimal('300.00'))
+        cancelado.refresh_from_db()
+        self.assertEqual(cancelado.estado, 'cancelado')
+        self.assertConsumo(self.materiales, '0.00', '400.00')
+        self.assertConsumo(self.equipo, '0.00', '250.00')
+        self.assertEqual(obtener_resumen(self.proyecto.pk).egresos_pagado, Decimal('700.00'))
+        self.assertEqual(verificar_presupuestos(), [])
+
+    def test_corrida_de_pagos_con_consultas_constantes(self):
+        def consultas_para(cantidad):
+            egresos = [
+                crear_egreso(self.proyecto, '100.00', presupuesto=presupuesto)
+                for presupuesto in [self.materiales, self.equipo] * cantidad
+            ]
+            with CaptureQueriesContext(connection) as consultas:
+                pagar_egresos([egreso.pk for egreso in egresos])
+            return len(consultas)
+
+        self.assertEqual(consultas_para(2), consultas_para(10))
+
+    def test_accion_del_admin_paga_los_seleccionados(self):
+        admin = Auth.objects.create_superuser(
+            nombre='Admin', apellido='Root', username='admin',
+            email='admin@cortesec.test', password='clave-segura-123',
+        )
+        self.client.force_login(admin)
+        egresos = [crear_egreso(self.proyecto, '300.00', presupuesto=self.materiales) for _ in range(2)]
+        response = self.client.post(reverse('admin:finanzas_egreso_changelist'), {
+            'action': 'pagar_saldo',
+            '_selected_action': [egreso.pk for egreso in egresos],
+        })
+        self.assertEqual(response.status_code, 302)
+        self.assertEqual(
+            set(Egreso.objects.values_list('estado', 'aprobado_por')),
+            {('pagado', admin.pk)},
+        )
+        self.assertConsumo(self.materiales, '0.00', '600.00')
+
+    def test_accion_del_admin_exige_aprobar_pagos_en_el_proyecto(self):
+        # Administrador del sitio (is_admin) pero no superadministrador
+        staff = crear_usuario('tesorero')
+        staff.is_staff = staff.is_admin = True
+        staff.save()
+        miembro = asignar(staff, self.proyecto)
+        egreso = crear_egreso(self.proyecto, '300.00', presupuesto=self.materiales)
+        self.client.force_login(staff)
+
+        def pagar():
+            return self.client.post(reverse('admin:finanzas_egreso_changelist'), {
+                'action': 'pagar_saldo',
+                '_selected_action': [egreso.pk],
+            }, follow=True)
+
+        response = pagar()
+        self.assertContains(response, 'No tiene permiso para aprobar pagos en: OB-001')
+        egreso.refresh_from_db()
+        self.assertEqual(egreso.estado, 'pendiente')
+
+        miembro.can_approve_payments = True
+        miembro.save()
+        pagar()
+        egreso.refresh_from_db()
+        self.assertEqual((egreso.estado, egreso.aprobado_por), ('pagado', staff))
+
+    def test_reconciliacion_en_un_update(self):
+        crear_egreso(self.proyecto, '500.00', presupuesto=self.materiales)
+        pagado = crear_egreso(self.proyecto, '200.00', presupuesto=self.equipo)
+        registrar_pago(pagado, Decimal('200.00'))
+        Presupuesto.objects.update(monto_comprometido=Decimal('1.00'), monto_gastado=Decimal('2.00'))
+        self.assertEqual(len(verificar_presupuestos()), 4)
+
+        salida = StringIO()
+        with CaptureQueriesContext(connection) as consultas:
+            call_command('reconciliar_presupuestos', stdout=salida)
+        updates = [q for q in consultas.captured_queries if q['sql'].startswith('UPDATE')]
+        self.assertEqual(len(updates), 1)
+        self.assertIn('2 con diferencias', salida.getvalue())
+        self.assertConsumo(self.materiales, '500.00', '0.00')
+        self.assertConsumo(self.equipo, '0.00', '200.00')
+
+        with self.assertRaises(CommandError):
+            Presupuesto.objects.filter(pk=self.equipo.pk).update(monto_gastado=0)
+            call_command('reconciliar_presupuestos', '--solo-verificar', stdout=StringIO())
+
+
+class EtiquetasProyectoTests(TestCase):
+
+    def setUp(self):
+        limpiar_etiquetas()
+        self.usuario = crear_usuario()
+        self.proyectos = [crear_proyecto(self.usuario, code=f'OB-{i:03d}') for i in range(5)]
+
+    def crear_ingresos(self, cantidad):
+        hoy = timezone.now().date()
+        Ingreso.objects.bulk_create([
+            Ingreso(
+                proyecto=self.proyectos[i % 5],
+                concepto=f'Ingreso {i}',
+                monto_total=Decimal('100.00'),
+                fecha_esperada=hoy,
+                creado_por=self.usuario,
+            )
+            for i in range(cantidad)
+        ])
+
+    def test_str_sin_consulta_por_fila(self):
+        self.crear_ingresos(20)
+        limpiar_etiquetas()
+        ingresos = list(Ingreso.objects.all())
+        with self.assertNumQueries(5):  # una por proyecto distinto
+            textos = [str(ingreso) for ingreso in ingresos]
+        with self.assertNumQueries(0):
+            self.assertEqual([str(ingreso) for ingreso in ingresos], textos)
+
+    def test_guardar_proyecto_invalida(self):
+        self.crear_ingresos(1)
+        ingreso = Ingreso.objects.get()
+        self.assertTrue(str(ingreso).startswith('OB-000'))
+        proyecto = Project.objects.get(pk=ingreso.proyecto_id)
+        proyecto.code = 'OB-NUEVO'
+        proyecto.save()
+        self.assertTrue(str(ingreso).startswith('OB-NUEVO'))
+
+    def test_changelist_de_100_filas_con_consultas_constantes(self):
+        admin = Auth.objects.create_superuser(
+            nombre='Admin', apellido='Root', username='admin',
+            email='admin@cortesec.test', password='clave-segura-123',
+        )
+        self.client.force_login(admin)
+        url = reverse('admin:finanzas_ingreso_changelist')
+
+        def consultas():
+            limpiar_etiquetas()
+            with CaptureQueriesContext(connection) as capturadas:
+                response = self.client.get(url)
+            self.assertEqual(response.status_code, 200)
+            return len(response.context['cl'].result_list), len(capturadas)
+
+        consultas()  # la primera petición carga el usuario en la caché
+        self.crear_ingresos(10)
+        filas, con_10 = consultas()
+        self.assertEqual(filas, 10)
+
+        self.crear_ingresos(90)
+        filas, con_100 = consultas()
+        self.assertEqual(filas, 100)
+        self.assertEqual(con_100, con_10)
+        self.assertLessEqual(con_100, 10)
+
+
+class PagosConcurrentesTests(TransactionTestCase):
+    """Muchos pagos en paralelo sobre la misma fila no pierden actualizaciones"""
+
+    HILOS = 8
+    PAGOS_POR_HILO = 10
+
+    def test_pagos_paralelos_sobre_un_ingreso(self):
+        usuario = crear_usuario()
+        proyecto = crear_proyecto(usuario)
+        ingreso = crear_ingreso(proyecto, '100000.00')
+        total_pagos = self.HILOS * self.PAGOS_POR_HILO
+
+        def pagar(_):
+            aplicados = 0
+            try:
+                for _ in range(self.PAGOS_POR_HILO):
+                    for intento in range(50):
+                        try:
+                            registrar_recepcion(Ingreso.objects.get(pk=ingreso.pk), '100.00')
+                            aplicados += 1
+                            break
+                        except OperationalError:
+                            # SQLite: bloqueo de escritura ocupado, reintentar
+                            time.sleep(0.01 * (intento + 1))
+            finally:
+                connection.close()
+            return aplicados
+
+        with ThreadPoolExecutor(max_workers=self.HILOS) as executor:
+            aplicados = sum(executor.map(pagar, range(self.HILOS)))
+
+        ingreso.refresh_from_db()
+        self.assertEqual(aplicados, total_pagos)
+        self.assertEqual(ingreso.monto_recibido, Decimal('100.00') * total_pagos)
+        self.assertEqual(ingreso.abonos.count(), total_pagos)
+        self.assertEqual(ingreso.estado, 'parcial')
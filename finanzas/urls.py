@@ -1,12 +1,24 @@
 # finanzas/urls.py
+from django.conf import settings
 from django.urls import path
 from . import views
 
 app_name = 'finanzas'
 
 urlpatterns = [
-    path('ingresos/', views.IngresoListView.as_view(), name='lista_ingresos'),
+    path(
+        'ingresos/',
+        (views.IngresoListAsyncView if settings.VISTAS_ASINCRONAS else views.IngresoListView).as_view(),
+        name='lista_ingresos',
+    ),
+    path('ingresos/asincrono/', views.IngresoListAsyncView.as_view(), name='lista_ingresos_asincrona'),
+    path('ingresos/exportar/', views.IngresoExportView.as_view(), name='exportar_ingresos'),
     path('ingresos/nuevo/', views.IngresoCreateView.as_view(), name='crear_ingreso'),
     path('ingresos/<int:pk>/editar/', views.IngresoUpdateView.as_view(), name='editar_ingreso'),
     path('ingresos/<int:pk>/recibir/', views.IngresoRecepcionView.as_view(), name='registrar_recepcion'),
+    path('egresos/', views.EgresoListView.as_view(), name='lista_egresos'),
+    path('egresos/nuevo/', views.EgresoCreateView.as_view(), name='crear_egreso'),
+    path('egresos/<int:pk>/editar/', views.EgresoUpdateView.as_view(), name='editar_egreso'),
+    path('egresos/<int:pk>/pagar/', views.EgresoPagoView.as_view(), name='registrar_pago_egreso'),
+    path('importar/', views.ImportarMovimientosView.as_view(), name='importar_movimientos'),
 ]
\ No newline at end of file
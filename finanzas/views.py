@@ -1,59 +1,134 @@
 # finanzas/views.py
+from asgiref.sync import sync_to_async
 from django.shortcuts import get_object_or_404, redirect
 from django.contrib import messages
+from django.core.exceptions import ValidationError
 from django.urls import reverse_lazy
 from django.views.generic import CreateView, UpdateView, ListView, FormView
 from django.contrib.auth.mixins import LoginRequiredMixin
+from django.http import StreamingHttpResponse
+from django.utils import timezone
 from django.db.models import Q
-from .models import Ingreso
-from .forms import IngresoForm, IngresoRecepcionForm, IngresoFilterForm
+from .models import Ingreso, Egreso
+from .forms import (
+    IngresoForm, IngresoRecepcionForm, IngresoFilterForm, ImportacionArchivoForm,
+    EgresoForm, EgresoPagoForm, EgresoFilterForm,
+)
+from .exportacion import COLUMNAS_INGRESOS, generar_csv, generar_xlsx
+from .importacion import ImportacionError, importar_movimientos, leer_filas
+from .paginacion import KeysetPaginator, contar_resultados
+from core.asincrono import en_paralelo
+from proyectos.acceso import proyectos_accesibles
 from proyectos.models import Project
 
 
-class IngresoListView(LoginRequiredMixin, ListView):
+class ListadoPorClaveMixin:
+    """
+    Listado con formulario de filtros, paginación por clave y conteo acotado.
+    `ordering` debe terminar en un campo único (ver KeysetPaginator).
+    """
+    paginate_by = None  # se pagina por clave, ver get_context_data
+    por_pagina = 20
+    conteo_exacto_hasta = 10000  # por encima se muestra una estimación
+    filter_form_class = None
+    nombre_total = 'total'
+
+    def get_filter_form(self):
+        if not hasattr(self, 'filter_form'):
+            self.filter_form = self.filter_form_class(data=self.request.GET, user=self.request.user)
+        return self.filter_form
+
+    def paginar(self, queryset):
+        paginator = KeysetPaginator(queryset, self.por_pagina, self.ordering)
+        return paginator.page(
+            despues=self.request.GET.get('despues'),
+            antes=self.request.GET.get('antes'),
+        )
+
+    def contar(self, queryset):
+        return contar_resultados(queryset, self.conteo_exacto_hasta)
+
+    def get_context_data(self, **kwargs):
+        queryset = kwargs.pop('object_list', self.object_list)
+        return self.armar_contexto(self.paginar(queryset), self.contar(queryset), **kwargs)
+
+    def armar_contexto(self, pagina, conteo, **kwargs):
+        total, total_estimado = conteo
+        filtros = self.request.GET.copy()
+        filtros.pop('despues', None)
+        filtros.pop('antes', None)
+
+        context = super().get_context_data(object_list=pagina.object_list, **kwargs)
+        context['filter_form'] = self.get_filter_form()
+        context['pagina'] = pagina
+        context[self.nombre_total] = total
+        context['total_estimado'] = total_estimado
+        context['filtros_querystring'] = filtros.urlencode()
+        return context
+
+
+class IngresoListView(LoginRequiredMixin, ListadoPorClaveMixin, ListView):
     model = Ingreso
     template_name = 'finanzas/lista_ingresos.html'
     context_object_name = 'ingresos'
-    paginate_by = 20  # opcional
+    ordering = ['-fecha_esperada', '-creado_en', 'id']
+    filter_form_class = IngresoFilterForm
+    nombre_total = 'total_ingresos'
+    presupuesto_consultas = 8
 
     def get_queryset(self):
         # Solo ingresos de proyectos donde el usuario es miembro
-        return Ingreso.objects.select_related('proyecto', 'creado_por').filter(
-            proyecto__team_members__user=self.request.user,
-            proyecto__team_members__is_active=True
-        ).distinct()
+        queryset = Ingreso.objects.select_related('proyecto', 'creado_por').filter(
+            proyecto_id__in=proyectos_accesibles(self.request.user)
+        )
+        # Los filtros se aplican antes de contar y paginar
+        return self.get_filter_form().filtrar(queryset)
 
-    def get_context_data(self, **kwargs):
-        context = super().get_context_data(**kwargs)
-        filter_form = IngresoFilterForm(data=self.request.GET, user=self.request.user)
-        context['filter_form'] = filter_form
-
-        # Aplicar filtros al queryset
-        if filter_form.is_valid():
-            qs = context['ingresos']
-            proyecto = filter_form.cleaned_data.get('proyecto')
-            tipo_ingreso = filter_form.cleaned_data.get('tipo_ingreso')
-            estado = filter_form.cleaned_data.get('estado')
-            fecha_desde = filter_form.cleaned_data.get('fecha_desde')
-            fecha_hasta = filter_form.cleaned_data.get('fecha_hasta')
-            solo_vencidos = filter_form.cleaned_data.get('solo_vencidos')
-
-            if proyecto:
-                qs = qs.filter(proyecto=proyecto)
-            if tipo_ingreso:
-                qs = qs.filter(tipo_ingreso=tipo_ingreso)
-            if estado:
-                qs = qs.filter(estado=estado)
-            if fecha_desde:
-                qs = qs.filter(fecha_esperada__gte=fecha_desde)
-            if fecha_hasta:
-                qs = qs.filter(fecha_esperada__lte=fecha_hasta)
-            if solo_vencidos:
-                qs = qs.filter(esta_vencido=True)
-
-            context['ingresos'] = qs
 
-        return context
+class IngresoListAsyncView(IngresoListView):
+    """
+    IngresoListView para el perfil ASGI: la página y el conteo se consultan
+    en paralelo (ver core.asincrono).
+    """
+
+    async def dispatch(self, request, *args, **kwargs):
+        # LoginRequiredMixin.dispatch lee request.user de forma síncrona
+        request.user = await request.auser()
+        if not request.user.is_authenticated:
+            return self.handle_no_permission()
+        return await super(LoginRequiredMixin, self).dispatch(request, *args, **kwargs)
+
+    async def get(self, request, *args, **kwargs):
+        self.object_list = await sync_to_async(self.get_queryset)()
+        queryset = self.object_list
+        pagina, conteo = await en_paralelo(
+            lambda: self.paginar(queryset),
+            lambda: self.contar(queryset),
+        )
+        return self.render_to_response(self.armar_contexto(pagina, conteo))
+
+
+class IngresoExportView(IngresoListView):
+    """
+    Descarga en streaming del listado filtrado (mismos filtros y permisos
+    que IngresoListView). ?formato=csv (por defecto) o ?formato=xlsx
+    """
+    formatos = {
+        'csv': (generar_csv, 'text/csv; charset=utf-8'),
+        'xlsx': (generar_xlsx, 'application/vnd.openxmlformats-officedocument.spreadsheetml.sheet'),
+    }
+
+    def get(self, request, *args, **kwargs):
+        formato = request.GET.get('formato', 'csv')
+        if formato not in self.formatos:
+            formato = 'csv'
+        generar, content_type = self.formatos[formato]
+
+        queryset = self.get_queryset().order_by(*self.ordering)
+        response = StreamingHttpResponse(generar(queryset, COLUMNAS_INGRESOS), content_type=content_type)
+        nombre = f'ingresos_{timezone.localdate():%Y%m%d}.{formato}'
+        response['Content-Disposition'] = f'attachment; filename="{nombre}"'
+        return response
 
 
 class IngresoCreateView(LoginRequiredMixin, CreateView):
@@ -93,9 +168,8 @@ class IngresoUpdateView(LoginRequiredMixin, UpdateView):
     def get_queryset(self):
         # Solo permite editar ingresos de proyectos donde el usuario es miembro
         return Ingreso.objects.filter(
-            proyecto__team_members__user=self.request.user,
-            proyecto__team_members__is_active=True
-        ).distinct()
+            proyecto_id__in=proyectos_accesibles(self.request.user)
+        )
 
     def get_form_kwargs(self):
         kwargs = super().get_form_kwargs()
@@ -121,9 +195,8 @@ class IngresoRecepcionView(LoginRequiredMixin, UpdateView):
 
     def get_queryset(self):
         return Ingreso.objects.filter(
-            proyecto__team_members__user=self.request.user,
-            proyecto__team_members__is_active=True
-        ).distinct()
+            proyecto_id__in=proyectos_accesibles(self.request.user)
+        )
 
     def get_form_kwargs(self):
         kwargs = super().get_form_kwargs()
@@ -141,9 +214,170 @@ class IngresoRecepcionView(LoginRequiredMixin, UpdateView):
         if self.object.estado == 'recibido':
             messages.warning(self.request, 'Este ingreso ya ha sido recibido completamente.')
             return redirect(self.success_url)
+        try:
+            response = super().form_valid(form)
+        except ValidationError as error:
+            # Otro pago concurrente dejó el saldo por debajo del monto ingresado
+            form.add_error('monto_recibido', error)
+            return self.form_invalid(form)
         messages.success(self.request, 'Pago registrado exitosamente.')
+        return response
+
+    def form_invalid(self, form):
+        messages.error(self.request, 'Por favor corrige los errores del formulario.')
+        return super().form_invalid(form)
+
+
+class ImportarMovimientosView(LoginRequiredMixin, FormView):
+    """
+    Carga de ingresos/egresos desde CSV o XLSX. Solo se importan filas de
+    proyectos donde el usuario es miembro.
+    """
+    form_class = ImportacionArchivoForm
+    template_name = 'finanzas/importar_movimientos.html'
+
+    def form_valid(self, form):
+        archivo = form.cleaned_data['archivo']
+        try:
+            resultado = importar_movimientos(
+                leer_filas(archivo.file, archivo.name),
+                form.cleaned_data['tipo'],
+                usuario=self.request.user,
+            )
+        except ImportacionError as error:
+            form.add_error('archivo', str(error))
+            return self.form_invalid(form)
+
+        if resultado.creados:
+            messages.success(self.request, f'{resultado.creados} movimientos importados.')
+        if resultado.total_errores:
+            messages.warning(self.request, f'{resultado.total_errores} filas no se importaron.')
+        return self.render_to_response(self.get_context_data(form=form, resultado=resultado))
+
+
+# === Egresos ===
+
+class EgresoListView(LoginRequiredMixin, ListadoPorClaveMixin, ListView):
+    model = Egreso
+    template_name = 'finanzas/lista_egresos.html'
+    context_object_name = 'egresos'
+    ordering = ['-fecha_vencimiento', '-creado_en', 'id']
+    filter_form_class = EgresoFilterForm
+    nombre_total = 'total_egresos'
+    presupuesto_consultas = 8
+
+    # Solo las columnas que usa la plantilla y el cursor de paginación
+    campos_listado = [
+        'id',
+        'concepto',
+        'proveedor',
+        'tipo_egreso',
+        'monto_total',
+        'monto_pagado',
+        'estado',
+        'fecha_vencimiento',
+        'creado_en',
+        'proyecto__code',
+        'proyecto__name',
+        'presupuesto__categoria',
+    ]
+
+    def get_queryset(self):
+        queryset = (
+            Egreso.objects
+            .select_related('proyecto', 'presupuesto')
+            .only(*self.campos_listado)
+            .filter(proyecto_id__in=proyectos_accesibles(self.request.user))
+        )
+        return self.get_filter_form().filtrar(queryset)
+
+
+class EgresoCreateView(LoginRequiredMixin, CreateView):
+    model = Egreso
+    form_class = EgresoForm
+    template_name = 'finanzas/egreso_form.html'
+    success_url = reverse_lazy('finanzas:lista_egresos')
+
+    def get_form_kwargs(self):
+        kwargs = super().get_form_kwargs()
+        kwargs['user'] = self.request.user
+        return kwargs
+
+    def form_valid(self, form):
+        form.instance.creado_por = self.request.user
+        messages.success(self.request, 'Egreso registrado exitosamente.')
         return super().form_valid(form)
 
+    def get_context_data(self, **kwargs):
+        context = super().get_context_data(**kwargs)
+        context['title'] = 'Registrar Nuevo Egreso'
+        context['submit_text'] = 'Agregar egreso'
+        return context
+
+
+class EgresoUpdateView(LoginRequiredMixin, UpdateView):
+    model = Egreso
+    form_class = EgresoForm
+    template_name = 'finanzas/egreso_form.html'
+    success_url = reverse_lazy('finanzas:lista_egresos')
+
+    def get_queryset(self):
+        return Egreso.objects.filter(
+            proyecto_id__in=proyectos_accesibles(self.request.user)
+        )
+
+    def get_form_kwargs(self):
+        kwargs = super().get_form_kwargs()
+        kwargs['user'] = self.request.user
+        return kwargs
+
+    def form_valid(self, form):
+        messages.success(self.request, 'Egreso actualizado exitosamente.')
+        return super().form_valid(form)
+
+    def get_context_data(self, **kwargs):
+        context = super().get_context_data(**kwargs)
+        context['title'] = 'Editar Egreso'
+        context['submit_text'] = 'Actualizar egreso'
+        return context
+
+
+class EgresoPagoView(LoginRequiredMixin, UpdateView):
+    model = Egreso
+    form_class = EgresoPagoForm
+    template_name = 'finanzas/egreso_form.html'
+    success_url = reverse_lazy('finanzas:lista_egresos')
+
+    def get_queryset(self):
+        return Egreso.objects.select_related('proyecto').filter(
+            proyecto_id__in=proyectos_accesibles(self.request.user)
+        )
+
+    def get_form_kwargs(self):
+        kwargs = super().get_form_kwargs()
+        kwargs['user'] = self.request.user
+        return kwargs
+
+    def get_context_data(self, **kwargs):
+        context = super().get_context_data(**kwargs)
+        context['title'] = f'Registrar Pago - {self.object.concepto}'
+        context['submit_text'] = 'Registrar Pago'
+        context['egreso'] = self.object  # para el resumen lateral
+        return context
+
+    def form_valid(self, form):
+        if self.object.estado == 'pagado':
+            messages.warning(self.request, 'Este egreso ya ha sido pagado completamente.')
+            return redirect(self.success_url)
+        try:
+            response = super().form_valid(form)
+        except ValidationError as error:
+            # Otro pago concurrente dejó el saldo por debajo del monto ingresado
+            form.add_error('monto_pagado', error)
+            return self.form_invalid(form)
+        messages.success(self.request, 'Pago registrado exitosamente.')
+        return response
+
     def form_invalid(self, form):
         messages.error(self.request, 'Por favor corrige los errores del formulario.')
-        return super().form_invalid(form)
\ No newline at end of file
+        return super().form_invalid(form)
@@ -0,0 +1,44 @@
+# proyectos/acceso.py
+"""
+Proyectos accesibles por usuario.
+
+El conjunto de IDs de proyectos donde el usuario es miembro activo se calcula
+una vez, se guarda en el objeto usuario (por request) y en la caché (entre
+requests). Las señales de ProjectTeam lo invalidan.
+"""
+from django.core.cache import cache
+
+from .models import ProjectTeam
+
+CACHE_TIMEOUT = 60 * 15
+ATRIBUTO_REQUEST = '_proyectos_accesibles'
+
+
+def _cache_key(user_id):
+    return f'proyectos:accesibles:{user_id}'
+
+
+def proyectos_accesibles(user):
+    """frozenset con los IDs de proyectos activos del usuario"""
+    if user is None or not user.is_authenticated:
+        return frozenset()
+
+    ids = getattr(user, ATRIBUTO_REQUEST, None)
+    if ids is not None:
+        return ids
+
+    key = _cache_key(user.pk)
+    ids = cache.get(key)
+    if ids is None:
+        ids = frozenset(
+            ProjectTeam.objects.filter(user=user, is_active=True)
+            .values_list('project_id', flat=True)
+        )
+        cache.set(key, ids, CACHE_TIMEOUT)
+
+    setattr(user, ATRIBUTO_REQUEST, ids)
+    return ids
+
+
+def invalidar_proyectos_accesibles(*user_ids):
+    cache.delete_many([_cache_key(user_id) for user_id in user_ids if user_id is not None])
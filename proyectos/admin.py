@@ -1,6 +1,8 @@
 from django.contrib import admin
 from django.utils.html import format_html
 from django.utils.formats import number_format
+
+from core.admin import SelectRelatedAutomaticoMixin
 from .models import Project, ProjectTeam, Document
 
 # Función auxiliar para formatear pesos colombianos
@@ -14,8 +16,25 @@ def format_cop(value):
     except (TypeError, ValueError):
         return "$0"
 
+class ProyectoVencidoFilter(admin.SimpleListFilter):
+    """Filtra por overdue_count (anotado en ProjectAdmin.get_queryset)"""
+    title = 'Movimientos vencidos'
+    parameter_name = 'vencidos'
+
+    def lookups(self, request, model_admin):
+        return [('si', 'Con vencidos'), ('no', 'Al día')]
+
+    def queryset(self, request, queryset):
+        if self.value() == 'si':
+            return queryset.filter(overdue_count__gt=0)
+        if self.value() == 'no':
+            return queryset.filter(overdue_count=0)
+        return queryset
+
+
 @admin.register(Project)
-class ProjectAdmin(admin.ModelAdmin):
+class ProjectAdmin(SelectRelatedAutomaticoMixin, admin.ModelAdmin):
+    presupuesto_consultas = 12  # consultas del changelist, ver core.middleware
     list_display = [
         'code',
         'name',
@@ -25,6 +44,10 @@ class ProjectAdmin(admin.ModelAdmin):
         'status_badge',
         'contract_amount_colored',
         'budget_colored',
+        'total_received_display',
+        'total_paid_display',
+        'budget_consumed_display',
+        'overdue_count_display',
         'progress',
         'progress_bar',
         'days_remaining_display',
@@ -48,8 +71,11 @@ class ProjectAdmin(admin.ModelAdmin):
         'start_date',
         'end_date',
         'created_by',
-        'project_manager'
+        'project_manager',
+        ProyectoVencidoFilter,
     ]
+
+    list_select_related = ['project_manager', 'created_by']
     
     list_editable = ['status', 'progress']
     
@@ -75,6 +101,10 @@ class ProjectAdmin(admin.ModelAdmin):
     ordering = ['-created_at']
     list_per_page = 20
 
+    def get_queryset(self, request):
+        # Acumulados financieros en la misma consulta del changelist
+        return super().get_queryset(request).with_financials()
+
     def status_badge(self, obj):
         colors = {
             'active': 'success',
@@ -104,6 +134,30 @@ class ProjectAdmin(admin.ModelAdmin):
     budget_colored.short_description = 'Presupuesto'
     budget_colored.admin_order_field = 'budget'
 
+    def total_received_display(self, obj):
+        return format_cop(obj.total_received)
+    total_received_display.short_description = 'Recibido'
+    total_received_display.admin_order_field = 'total_received'
+
+    def total_paid_display(self, obj):
+        return format_cop(obj.total_paid)
+    total_paid_display.short_description = 'Pagado'
+    total_paid_display.admin_order_field = 'total_paid'
+
+    def budget_consumed_display(self, obj):
+        """Gastado contra el presupuesto asignado"""
+        color = 'text-danger' if obj.budget_consumed > obj.budget else 'text-success'
+        return format_html('<span class="{}">{}</span>', color, format_cop(obj.budget_consumed))
+    budget_consumed_display.short_description = 'Presupuesto Consumido'
+    budget_consumed_display.admin_order_field = 'budget_consumed'
+
+    def overdue_count_display(self, obj):
+        if obj.overdue_count:
+            return format_html('<span class="badge badge-danger">{}</span>', obj.overdue_count)
+        return '0'
+    overdue_count_display.short_description = 'Vencidos'
+    overdue_count_display.admin_order_field = 'overdue_count'
+
     def progress_bar(self, obj):
         """Barra de progreso visual"""
         try:
@@ -146,7 +200,7 @@ class ProjectAdmin(admin.ModelAdmin):
 
 
 @admin.register(ProjectTeam)
-class ProjectTeamAdmin(admin.ModelAdmin):
+class ProjectTeamAdmin(SelectRelatedAutomaticoMixin, admin.ModelAdmin):
     list_display = [
         'user',
         'project',
@@ -178,7 +232,7 @@ class ProjectTeamAdmin(admin.ModelAdmin):
 
 
 @admin.register(Document)
-class DocumentAdmin(admin.ModelAdmin):
+class DocumentAdmin(SelectRelatedAutomaticoMixin, admin.ModelAdmin):
     list_display = [
         'name',
         'document_type_badge',
@@ -0,0 +1,88 @@
+# proyectos/etiquetas.py
+"""
+Código y nombre de proyectos para mostrar (__str__, admin, logs) sin una
+consulta por fila.
+
+Mapa de identidad en memoria del proceso, LRU y con vigencia acotada:
+
+- Cada Project que se carga desde la base de datos con code y name deja su
+  etiqueta aquí (Project.from_db), así que un listado que ya trae proyectos
+  alimenta a los que vienen después.
+- Guardar o eliminar un proyecto actualiza la entrada (proyectos.signals).
+- Otros procesos no reciben esa señal: por eso las entradas vencen a los
+  VIGENCIA segundos.
+"""
+import threading
+import time
+from collections import OrderedDict, namedtuple
+
+TAMAÑO_MAXIMO = 2048
+VIGENCIA = 300  # segundos
+
+EtiquetaProyecto = namedtuple('EtiquetaProyecto', ['pk', 'code', 'name'])
+
+_etiquetas = OrderedDict()  # pk -> (EtiquetaProyecto, vence)
+_lock = threading.Lock()
+
+
+def recordar_proyecto(pk, code, name):
+    with _lock:
+        _etiquetas[pk] = (EtiquetaProyecto(pk, code, name), time.monotonic() + VIGENCIA)
+        _etiquetas.move_to_end(pk)
+        while len(_etiquetas) > TAMAÑO_MAXIMO:
+            _etiquetas.popitem(last=False)
+
+
+def olvidar_proyecto(pk):
+    with _lock:
+        _etiquetas.pop(pk, None)
+
+
+def limpiar_etiquetas():
+    with _lock:
+        _etiquetas.clear()
+
+
+def _vigente(pk):
+    with _lock:
+        entrada = _etiquetas.get(pk)
+        if entrada is None:
+            return None
+        etiqueta, vence = entrada
+        if vence < time.monotonic():
+            del _etiquetas[pk]
+            return None
+        _etiquetas.move_to_end(pk)
+        return etiqueta
+
+
+def precargar_proyectos(pks):
+    """Carga en una consulta las etiquetas que falten de `pks`"""
+    from .models import Project
+
+    faltantes = {pk for pk in pks if pk is not None and _vigente(pk) is None}
+    if faltantes:
+        # from_db registra cada fila en el mapa
+        list(Project.objects.filter(pk__in=faltantes).only('pk', 'code', 'name'))
+
+
+def etiqueta_proyecto(pk):
+    """Etiqueta del proyecto `pk` (una consulta solo si no está en memoria)"""
+    if pk is None:
+        return None
+    etiqueta = _vigente(pk)
+    if etiqueta is None:
+        precargar_proyectos([pk])
+        etiqueta = _vigente(pk) or EtiquetaProyecto(pk, f'#{pk}', '')
+    return etiqueta
+
+
+def proyecto_de(instancia, campo='proyecto'):
+    """
+    Etiqueta del proyecto relacionado de `instancia`. Si la relación ya está
+    cargada (select_related) se usa tal cual.
+    """
+    proyecto = instancia._state.fields_cache.get(campo)
+    if proyecto is not None:
+        return EtiquetaProyecto(proyecto.pk, proyecto.code, proyecto.name)
+    return etiqueta_proyecto(getattr(instancia, f'{campo}_id'))
@@ -2,10 +2,61 @@
 # Create your models here.
 # proyectos/models.py
 from django.db import models
+from django.db.models import Count, DecimalField, IntegerField, OuterRef, Subquery, Sum, Value
+from django.db.models.functions import Coalesce
 from django.conf import settings
 from django.core.validators import MinValueValidator, MaxValueValidator
 from django.utils import timezone
 
+from .etiquetas import proyecto_de, recordar_proyecto
+
+def _subconsulta_por_proyecto(queryset, agregado, output_field):
+    """Valor agregado de las filas del proyecto externo (0 si no hay filas)"""
+    subconsulta = (
+        queryset
+        .filter(proyecto=OuterRef('pk'))
+        .order_by()
+        .values('proyecto')
+        .annotate(valor=agregado)
+        .values('valor')
+    )
+    return Coalesce(Subquery(subconsulta, output_field=output_field), Value(0), output_field=output_field)
+
+
+class ProjectQuerySet(models.QuerySet):
+
+    def with_financials(self, hoy=None):
+        """
+        Anota los acumulados financieros con subconsultas correlacionadas,
+        en la misma consulta del listado (sin N+1 y ordenables en SQL):
+
+            total_received   recibido de ingresos no cancelados
+            total_paid       pagado de egresos no cancelados
+            budget_consumed  gastado de los presupuestos del proyecto
+            overdue_count    ingresos + egresos abiertos y vencidos
+        """
+        # Import diferido: finanzas.models importa Project
+        from finanzas.models import Egreso, Ingreso, Presupuesto
+
+        dinero = DecimalField(max_digits=15, decimal_places=2)
+        entero = IntegerField()
+        return self.annotate(
+            total_received=_subconsulta_por_proyecto(
+                Ingreso.objects.exclude(estado='cancelado'), Sum('monto_recibido'), dinero
+            ),
+            total_paid=_subconsulta_por_proyecto(
+                Egreso.objects.exclude(estado='cancelado'), Sum('monto_pagado'), dinero
+            ),
+            budget_consumed=_subconsulta_por_proyecto(
+                Presupuesto.objects.all(), Sum('monto_gastado'), dinero
+            ),
+            overdue_count=(
+                _subconsulta_por_proyecto(Ingreso.objects.vencidos(hoy), Count('pk'), entero)
+                + _subconsulta_por_proyecto(Egreso.objects.vencidos(hoy), Count('pk'), entero)
+            ),
+        )
+
+
 class Project(models.Model):
     """
     Proyecto de construcción (Obra)
@@ -98,6 +149,8 @@ class Project(models.Model):
     # Auditoría
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
+
+    objects = ProjectQuerySet.as_manager()
     
     class Meta:
         verbose_name = "Proyecto"
@@ -109,6 +162,14 @@ class Project(models.Model):
             models.Index(fields=['created_by', 'created_at']),
         ]
     
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        # Alimenta el mapa de etiquetas para los __str__ de filas relacionadas
+        if 'code' in instance.__dict__ and 'name' in instance.__dict__:
+            recordar_proyecto(instance.pk, instance.code, instance.name)
+        return instance
+
     def __str__(self):
         return f"{self.code} - {self.name}"
     
@@ -172,8 +233,15 @@ class ProjectTeam(models.Model):
         db_table = 'proyectos_project_team'
         unique_together = ['project', 'user']
     
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        # Para invalidar también al usuario anterior si se reasigna la fila
+        instance._user_id_original = instance.__dict__.get('user_id')
+        return instance
+    
     def __str__(self):
-        return f"{self.user.username} - {self.project.name}"
+        return f"{self.user.username} - {proyecto_de(self, 'project').name}"
 
 
 class Document(models.Model):
@@ -216,4 +284,4 @@ class Document(models.Model):
         ordering = ['-uploaded_at']
     
     def __str__(self):
-        return f"{self.name} - {self.project.code}"
\ No newline at end of file
+        return f"{self.name} - {proyecto_de(self, 'project').code}"
\ No newline at end of file
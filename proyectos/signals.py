@@ -0,0 +1,21 @@
+# proyectos/signals.py
+from django.db.models.signals import post_save, post_delete
+from django.dispatch import receiver
+
+from .acceso import invalidar_proyectos_accesibles
+from .etiquetas import olvidar_proyecto
+from .models import Project, ProjectTeam
+
+
+@receiver(post_save, sender=ProjectTeam)
+@receiver(post_delete, sender=ProjectTeam)
+def equipo_modificado(sender, instance, **kwargs):
+    invalidar_proyectos_accesibles(instance.user_id, getattr(instance, '_user_id_original', None))
+    instance._user_id_original = instance.user_id
+
+
+@receiver(post_save, sender=Project)
+@receiver(post_delete, sender=Project)
+def proyecto_modificado(sender, instance, **kwargs):
+    # Se vuelve a leer en el próximo uso; así un rollback no deja datos falsos
+    olvidar_proyecto(instance.pk)
@@ -18,3 +18,14 @@ def progress_color(value):
         return 'warning'
     else:
         return 'success'
+
+
+@register.simple_tag(takes_context=True)
+def orden_url(context, clave):
+    """
+    Querystring para ordenar el listado por `clave`; si ya está ordenado
+    por esa columna invierte el sentido. Conserva los demás parámetros.
+    """
+    params = context['request'].GET.copy()
+    params['orden'] = f'-{clave}' if context.get('orden') == clave else clave
+    return f'?{params.urlencode()}'
@@ -1,3 +1,136 @@
+# proyectos/tests.py
+from datetime import date, timedelta
+from decimal import Decimal
+
+from django.core.cache import cache
+from django.db import connection
 from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from django.utils import timezone
+
+from auths.models import Auth
+from finanzas.models import Presupuesto
+from finanzas.tests import crear_usuario, crear_proyecto, asignar, crear_ingreso, crear_egreso
+from .acceso import proyectos_accesibles
+from .models import Project, ProjectTeam
+
+
+class ProyectosAccesiblesTests(TestCase):
+
+    def setUp(self):
+        cache.clear()
+        self.usuario = crear_usuario()
+        self.proyecto = crear_proyecto(self.usuario)
+        self.otro = crear_proyecto(self.usuario, code='OB-002')
+        self.miembro = asignar(self.usuario, self.proyecto)
+        asignar(self.usuario, self.otro, is_active=False)
+
+    def test_solo_membresias_activas(self):
+        self.assertEqual(proyectos_accesibles(self.usuario), {self.proyecto.pk})
+
+    def test_cache_por_request_y_entre_requests(self):
+        proyectos_accesibles(self.usuario)
+        otro_request = Auth.objects.get(pk=self.usuario.pk)
+        with self.assertNumQueries(0):
+            proyectos_accesibles(self.usuario)
+            # Otro objeto del mismo usuario (nuevo request) usa la caché compartida
+            proyectos_accesibles(otro_request)
+
+    def test_invalidacion_por_senales(self):
+        proyectos_accesibles(self.usuario)
+        ProjectTeam.objects.filter(project=self.otro).get().delete()
+        asignar(self.usuario, self.otro)
+        self.assertEqual(
+            proyectos_accesibles(Auth.objects.get(pk=self.usuario.pk)),
+            {self.proyecto.pk, self.otro.pk},
+        )
+
+        self.miembro.is_active = False
+        self.miembro.save()
+        self.assertEqual(
+            proyectos_accesibles(Auth.objects.get(pk=self.usuario.pk)),
+            {self.otro.pk},
+        )
+
+    def test_reasignar_usuario_invalida_al_anterior(self):
+        proyectos_accesibles(self.usuario)
+        nuevo = crear_usuario('nuevo')
+        miembro = ProjectTeam.objects.get(pk=self.miembro.pk)
+        miembro.user = nuevo
+        miembro.save()
+        self.assertEqual(proyectos_accesibles(Auth.objects.get(pk=self.usuario.pk)), frozenset())
+
+
+class AcumuladosFinancierosTests(TestCase):
+
+    def setUp(self):
+        cache.clear()
+        self.usuario = crear_usuario()
+        self.proyecto = crear_proyecto(self.usuario)
+        self.vacio = crear_proyecto(self.usuario, code='OB-002')
+        ayer = timezone.now().date() - timedelta(days=1)
+
+        ingreso = crear_ingreso(self.proyecto, '1000.00')
+        ingreso.marcar_como_recibido(monto=Decimal('600.00'))
+        crear_ingreso(self.proyecto, '300.00', fecha_esperada=ayer)
+        crear_ingreso(self.proyecto, '900.00', estado='cancelado', fecha_esperada=ayer)
+        egreso = crear_egreso(self.proyecto, '400.00', fecha_vencimiento=ayer)
+        egreso.monto_pagado = Decimal('150.00')
+        egreso.estado = 'parcial'
+        egreso.save()
+        Presupuesto.objects.create(
+            proyecto=self.proyecto,
+            categoria='materiales',
+            monto_planeado=Decimal('1000.00'),
+            monto_gastado=Decimal('250.00'),
+            periodo_inicio=date(2025, 1, 1),
+            periodo_fin=date(2026, 12, 31),
+        )
+
+    def test_anotaciones(self):
+        proyectos = {p.pk: p for p in Project.objects.with_financials()}
+        proyecto = proyectos[self.proyecto.pk]
+        self.assertEqual(proyecto.total_received, Decimal('600.00'))
+        self.assertEqual(proyecto.total_paid, Decimal('150.00'))
+        self.assertEqual(proyecto.budget_consumed, Decimal('250.00'))
+        self.assertEqual(proyecto.overdue_count, 2)
+
+        vacio = proyectos[self.vacio.pk]
+        self.assertEqual(vacio.total_received, 0)
+        self.assertEqual(vacio.overdue_count, 0)
+
+    def test_listado_en_una_consulta_ordenado_y_filtrado(self):
+        for i in range(10):
+            crear_proyecto(self.usuario, code=f'OB-1{i:02d}')
+        self.client.force_login(self.usuario)
+        url = reverse('proyectos:project_list')
+
+        self.client.get(url)  # sesión y usuario ya en caché de la prueba
+        with CaptureQueriesContext(connection) as consultas:
+            response = self.client.get(url, {'orden': '-recibido'})
+        proyectos_sql = [q for q in consultas.captured_queries if 'proyectos_projects' in q['sql']]
+        self.assertEqual(len(proyectos_sql), 1)
+        self.assertEqual(response.context['object_list'][0].pk, self.proyecto.pk)
+
+        response = self.client.get(url, {'vencidos': '1'})
+        self.assertEqual([p.pk for p in response.context['object_list']], [self.proyecto.pk])
+
+    def test_filas_en_cache_con_acumulados(self):
+        self.client.force_login(self.usuario)
+        url = reverse('proyectos:project_list')
+        self.assertContains(self.client.get(url), '$600')
+        # Cambian los acumulados sin que cambie updated_at del proyecto
+        crear_ingreso(self.proyecto, '50.00').marcar_como_recibido(monto=Decimal('50.00'))
+        self.assertContains(self.client.get(url), '$650')
 
-# Create your tests here.
+    def test_changelist_del_admin(self):
+        admin = Auth.objects.create_superuser(
+            nombre='Admin', apellido='Root', username='admin',
+            email='admin@cortesec.test', password='clave-segura-123',
+        )
+        self.client.force_login(admin)
+        url = reverse('admin:proyectos_project_changelist')
+        response = self.client.get(url, {'o': '-9', 'vencidos': 'si'})
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual([p.pk for p in response.context['cl'].result_list], [self.proyecto.pk])
@@ -2,22 +2,53 @@
 from django.shortcuts import render, redirect, get_object_or_404
 from django.contrib import messages
 from django.contrib.auth.decorators import login_required
+from core.middleware import presupuesto_consultas
 from .models import Project
 from .forms import ProjectForm
 
+# Columnas ordenables del listado: ?orden=<clave> o ?orden=-<clave>
+ORDENES_LISTADO = {
+    'codigo': 'code',
+    'contrato': 'contract_amount',
+    'recibido': 'total_received',
+    'pagado': 'total_paid',
+    'consumido': 'budget_consumed',
+    'vencidos': 'overdue_count',
+}
+
+
 @login_required
+@presupuesto_consultas(5)
 def project_list(request):
     """
     Muestra la lista de proyectos creados por el usuario autenticado.
     Si el usuario es staff o superusuario, ve todos los proyectos.
+    Los acumulados financieros vienen anotados en la misma consulta
+    (Project.objects.with_financials), así que ordenar y filtrar por
+    ellos ocurre en la base de datos.
     """
     if request.user.is_staff or request.user.is_superuser:
-        projects = Project.objects.all().order_by('-created_at')
+        projects = Project.objects.all()
+    else:
+        projects = Project.objects.filter(created_by=request.user)
+    projects = projects.with_financials()
+
+    solo_vencidos = request.GET.get('vencidos') == '1'
+    if solo_vencidos:
+        projects = projects.filter(overdue_count__gt=0)
+
+    orden = request.GET.get('orden', '')
+    campo = ORDENES_LISTADO.get(orden.lstrip('-'))
+    if campo:
+        projects = projects.order_by(f'-{campo}' if orden.startswith('-') else campo, '-created_at')
     else:
-        projects = Project.objects.filter(created_by=request.user).order_by('-created_at')
+        orden = ''
+        projects = projects.order_by('-created_at')
 
     return render(request, 'proyectos/project_list.html', {
         'object_list': projects,
+        'orden': orden,
+        'solo_vencidos': solo_vencidos,
     })
 
 